@@ -1,21 +1,235 @@
 import os
+import time
+from contextlib import asynccontextmanager
+from typing import Callable
 from dotenv import load_dotenv
+from sqlalchemy import event, exc
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from study_room.cache import TTLCache
 
 load_dotenv()
 
 SYNC_DATABASE_URL = os.getenv("DATABASE_URL")
 ASYNC_DATABASE_URL = SYNC_DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
+# 읽기 전용 복제본 (없으면 모든 요청이 primary 로 간다)
+REPLICA_DATABASE_URL = os.getenv("REPLICA_DATABASE_URL") or None
+ASYNC_REPLICA_DATABASE_URL = (
+    REPLICA_DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://") if REPLICA_DATABASE_URL else None
+)
+# 쓰기를 커밋한 사용자의 읽기를 이 시간(초) 동안 primary 로 보낸다 (복제 지연 동안 자기 쓰기가 안 보이는 것 방지)
+READ_YOUR_WRITES_SECONDS = float(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+READ_YOUR_WRITES_MAX_USERS = int(os.getenv("READ_YOUR_WRITES_MAX_USERS", "10000"))
+# 복제 지연이 이 시간(초)을 넘으면 /health/db 에서 lagging 으로 표시
+REPLICA_MAX_LAG_SECONDS = float(os.getenv("REPLICA_MAX_LAG_SECONDS", "5"))
+
+# 커넥션 풀 설정
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+# SQL 로그는 개발 중에만 켠다
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
+# SQLAlchemy 컴파일 캐시 / asyncpg 커넥션별 prepared statement 캐시 크기
+# (pgbouncer transaction 모드 뒤에서는 DB_PREPARED_STATEMENT_CACHE_SIZE=0)
+DB_QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", "500"))
+DB_PREPARED_STATEMENT_CACHE_SIZE = int(os.getenv("DB_PREPARED_STATEMENT_CACHE_SIZE", "256"))
+
+
+class PoolMetrics:
+    """커넥션 풀 체크아웃 대기 시간과 이벤트 횟수"""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.last_wait_seconds = 0.0
+        # 요청별 지표 등에서 체크아웃 시간을 함께 받고 싶을 때 등록
+        self.wait_listeners: list[Callable[[float], None]] = []
+
+    def record_wait(self, seconds: float):
+        self.total_wait_seconds += seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+        self.last_wait_seconds = seconds
+        for listener in self.wait_listeners:
+            listener(seconds)
+
+    def stats(self) -> dict:
+        return {
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "connects": self.connects,
+            "invalidations": self.invalidations,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": round(self.total_wait_seconds / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+            "last_wait_ms": round(self.last_wait_seconds * 1000, 3),
+        }
+
+
+pool_metrics = PoolMetrics()
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """체크아웃(대기 + 새 연결 + pre-ping)에 걸린 시간을 기록하는 풀"""
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            pool_metrics.timeouts += 1
+            raise
+        finally:
+            pool_metrics.record_wait(time.perf_counter() - start)
+
+
+def _create_engine(url: str, poolclass):
+    return create_async_engine(
+        url,
+        echo=DB_ECHO,
+        query_cache_size=DB_QUERY_CACHE_SIZE,
+        connect_args=(
+            {"prepared_statement_cache_size": DB_PREPARED_STATEMENT_CACHE_SIZE}
+            if url.startswith("postgresql+asyncpg")
+            else {}
+        ),
+        poolclass=poolclass,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+    )
+
+
+async_engine = _create_engine(ASYNC_DATABASE_URL, TimedQueuePool)
+# 복제본 풀은 pool_metrics(primary 풀 대기 시간)에 섞이지 않도록 기본 풀을 쓴다
+read_engine = _create_engine(ASYNC_REPLICA_DATABASE_URL, AsyncAdaptedQueuePool) if ASYNC_REPLICA_DATABASE_URL else None
+engines = [async_engine] + ([read_engine] if read_engine is not None else [])
+
+
+@event.listens_for(async_engine.sync_engine, "connect")
+def _on_connect(dbapi_connection, connection_record):
+    pool_metrics.connects += 1
+
+
+@event.listens_for(async_engine.sync_engine, "checkout")
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    pool_metrics.checkouts += 1
+
+
+@event.listens_for(async_engine.sync_engine, "checkin")
+def _on_checkin(dbapi_connection, connection_record):
+    pool_metrics.checkins += 1
+
+
+@event.listens_for(async_engine.sync_engine, "invalidate")
+def _on_invalidate(dbapi_connection, connection_record, exception):
+    pool_metrics.invalidations += 1
+
+
+def _pool_usage(pool) -> dict:
+    return {
+        "size": pool.size(),
+        "in_use": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": DB_MAX_OVERFLOW,
+        "timeout_seconds": DB_POOL_TIMEOUT,
+    }
+
+
+def pool_status() -> dict:
+    """현재 풀 상태 (사용 중 / 유휴 / overflow) 와 누적 지표"""
+    return {**_pool_usage(async_engine.pool), **pool_metrics.stats()}
+
+
+def replica_pool_status() -> dict | None:
+    return _pool_usage(read_engine.pool) if read_engine is not None else None
+
+
+# 사용자 id -> 최근 쓰기 표시 (READ_YOUR_WRITES_SECONDS 뒤 만료)
+recent_writers = TTLCache(READ_YOUR_WRITES_MAX_USERS, ttl=READ_YOUR_WRITES_SECONDS)
+
+
+class PrimarySession(Session):
+    """primary 세션. info["user_id"] 가 있으면 행을 바꾼 트랜잭션의 커밋 시 그 사용자를 recent_writers 에 기록한다"""
+
+
+@event.listens_for(PrimarySession, "after_flush")
+def _on_flush(session, flush_context):
+    # after_flush 시점의 new/dirty/deleted 는 방금 flush 한 객체들이다
+    if session.new or session.dirty or session.deleted:
+        session.info["wrote_rows"] = True
+
+
+@event.listens_for(PrimarySession, "do_orm_execute")
+def _on_execute(orm_execute_state):
+    # flush 를 거치지 않는 insert()/update()/delete() 문.
+    # SELECT 안의 CTE 로 쓰는 문장(insert_if_available)은 여기서 잡히지 않으므로 호출한 쪽이 recent_writers 에 직접 기록한다
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["wrote_rows"] = True
+
+
+@event.listens_for(PrimarySession, "after_commit")
+def _on_commit(session):
+    # 조회만 한 트랜잭션의 커밋은 기록하지 않는다
+    if not session.info.pop("wrote_rows", False):
+        return
+    user_id = session.info.get("user_id")
+    if user_id is not None:
+        recent_writers.set(user_id, True)
+
+
+@event.listens_for(PrimarySession, "after_rollback")
+def _on_rollback(session):
+    session.info.pop("wrote_rows", None)
 
-async_engine = create_async_engine(ASYNC_DATABASE_URL, echo=True)
 
 AsyncSessionLocal = async_sessionmaker(
     bind=async_engine,
     class_=AsyncSession,
+    sync_session_class=PrimarySession,
     expire_on_commit=False,
 )
 
+AsyncReadSessionLocal = (
+    async_sessionmaker(bind=read_engine, class_=AsyncSession, expire_on_commit=False)
+    if read_engine is not None
+    else None
+)
+
+
+def read_session_factory(user_id: int | None) -> async_sessionmaker[AsyncSession]:
+    """복제본이 있고 최근에 쓰기를 하지 않은 사용자(또는 익명)면 복제본, 아니면 primary"""
+    if AsyncReadSessionLocal is None:
+        return AsyncSessionLocal
+    if user_id is not None and recent_writers.get(user_id) is not None:
+        return AsyncSessionLocal
+    return AsyncReadSessionLocal
+
+
+@asynccontextmanager
+async def primary_session(db: AsyncSession):
+    """db 가 복제본 세션이면 primary 세션을 새로 열어 준다.
+
+    인메모리 인덱스를 채우는 읽기처럼 복제 지연이 있으면 안 되는 조회에 쓴다.
+    """
+    if read_engine is None or db.bind is not read_engine:
+        yield db
+        return
+    async with AsyncSessionLocal() as session:
+        yield session
+
 
 async def get_async_db():
     async with AsyncSessionLocal() as session:
-        yield session
\ No newline at end of file
+        yield session
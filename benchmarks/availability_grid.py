@@ -0,0 +1,60 @@
+# benchmarks/availability_grid.py
+"""주간 시간표 조회: 룸 x 날짜별 available-times 호출 vs GET /rooms/availability 한 번.
+
+    uv run python -m benchmarks.availability_grid --reset --rooms 30 --iterations 20
+"""
+
+import argparse
+import asyncio
+import json
+from datetime import date, timedelta
+
+from benchmarks.common import Timer, app_client, reset_schema, seed, summarize
+
+
+async def fan_out(client, room_ids: list[int], dates: list[date], concurrency: int):
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(room_id: int, d: date):
+        async with sem:
+            res = await client.get(f"/rooms/{room_id}/available-times", params={"date": str(d)})
+            res.raise_for_status()
+
+    await asyncio.gather(*(one(r, d) for r in room_ids for d in dates))
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reset", action="store_true", help="테이블을 지우고 다시 시드")
+    parser.add_argument("--rooms", type=int, default=30)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=8, help="fan-out 동시 요청 수 (브라우저 기준)")
+    args = parser.parse_args()
+
+    if args.reset:
+        await reset_schema()
+        await seed(rooms=args.rooms)
+
+    async with app_client() as client:
+        rooms = (await client.get("/rooms")).json()
+        room_ids = [r["room_id"] for r in rooms]
+        dates = [date.today() + timedelta(days=i) for i in range(8)]
+
+        fan_out_timer, grid_timer = Timer(), Timer()
+        for _ in range(args.iterations):
+            async with fan_out_timer.measure():
+                await fan_out(client, room_ids, dates, args.concurrency)
+            async with grid_timer.measure():
+                res = await client.get("/rooms/availability")
+                res.raise_for_status()
+
+    print(json.dumps({
+        "rooms": len(room_ids),
+        "days": len(dates),
+        "fan_out": {"requests_per_iteration": len(room_ids) * len(dates), **summarize(fan_out_timer.samples)},
+        "grid": {"requests_per_iteration": 1, "response_bytes": len(res.content), **summarize(grid_timer.samples)},
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
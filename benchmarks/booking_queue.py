@@ -0,0 +1,107 @@
+# benchmarks/booking_queue.py
+"""예약 오픈 순간처럼 몇 개 룸에 예약이 한꺼번에 몰릴 때 룸별 처리량을 측정.
+
+direct 는 요청마다 SERIALIZABLE 트랜잭션을 여는 기존 경로, queued 는 룸별 대기열(booking_queue)을 거친다.
+queued 는 wait=true 로 보내 두 모드 모두 응답 시점이 곧 처리 완료 시점이다. 모드마다 --reset 으로 새로 시드한다.
+
+    uv run python -m benchmarks.booking_queue --reset --mode direct --rooms 3 --requests 600
+    uv run python -m benchmarks.booking_queue --reset --mode queued --rooms 3 --requests 600
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections import Counter, defaultdict
+from datetime import date, timedelta
+
+from sqlalchemy import select, func
+
+from async_database import AsyncSessionLocal, pool_metrics
+from benchmarks.common import Timer, app_client, reset_schema, seed, summarize
+from study_room.models import Reservation
+from study_room.services.auth_service import auth_service
+from study_room.services.booking_queue import booking_queue
+
+# 시드 룸의 운영 시간(09:00 ~ 22:00) 안의 1시간 슬롯 수
+SLOTS_PER_DAY = 13
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reset", action="store_true", help="테이블을 지우고 다시 시드")
+    parser.add_argument("--mode", choices=["direct", "queued"], default="queued")
+    parser.add_argument("--rooms", type=int, default=3)
+    parser.add_argument("--requests", type=int, default=600)
+    args = parser.parse_args()
+
+    if args.reset:
+        await reset_schema()
+    # 요청마다 다른 유저: 하루 한도가 아니라 룸/슬롯 경쟁만 본다
+    info = await seed(rooms=args.rooms, users=args.requests, reservations_per_room_day=0)
+    target_date = date.today() + timedelta(days=1)
+    # 요청 i 는 룸 i % rooms 의 슬롯 (i // rooms) % 13 을 노린다 (슬롯마다 여러 명이 겹친다)
+    plan = [
+        (auth_service.create_access_token(user_id), info.room_ids[i % args.rooms], 9 + (i // args.rooms) % SLOTS_PER_DAY)
+        for i, user_id in enumerate(info.user_ids)
+    ]
+
+    booking_queue.enabled = args.mode == "queued"
+    timer = Timer()
+    statuses: Counter[int] = Counter()
+    room_requests: Counter[int] = Counter()
+    room_finished: defaultdict[int, float] = defaultdict(float)
+    timeouts_before = pool_metrics.timeouts
+
+    async with app_client(raise_app_exceptions=False) as client:
+        start = time.perf_counter()
+
+        async def book(token: str, room_id: int, hour: int):
+            async with timer.measure():
+                res = await client.post(
+                    "/reservations",
+                    params={"wait": "true"},
+                    json={"room_id": room_id, "reservation_date": str(target_date), "start_time": f"{hour:02d}:00"},
+                    headers={"Authorization": f"Bearer {token}"},
+                )
+            statuses[res.status_code] += 1
+            room_requests[room_id] += 1
+            room_finished[room_id] = max(room_finished[room_id], time.perf_counter() - start)
+
+        await asyncio.gather(*(book(*p) for p in plan))
+        elapsed = time.perf_counter() - start
+        queue_stats = booking_queue.stats()
+
+    async with AsyncSessionLocal() as db:
+        rows = dict((await db.execute(
+            select(Reservation.room_id, func.count()).where(
+                Reservation.reservation_date == target_date, Reservation.status != "취소"
+            ).group_by(Reservation.room_id)
+        )).all())
+
+    rooms = {
+        room_id: {
+            "requests": room_requests[room_id],
+            "rows": rows.get(room_id, 0),
+            # 첫 요청부터 이 룸의 마지막 응답까지 기준
+            "throughput_per_second": round(room_requests[room_id] / room_finished[room_id], 1) if room_finished[room_id] else 0,
+            **({"queue": queue_stats[room_id]} if room_id in queue_stats else {}),
+        }
+        for room_id in info.room_ids
+    }
+    print(json.dumps({
+        "mode": args.mode,
+        "requests": args.requests,
+        "elapsed_seconds": round(elapsed, 3),
+        "status_codes": dict(statuses),
+        # 슬롯마다 정확히 한 건
+        "correct": all(r["rows"] == min(SLOTS_PER_DAY, r["requests"]) for r in rooms.values())
+        and statuses[201] == sum(rows.values()),
+        "pool_timeouts": pool_metrics.timeouts - timeouts_before,
+        "latency": summarize(timer.samples),
+        "rooms": rooms,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
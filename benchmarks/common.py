@@ -0,0 +1,217 @@
+# benchmarks/common.py
+"""벤치마크 공통 유틸: 시드 데이터 생성, ASGI 클라이언트, 지연 시간 통계.
+
+DATABASE_URL 이 가리키는 DB에 데이터를 넣으므로 반드시 벤치마크 전용 DB에서 실행한다.
+"""
+
+import random
+import statistics
+import time
+import uuid
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import date, time as dtime, timedelta
+
+import bcrypt
+import httpx
+from sqlalchemy import insert
+
+from async_database import async_engine, AsyncSessionLocal
+from study_room import models
+from study_room.models import StudyRoom, User, Reservation, Review, Facility
+from study_room.models.study_room import RoomFacilityMap
+from study_room.repositories.study_room_repository import study_room_repository
+from study_room.services.reservation_partitions import reservation_partitions
+
+BENCH_PASSWORD = "benchmark-pw"
+
+
+@dataclass
+class SeedInfo:
+    room_ids: list[int] = field(default_factory=list)
+    user_ids: list[int] = field(default_factory=list)
+    student_ids: list[str] = field(default_factory=list)
+    facility_ids: list[int] = field(default_factory=list)
+    # 리뷰를 아직 쓰지 않은 이용완료 예약 (user_id, reservation_id)
+    reviewable: list[tuple[int, int]] = field(default_factory=list)
+
+
+async def reset_schema():
+    async with async_engine.begin() as conn:
+        await conn.run_sync(models.Base.metadata.drop_all)
+        await conn.run_sync(models.Base.metadata.create_all)
+    async with AsyncSessionLocal() as db:
+        async with db.begin():
+            await reservation_partitions.ensure_partitions(db)
+
+
+def _pick_user(rng: random.Random, user_ids: list[int], taken: set, slot: tuple) -> int:
+    """같은 날짜/시간에 이미 다른 룸을 잡은 유저는 피한다 (유저 구간 겹침 배타 제약)"""
+    for _ in range(20):
+        user_id = rng.choice(user_ids)
+        if (user_id, *slot) not in taken:
+            break
+    else:
+        user_id = next(u for u in user_ids if (u, *slot) not in taken)
+    taken.add((user_id, *slot))
+    return user_id
+
+
+async def seed(
+    rooms: int = 20,
+    users: int = 200,
+    reservations_per_room_day: int = 4,
+    days: int = 8,
+    rng_seed: int = 42,
+    password_rounds: int = 4,
+    facilities: int = 0,
+    facilities_per_room: int = 3,
+    past_reservations_per_room: int = 0,
+    reviews_per_room: int = 0,
+) -> SeedInfo:
+    """룸/유저/시설/예약/리뷰를 한 번에 insert 한다.
+
+    예약은 오늘부터 days 일 동안 룸별로 분산하고, past_reservations_per_room 만큼 어제부터 거슬러
+    이용완료 예약을 만든 뒤 그중 reviews_per_room 건에 리뷰를 단다 (나머지는 SeedInfo.reviewable).
+    같은 시간에 여러 룸을 잡지 않도록 하므로 users 는 rooms 이상이어야 한다.
+    """
+    rng = random.Random(rng_seed)
+    info = SeedInfo()
+    # 모든 유저가 같은 해시를 공유 (시드 속도를 위해 기본은 낮은 cost)
+    hashed = bcrypt.hashpw(BENCH_PASSWORD.encode("utf-8"), bcrypt.gensalt(rounds=password_rounds)).decode("utf-8")
+    today = date.today()
+    # 재시드해도 학번/시설 이름이 겹치지 않도록 실행마다 접두어를 붙인다
+    run = uuid.uuid4().hex[:6]
+
+    async with AsyncSessionLocal() as db:
+        async with db.begin():
+            info.room_ids = list(await db.scalars(
+                insert(StudyRoom).returning(StudyRoom.room_id),
+                [
+                    {
+                        "name": f"bench-room-{i}",
+                        "floor": 4 + i % 2,
+                        "location": f"bench-{i}",
+                        "max_capacity": 2 + i % 7,
+                        "rating": 0.0,
+                        "open_time": dtime(9),
+                        "close_time": dtime(22),
+                    }
+                    for i in range(rooms)
+                ],
+            ))
+            info.student_ids = [f"b{run}{i:07d}" for i in range(users)]
+            info.user_ids = list(await db.scalars(
+                insert(User).returning(User.id),
+                [{"student_id": s, "password": hashed, "name": f"bench-{s}"} for s in info.student_ids],
+            ))
+
+            if facilities:
+                info.facility_ids = list(await db.scalars(
+                    insert(Facility).returning(Facility.facility_id),
+                    [{"name": f"bench-{run}-facility-{i}"} for i in range(facilities)],
+                ))
+                await db.execute(insert(RoomFacilityMap), [
+                    {"room_id": room_id, "facility_id": facility_id}
+                    for room_id in info.room_ids
+                    for facility_id in rng.sample(info.facility_ids, min(facilities_per_room, facilities))
+                ])
+
+            taken: set[tuple[int, date, int]] = set()
+            rows = []
+            for room_id in info.room_ids:
+                for d in range(days):
+                    reservation_date = today + timedelta(days=d)
+                    for hour in rng.sample(range(9, 22), min(reservations_per_room_day, 13)):
+                        rows.append({
+                            "user_id": _pick_user(rng, info.user_ids, taken, (reservation_date, hour)),
+                            "room_id": room_id,
+                            "reservation_date": reservation_date,
+                            "start_time": dtime(hour),
+                            "end_time": dtime(hour + 1),
+                            "status": "예약확정",
+                        })
+            if rows:
+                await db.execute(insert(Reservation), rows)
+
+            if past_reservations_per_room:
+                past_rows = []
+                for room_id in info.room_ids:
+                    for k in range(past_reservations_per_room):
+                        reservation_date, hour = today - timedelta(days=1 + k // 13), 9 + k % 13
+                        past_rows.append({
+                            "user_id": _pick_user(rng, info.user_ids, taken, (reservation_date, hour)),
+                            "room_id": room_id,
+                            "reservation_date": reservation_date,
+                            "start_time": dtime(hour),
+                            "end_time": dtime(hour + 1),
+                            "status": "이용완료",
+                        })
+                past_ids = list(await db.scalars(
+                    insert(Reservation).returning(Reservation.id, sort_by_parameter_order=True), past_rows
+                ))
+                reviews = []
+                for index, (row, reservation_id) in enumerate(zip(past_rows, past_ids)):
+                    if index % past_reservations_per_room < reviews_per_room:
+                        reviews.append({
+                            "reservation_id": reservation_id,
+                            "user_id": row["user_id"],
+                            "room_id": row["room_id"],
+                            "rating": float(rng.randint(1, 5)),
+                            "content": "benchmark review content",
+                        })
+                    else:
+                        info.reviewable.append((row["user_id"], reservation_id))
+                if reviews:
+                    await db.execute(insert(Review), reviews)
+                    await study_room_repository.reconcile_ratings(db)
+    return info
+
+
+@asynccontextmanager
+async def app_client(raise_app_exceptions: bool = True, rate_limit: bool = False):
+    """lifespan 을 실행한 뒤 ASGI 앱에 직접 붙는 httpx 클라이언트.
+
+    raise_app_exceptions=False 면 처리되지 않은 예외도 500 응답으로 받는다 (부하 테스트에서 오류율 집계용).
+    모든 요청이 같은 IP 에서 나가므로 rate_limit=True 가 아니면 rate limit 을 끈다.
+    """
+    from main import app, lifespan
+    from study_room.rate_limit import rate_limiter
+
+    rate_limiter.enabled = rate_limit
+    async with lifespan(app):
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=raise_app_exceptions)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            yield client
+
+
+class Timer:
+    def __init__(self):
+        self.samples: list[float] = []
+
+    @asynccontextmanager
+    async def measure(self):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.samples.append(time.perf_counter() - start)
+
+
+def summarize(samples: list[float]) -> dict:
+    """초 단위 샘플을 ms 단위 통계로 요약"""
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+
+    def pct(p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))] * 1000
+
+    return {
+        "count": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+        "p50_ms": round(pct(50), 3),
+        "p95_ms": round(pct(95), 3),
+        "p99_ms": round(pct(99), 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
@@ -0,0 +1,69 @@
+# benchmarks/concurrent_booking.py
+"""같은 슬롯에 수백 건의 예약을 동시에 보내고 지연 시간과 정합성(정확히 1건 성공)을 확인.
+
+    uv run python -m benchmarks.concurrent_booking --reset --requests 300
+"""
+
+import argparse
+import asyncio
+import json
+from collections import Counter
+from datetime import date, timedelta
+
+from sqlalchemy import select, func
+
+from async_database import AsyncSessionLocal
+from benchmarks.common import Timer, app_client, reset_schema, seed, summarize
+from study_room.models import Reservation
+from study_room.services.auth_service import auth_service
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reset", action="store_true", help="테이블을 지우고 다시 시드")
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--start-time", default="10:00")
+    args = parser.parse_args()
+
+    if args.reset:
+        await reset_schema()
+    info = await seed(rooms=1, users=args.requests, reservations_per_room_day=0)
+    room_id = info.room_ids[0]
+    target_date = date.today() + timedelta(days=1)
+    tokens = [auth_service.create_access_token(user_id) for user_id in info.user_ids]
+
+    timer = Timer()
+    statuses: Counter[int] = Counter()
+
+    async with app_client() as client:
+        async def book(token: str):
+            async with timer.measure():
+                res = await client.post(
+                    "/reservations",
+                    json={"room_id": room_id, "reservation_date": str(target_date), "start_time": args.start_time},
+                    headers={"Authorization": f"Bearer {token}"},
+                )
+            statuses[res.status_code] += 1
+
+        await asyncio.gather(*(book(t) for t in tokens))
+
+    async with AsyncSessionLocal() as db:
+        booked = await db.scalar(
+            select(func.count()).select_from(Reservation).where(
+                Reservation.room_id == room_id,
+                Reservation.reservation_date == target_date,
+                Reservation.status != "취소",
+            )
+        )
+
+    print(json.dumps({
+        "requests": args.requests,
+        "status_codes": dict(statuses),
+        "rows_for_slot": booked,
+        "correct": statuses[201] == 1 and booked == 1,
+        "latency": summarize(timer.samples),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
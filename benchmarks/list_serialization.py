@@ -0,0 +1,160 @@
+# benchmarks/list_serialization.py
+"""목록 응답 직렬화 비교: FastAPI response_model 경로 vs TypeAdapter.dump_json 경로.
+
+    uv run python -m benchmarks.list_serialization --rows 1000 --requests 300
+    uv run python -m benchmarks.list_serialization --live --reset   # 실제 GET /rooms (룸 1000개 시드)
+
+기본 모드는 DB 없이, 세 목록 응답(룸 목록 / 내 예약 / 룸 리뷰)을 rows 건씩 미리 만들어 두고
+실제 라우터와 같은 방식(response_model + render_json)으로 응답하는 앱에 요청을 보내 초당 요청 수를 잰다.
+두 경로의 응답 바이트가 같은지도 함께 확인한다.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import date, datetime, timedelta
+
+import httpx
+from fastapi import FastAPI, Response
+from pydantic import TypeAdapter
+
+from study_room import serialization
+from study_room.schemas.study_room import StudyRoomListResponse
+from study_room.schemas.reservation import ReservationResponse, MyReservationsResponse
+from study_room.schemas.review import ReviewListItem, RoomReviewsResponse
+
+
+def build_payloads(rows: int) -> dict:
+    today = date.today()
+    return {
+        "rooms": [
+            StudyRoomListResponse(
+                room_id=i,
+                name=f"스터디룸 {i}",
+                floor=4 + i % 2,
+                location=f"{4 + i % 2}층 동쪽 {i}호",
+                max_capacity=2 + i % 7,
+                rating=round(1 + (i % 40) / 10, 1),
+                facilities=["화이트보드", "모니터"][: i % 3],
+            )
+            for i in range(rows)
+        ],
+        "reservations": MyReservationsResponse(
+            reservations=[
+                ReservationResponse(
+                    id=i,
+                    room_name=f"스터디룸 {i % 50}",
+                    reservation_date=today - timedelta(days=i // 13),
+                    start_time=f"{9 + i % 13:02d}:00",
+                    end_time=f"{10 + i % 13:02d}:00",
+                    status="이용완료",
+                )
+                for i in range(rows)
+            ],
+            next_cursor="WyIyMDI2LTAxLTAxIiwiMTA6MDA6MDAiLDFd",
+        ),
+        "reviews": RoomReviewsResponse(
+            room_id=1,
+            average_rating=4.3,
+            reviews=[
+                ReviewListItem(
+                    id=i,
+                    student_id="2023****",
+                    rating=round(1 + (i % 40) / 10, 1),
+                    content=f"조용하고 깨끗한 방입니다. 리뷰 {i}",
+                    created_at=datetime(2026, 1, 1) + timedelta(minutes=i),
+                )
+                for i in range(rows)
+            ],
+            next_cursor=None,
+        ),
+    }
+
+
+def build_app(payloads: dict) -> FastAPI:
+    app = FastAPI()
+    adapters = {
+        "rooms": TypeAdapter(list[StudyRoomListResponse]),
+        "reservations": TypeAdapter(MyReservationsResponse),
+        "reviews": TypeAdapter(RoomReviewsResponse),
+    }
+
+    @app.get("/rooms", response_model=list[StudyRoomListResponse])
+    async def rooms(response: Response):
+        return serialization.render_json(adapters["rooms"], payloads["rooms"], response)
+
+    @app.get("/reservations", response_model=MyReservationsResponse)
+    async def reservations(response: Response):
+        return serialization.render_json(adapters["reservations"], payloads["reservations"], response)
+
+    @app.get("/reviews", response_model=RoomReviewsResponse)
+    async def reviews(response: Response):
+        return serialization.render_json(adapters["reviews"], payloads["reviews"], response)
+
+    return app
+
+
+async def requests_per_second(client: httpx.AsyncClient, url: str, requests: int) -> tuple[float, bytes]:
+    body = (await client.get(url)).content  # 워밍업
+    start = time.perf_counter()
+    for _ in range(requests):
+        await client.get(url)
+    return requests / (time.perf_counter() - start), body
+
+
+async def compare(client: httpx.AsyncClient, urls: list[str], requests: int) -> dict:
+    report = {}
+    for url in urls:
+        serialization.FAST_JSON_RESPONSES = False
+        before_rps, before_body = await requests_per_second(client, url, requests)
+        serialization.FAST_JSON_RESPONSES = True
+        after_rps, after_body = await requests_per_second(client, url, requests)
+        report[url] = {
+            "bytes": len(after_body),
+            "identical": before_body == after_body,
+            "response_model_rps": round(before_rps, 1),
+            "type_adapter_rps": round(after_rps, 1),
+            "speedup": round(after_rps / before_rps, 2),
+        }
+    return report
+
+
+async def run_synthetic(rows: int, requests: int) -> dict:
+    app = build_app(build_payloads(rows))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        return await compare(client, ["/rooms", "/reservations", "/reviews"], requests)
+
+
+async def run_live(reset: bool, rows: int, requests: int) -> dict:
+    from benchmarks.common import app_client, reset_schema, seed
+
+    if reset:
+        await reset_schema()
+        await seed(rooms=rows, users=10, reservations_per_room_day=0)
+    async with app_client() as client:
+        return await compare(client, ["/rooms"], requests)
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--live", action="store_true", help="실제 앱의 GET /rooms 로 측정 (DATABASE_URL 필요)")
+    parser.add_argument("--reset", action="store_true", help="--live 에서 테이블을 지우고 룸을 rows 개 시드")
+    args = parser.parse_args()
+
+    original = serialization.FAST_JSON_RESPONSES
+    try:
+        if args.live:
+            report = await run_live(args.reset, args.rows, args.requests)
+        else:
+            report = await run_synthetic(args.rows, args.requests)
+    finally:
+        serialization.FAST_JSON_RESPONSES = original
+    print(json.dumps({"rows": args.rows, "results": report}, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
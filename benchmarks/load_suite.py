@@ -0,0 +1,398 @@
+# benchmarks/load_suite.py
+"""모든 라우터를 실제 사용 패턴에 가깝게 섞어 호출하는 부하 테스트.
+
+    uv run python -m benchmarks.load_suite --reset                        # 전체 시나리오 실행 + 기준값과 비교
+    uv run python -m benchmarks.load_suite --reset --save-baseline        # 현재 결과를 기준값으로 저장
+    uv run python -m benchmarks.load_suite --scenario exam_week_rush --requests 5000 --concurrency 100
+
+시나리오마다 가상 사용자(--concurrency)가 가중치에 따라 작업을 골라 합계 --requests 건을 보낸다.
+가상 사용자별 난수 시드가 고정이라 같은 설정이면 같은 요청 순서가 만들어진다.
+작업별 처리량 / p50·p95·p99 / 요청당 쿼리 수(Server-Timing 헤더)를 출력하고,
+benchmarks/baselines/<시나리오>.json 기준값이 있으면 비교해 회귀가 있을 때 종료 코드 1로 끝난다.
+
+시나리오는 같은 DB에서 순서대로 실행되므로 앞 시나리오가 만든 예약/리뷰가 뒤 시나리오에 남는다.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import re
+import statistics
+import sys
+import time
+import uuid
+from collections import Counter
+from datetime import date, timedelta
+from pathlib import Path
+
+from sqlalchemy import select
+
+from async_database import AsyncSessionLocal
+from benchmarks.common import BENCH_PASSWORD, SeedInfo, app_client, reset_schema, seed, summarize
+from study_room.models import Reservation
+from study_room.services.auth_service import auth_service
+from study_room.services.password_hasher import password_hasher
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+SERVER_TIMING_QUERIES = re.compile(r'desc="(\d+) queries"')
+# 쿼리 수는 응답 상태(201/409 등)에 따라 조금씩 달라지므로 평균이 이만큼 넘게 늘었을 때만 회귀로 본다
+QUERY_SLACK = 0.5
+# 아주 빠른 작업의 지연 시간 흔들림은 무시한다
+LATENCY_SLACK_MS = 1.0
+
+
+class LoadContext:
+    """가상 사용자들이 함께 쓰는 상태 (시드 결과, 토큰, 취소/대기/리뷰 대상 풀, ETag 캐시)"""
+
+    def __init__(self, info: SeedInfo, upcoming: list[tuple[int, int, int, date, str]]):
+        self.info = info
+        self.today = date.today()
+        self.headers = {
+            user_id: {"Authorization": f"Bearer {auth_service.create_access_token(user_id)}"}
+            for user_id in info.user_ids
+        }
+        self.students = info.student_ids
+        # 시험 기간에 몰리는 인기 룸 (전체의 20%)
+        self.hot_rooms = info.room_ids[: max(1, len(info.room_ids) // 5)]
+        # (reservation_id, user_id, room_id, reservation_date, start_time) - 내일 이후의 예약확정 건
+        self.upcoming = upcoming
+        self.cancellable = list(upcoming)
+        self.waitlist: list[tuple[int, int]] = []  # (user_id, entry_id)
+        self.reviewable = list(info.reviewable)
+        self.etags: dict[str, str] = {}
+        self.signups = itertools.count()
+        self.run = uuid.uuid4().hex[:6]
+
+    def user(self, rng: random.Random) -> int:
+        return rng.choice(self.info.user_ids)
+
+    def booking_date(self, rng: random.Random, last_day: int = 7) -> date:
+        # 오늘 예약은 시작 시각이 지났을 수 있으므로 내일부터
+        return self.today + timedelta(days=rng.randint(1, last_day))
+
+
+# --- 작업: 각 함수는 요청을 정확히 한 번 보내고 응답을 반환한다 (대상이 없으면 None) ---
+
+async def list_rooms(ctx: LoadContext, client, rng):
+    return await client.get("/rooms", params=rng.choice([{}, {"floor": 4}, {"capacity": 4}]))
+
+
+async def room_detail(ctx: LoadContext, client, rng):
+    return await client.get(f"/rooms/{rng.choice(ctx.info.room_ids)}")
+
+
+async def _available_times(ctx: LoadContext, client, room_id: int, target_date: date):
+    # 폴링하는 클라이언트처럼 이전 응답의 ETag 를 보낸다 (바뀌지 않았으면 304)
+    url = f"/rooms/{room_id}/available-times?date={target_date}"
+    headers = {"If-None-Match": ctx.etags[url]} if url in ctx.etags else {}
+    res = await client.get(url, headers=headers)
+    if "etag" in res.headers:
+        ctx.etags[url] = res.headers["etag"]
+    return res
+
+
+async def available_times(ctx: LoadContext, client, rng):
+    return await _available_times(ctx, client, rng.choice(ctx.info.room_ids), ctx.booking_date(rng))
+
+
+async def available_times_hot(ctx: LoadContext, client, rng):
+    return await _available_times(ctx, client, rng.choice(ctx.hot_rooms), ctx.booking_date(rng, last_day=2))
+
+
+async def availability_grid(ctx: LoadContext, client, rng):
+    return await client.get("/rooms/availability", params={"floor": rng.choice([4, 5])})
+
+
+async def room_reviews(ctx: LoadContext, client, rng):
+    return await client.get(f"/rooms/{rng.choice(ctx.info.room_ids)}/reviews", params={"limit": 20})
+
+
+async def login(ctx: LoadContext, client, rng):
+    return await client.post("/auth/login", json={"student_id": rng.choice(ctx.students), "password": BENCH_PASSWORD})
+
+
+async def signup(ctx: LoadContext, client, rng):
+    student_id = f"n{ctx.run}{next(ctx.signups):06d}"
+    return await client.post("/auth/signup", json={"student_id": student_id, "password": BENCH_PASSWORD, "name": "load"})
+
+
+async def _book(ctx: LoadContext, client, rng, room_id: int, target_date: date, hour: int):
+    user_id = ctx.user(rng)
+    res = await client.post(
+        "/reservations",
+        json={"room_id": room_id, "reservation_date": str(target_date), "start_time": f"{hour:02d}:00"},
+        headers=ctx.headers[user_id],
+    )
+    if res.status_code == 201:
+        ctx.cancellable.append((res.json()["id"], user_id, room_id, target_date, f"{hour:02d}:00"))
+    return res
+
+
+async def book(ctx: LoadContext, client, rng):
+    return await _book(ctx, client, rng, rng.choice(ctx.info.room_ids), ctx.booking_date(rng), rng.randint(9, 21))
+
+
+async def book_hot(ctx: LoadContext, client, rng):
+    # 시험 기간: 인기 룸의 내일/모레 오후 시간대로 몰린다
+    return await _book(ctx, client, rng, rng.choice(ctx.hot_rooms), ctx.booking_date(rng, last_day=2), rng.randint(13, 18))
+
+
+async def book_batch(ctx: LoadContext, client, rng):
+    start = ctx.today + timedelta(days=1)
+    return await client.post(
+        "/reservations/batch",
+        json={
+            "atomic": False,
+            "recurrence": {
+                "room_id": rng.choice(ctx.info.room_ids),
+                "start_time": f"{rng.randint(9, 21):02d}:00",
+                "start_date": str(start),
+                "end_date": str(start + timedelta(days=6)),
+                "weekdays": rng.sample(range(7), 2),
+            },
+        },
+        headers=ctx.headers[ctx.user(rng)],
+    )
+
+
+async def my_reservations(ctx: LoadContext, client, rng):
+    return await client.get("/reservations/my", params={"limit": 20}, headers=ctx.headers[ctx.user(rng)])
+
+
+async def cancel(ctx: LoadContext, client, rng):
+    if not ctx.cancellable:
+        return None
+    reservation_id, user_id, *_ = ctx.cancellable.pop(rng.randrange(len(ctx.cancellable)))
+    return await client.delete(f"/reservations/{reservation_id}", headers=ctx.headers[user_id])
+
+
+async def join_waitlist(ctx: LoadContext, client, rng):
+    if not ctx.upcoming:
+        return None
+    _, _, room_id, reservation_date, start_time = rng.choice(ctx.upcoming)
+    user_id = ctx.user(rng)
+    res = await client.post(
+        "/waitlist",
+        json={"room_id": room_id, "reservation_date": str(reservation_date), "start_time": start_time},
+        headers=ctx.headers[user_id],
+    )
+    if res.status_code == 201:
+        ctx.waitlist.append((user_id, res.json()["id"]))
+    return res
+
+
+async def poll_waitlist(ctx: LoadContext, client, rng):
+    if not ctx.waitlist:
+        return None
+    user_id, entry_id = rng.choice(ctx.waitlist)
+    return await client.get(f"/waitlist/{entry_id}", headers=ctx.headers[user_id])
+
+
+async def write_review(ctx: LoadContext, client, rng):
+    if not ctx.reviewable:
+        return None
+    user_id, reservation_id = ctx.reviewable.pop()
+    return await client.post(
+        "/reviews",
+        json={"reservation_id": reservation_id, "rating": float(rng.randint(1, 5)), "content": "load test review"},
+        headers=ctx.headers[user_id],
+    )
+
+
+# 시나리오 이름 -> [(작업, 가중치)]
+SCENARIOS = {
+    # 평소: 룸 둘러보기 위주의 읽기
+    "browse": [
+        (list_rooms, 25), (room_detail, 15), (available_times, 30), (room_reviews, 15),
+        (availability_grid, 5), (my_reservations, 8), (login, 2),
+    ],
+    # 시험 기간: 인기 룸 예약 시도와 예약 가능 시간 새로고침이 몰리고, 실패하면 대기 신청
+    "exam_week_rush": [
+        (book_hot, 35), (available_times_hot, 30), (join_waitlist, 10), (my_reservations, 10),
+        (list_rooms, 10), (book_batch, 5),
+    ],
+    # 취소 대기: 대기자와 빈자리를 노리는 사용자가 폴링하는 가운데 일부가 취소한다
+    "cancellation_polling_storm": [
+        (available_times_hot, 40), (poll_waitlist, 25), (my_reservations, 15), (join_waitlist, 8),
+        (cancel, 7), (book_hot, 5),
+    ],
+    # 학기 초/말: 가입과 로그인, 이용 후 리뷰 작성
+    "reviews_and_accounts": [
+        (login, 20), (signup, 5), (write_review, 25), (room_reviews, 30), (room_detail, 20),
+    ],
+}
+
+
+class OperationStats:
+    __slots__ = ("samples", "statuses", "queries", "skipped")
+
+    def __init__(self):
+        self.samples: list[float] = []
+        self.statuses: Counter[int] = Counter()
+        self.queries: list[int] = []
+        self.skipped = 0
+
+    def record(self, seconds: float, res):
+        self.samples.append(seconds)
+        self.statuses[res.status_code] += 1
+        match = SERVER_TIMING_QUERIES.search(res.headers.get("server-timing", ""))
+        if match:
+            self.queries.append(int(match.group(1)))
+
+    def merge(self, other: "OperationStats"):
+        self.samples += other.samples
+        self.statuses.update(other.statuses)
+        self.queries += other.queries
+        self.skipped += other.skipped
+
+    def summary(self, elapsed: float) -> dict:
+        return {
+            **summarize(self.samples),
+            "throughput_rps": round(len(self.samples) / elapsed, 1) if elapsed else 0.0,
+            "status_codes": {str(code): count for code, count in sorted(self.statuses.items())},
+            "server_errors": sum(count for code, count in self.statuses.items() if code >= 500),
+            "queries_per_request": round(statistics.fmean(self.queries), 2) if self.queries else None,
+            "max_queries": max(self.queries) if self.queries else None,
+            "skipped": self.skipped,
+        }
+
+
+async def run_scenario(ctx: LoadContext, client, name: str, requests: int, concurrency: int, rng_seed: int) -> dict:
+    operations = SCENARIOS[name]
+    calls = [op for op, _ in operations]
+    weights = [weight for _, weight in operations]
+    stats = {op.__name__: OperationStats() for op in calls}
+    remaining = requests
+
+    async def virtual_user(index: int):
+        nonlocal remaining
+        rng = random.Random(f"{rng_seed}-{name}-{index}")
+        while remaining > 0:
+            remaining -= 1
+            op = rng.choices(calls, weights)[0]
+            start = time.perf_counter()
+            res = await op(ctx, client, rng)
+            if res is None:
+                stats[op.__name__].skipped += 1
+            else:
+                stats[op.__name__].record(time.perf_counter() - start, res)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(virtual_user(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    total = OperationStats()
+    for op_stats in stats.values():
+        total.merge(op_stats)
+    return {
+        "scenario": name,
+        "elapsed_s": round(elapsed, 3),
+        "total": total.summary(elapsed),
+        "operations": {op: op_stats.summary(elapsed) for op, op_stats in stats.items() if op_stats.samples},
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    """기준값 대비 회귀 목록 (처리량 감소 / p95 증가 / 요청당 쿼리 수 증가 / 5xx 발생)"""
+    problems = []
+    now, before = report["total"], baseline["total"]
+    if now["throughput_rps"] < before["throughput_rps"] * (1 - tolerance):
+        problems.append(f"전체 처리량 {before['throughput_rps']} -> {now['throughput_rps']} rps")
+    for op, stats in report["operations"].items():
+        base = baseline["operations"].get(op)
+        if base is None:
+            continue
+        if stats["p95_ms"] > base["p95_ms"] * (1 + tolerance) and stats["p95_ms"] - base["p95_ms"] > LATENCY_SLACK_MS:
+            problems.append(f"{op}: p95 {base['p95_ms']} -> {stats['p95_ms']} ms")
+        if (
+            stats["queries_per_request"] is not None
+            and base["queries_per_request"] is not None
+            and stats["queries_per_request"] > base["queries_per_request"] + QUERY_SLACK
+        ):
+            problems.append(f"{op}: 요청당 쿼리 {base['queries_per_request']} -> {stats['queries_per_request']}")
+        if stats["server_errors"] > base["server_errors"]:
+            problems.append(f"{op}: 5xx {base['server_errors']} -> {stats['server_errors']}")
+    return problems
+
+
+async def find_upcoming(today: date) -> list[tuple[int, int, int, date, str]]:
+    async with AsyncSessionLocal() as db:
+        rows = await db.execute(
+            select(
+                Reservation.id, Reservation.user_id, Reservation.room_id,
+                Reservation.reservation_date, Reservation.start_time,
+            )
+            .where(Reservation.reservation_date > today, Reservation.status == "예약확정")
+            .order_by(Reservation.id)
+        )
+        return [(r.id, r.user_id, r.room_id, r.reservation_date, r.start_time.strftime("%H:%M")) for r in rows]
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reset", action="store_true", help="테이블을 지우고 다시 시드")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="여러 번 지정 가능 (기본: 전체)")
+    parser.add_argument("--requests", type=int, default=2000, help="시나리오별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시에 요청하는 가상 사용자 수")
+    parser.add_argument("--rooms", type=int, default=50)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--facilities", type=int, default=12)
+    parser.add_argument("--reservations-per-room-day", type=int, default=6)
+    parser.add_argument("--past-reservations-per-room", type=int, default=40)
+    parser.add_argument("--reviews-per-room", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--baseline-dir", type=Path, default=BASELINE_DIR)
+    parser.add_argument("--save-baseline", action="store_true", help="비교하지 않고 결과를 기준값으로 저장")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="처리량/p95 허용 변화율")
+    parser.add_argument("--rate-limit", action="store_true", help="rate limit 을 켠 채로 실행 (모든 요청이 한 IP 에서 나간다)")
+    args = parser.parse_args()
+
+    volumes = {
+        "rooms": args.rooms,
+        "users": args.users,
+        "facilities": args.facilities,
+        "reservations_per_room_day": args.reservations_per_room_day,
+        "past_reservations_per_room": args.past_reservations_per_room,
+        "reviews_per_room": args.reviews_per_room,
+    }
+    if args.reset:
+        await reset_schema()
+    # 설정된 cost 로 해싱해 두어야 로그인마다 rehash 가 일어나지 않는다
+    info = await seed(rng_seed=args.seed, password_rounds=password_hasher.rounds, **volumes)
+    ctx = LoadContext(info, await find_upcoming(date.today()))
+    config = {
+        "requests": args.requests, "concurrency": args.concurrency, "seed": args.seed, "reset": args.reset,
+        "rate_limit": args.rate_limit, **volumes,
+    }
+
+    reports, regressions = [], {}
+    async with app_client(raise_app_exceptions=False, rate_limit=args.rate_limit) as client:
+        for name in args.scenario or list(SCENARIOS):
+            report = await run_scenario(ctx, client, name, args.requests, args.concurrency, args.seed)
+            report["config"] = config
+            reports.append(report)
+
+            path = args.baseline_dir / f"{name}.json"
+            if args.save_baseline:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+            elif path.exists():
+                baseline = json.loads(path.read_text(encoding="utf-8"))
+                if baseline.get("config") != config:
+                    report["baseline"] = "설정이 달라 비교하지 않음"
+                else:
+                    problems = compare(report, baseline, args.tolerance)
+                    report["baseline"] = problems or "회귀 없음"
+                    if problems:
+                        regressions[name] = problems
+
+    print(json.dumps(reports, indent=2, ensure_ascii=False))
+    if regressions:
+        print(json.dumps({"regressions": regressions}, indent=2, ensure_ascii=False), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
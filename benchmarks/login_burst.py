@@ -0,0 +1,69 @@
+# benchmarks/login_burst.py
+"""로그인 폭주 중 GET /rooms 지연 시간이 얼마나 늘어나는지 측정.
+
+    uv run python -m benchmarks.login_burst --reset --logins 200
+    BCRYPT_EXECUTOR=inline uv run python -m benchmarks.login_burst   # 이벤트 루프에서 직접 해싱 (비교용)
+"""
+
+import argparse
+import asyncio
+import json
+
+from benchmarks.common import BENCH_PASSWORD, Timer, app_client, reset_schema, seed, summarize
+from study_room.services.password_hasher import password_hasher
+
+
+async def poll_rooms(client, timer: Timer, stop: asyncio.Event, interval: float):
+    while not stop.is_set():
+        async with timer.measure():
+            (await client.get("/rooms")).raise_for_status()
+        await asyncio.sleep(interval)
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reset", action="store_true", help="테이블을 지우고 다시 시드")
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--baseline-seconds", type=float, default=3.0)
+    parser.add_argument("--poll-interval", type=float, default=0.02)
+    args = parser.parse_args()
+
+    if args.reset:
+        await reset_schema()
+    # 설정된 cost 로 해싱해 두어야 로그인마다 rehash 가 일어나지 않는다
+    info = await seed(rooms=10, users=args.logins, reservations_per_room_day=0, password_rounds=password_hasher.rounds)
+
+    async with app_client() as client:
+        # 1) 로그인 없이 /rooms 만 폴링
+        baseline = Timer()
+        stop = asyncio.Event()
+        poller = asyncio.create_task(poll_rooms(client, baseline, stop, args.poll_interval))
+        await asyncio.sleep(args.baseline_seconds)
+        stop.set()
+        await poller
+
+        # 2) 로그인 폭주 중 /rooms 폴링
+        during = Timer()
+        logins = Timer()
+        stop = asyncio.Event()
+        poller = asyncio.create_task(poll_rooms(client, during, stop, args.poll_interval))
+
+        async def login(student_id: str):
+            async with logins.measure():
+                res = await client.post("/auth/login", json={"student_id": student_id, "password": BENCH_PASSWORD})
+                res.raise_for_status()
+
+        await asyncio.gather(*(login(s) for s in info.student_ids))
+        stop.set()
+        await poller
+
+    print(json.dumps({
+        "hasher": password_hasher.stats(),
+        "rooms_baseline": summarize(baseline.samples),
+        "rooms_during_login_burst": summarize(during.samples),
+        "login": summarize(logins.samples),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,170 @@
+# benchmarks/read_projections.py
+"""목록 조회의 엔티티 로딩 vs 컬럼 조회(projection) 비교.
+
+    uv run python -m benchmarks.read_projections --rows 20000 --iterations 20
+
+유저 한 명의 예약 rows 건, 룸 하나의 리뷰 rows 건을 넣고 전체 목록을 두 방식으로 읽는다.
+  - entity: Reservation + joinedload(room) / Review + joinedload(user) 엔티티 (예전 find_by_*, 비교용으로 이 파일에만 남김)
+  - rows: 응답에 필요한 컬럼만 select 한 Row (find_rows_by_*, 서비스가 사용)
+지연 시간과 함께 tracemalloc 으로 조회 한 번의 최대 할당량을 잰다.
+실행할 때마다 테이블을 지우고 다시 시드한다.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+from datetime import date, datetime, time as dtime, timedelta
+
+from sqlalchemy import select, insert, and_, bindparam, Date, Integer
+from sqlalchemy.orm import joinedload
+
+from async_database import AsyncSessionLocal
+from benchmarks.common import reset_schema, seed, summarize
+from study_room.models import Reservation, Review
+from study_room.models.reservation import ACTIVE_RESERVATION
+from study_room.repositories.reservation_repository import reservation_repository
+from study_room.repositories.study_room_repository import study_room_repository
+from study_room.repositories.review_repository import review_repository
+
+# 변경 전 예약 가능 시간 조회문 (엔티티 전체를 읽었다)
+_ENTITY_RESERVED_SLOTS = select(Reservation).where(and_(
+    Reservation.room_id == bindparam("room_id", type_=Integer),
+    Reservation.reservation_date == bindparam("reservation_date", type_=Date),
+    ACTIVE_RESERVATION,
+))
+
+
+# 변경 전 find_by_user_id / find_by_room_id 의 조회문
+_ENTITY_USER_RESERVATIONS = (
+    select(Reservation)
+    .options(joinedload(Reservation.room))
+    .where(Reservation.user_id == bindparam("user_id", type_=Integer))
+    .order_by(Reservation.reservation_date.desc(), Reservation.start_time.desc(), Reservation.id.desc())
+)
+_ENTITY_ROOM_REVIEWS = (
+    select(Review)
+    .options(joinedload(Review.user))
+    .where(Review.room_id == bindparam("room_id", type_=Integer))
+    .order_by(Review.created_at.desc(), Review.id.desc())
+)
+
+
+async def seed_history(rows: int) -> dict:
+    """유저 1명이 룸 1개를 rows 번 이용하고 전부 리뷰를 남긴 데이터"""
+    info = await seed(rooms=1, users=1, reservations_per_room_day=0)
+    user_id, room_id = info.user_ids[0], info.room_ids[0]
+    start = date.today() - timedelta(days=rows // 13 + 1)
+    async with AsyncSessionLocal() as db:
+        async with db.begin():
+            reservation_ids = list(await db.scalars(
+                insert(Reservation).returning(Reservation.id),
+                [
+                    {
+                        "user_id": user_id,
+                        "room_id": room_id,
+                        "reservation_date": start + timedelta(days=i // 13),
+                        "start_time": dtime(9 + i % 13),
+                        "end_time": dtime(10 + i % 13),
+                        "status": "이용완료",
+                    }
+                    for i in range(rows)
+                ],
+            ))
+            await db.execute(
+                insert(Review),
+                [
+                    {
+                        "reservation_id": reservation_id,
+                        "user_id": user_id,
+                        "room_id": room_id,
+                        "rating": 1 + i % 5,
+                        "content": f"벤치마크 리뷰 {i} - 조용하고 깨끗했습니다.",
+                        "created_at": datetime(2026, 1, 1) + timedelta(minutes=i),
+                    }
+                    for i, reservation_id in enumerate(reservation_ids)
+                ],
+            )
+    return {"user_id": user_id, "room_id": room_id, "busy_date": start}
+
+
+def query_cases(t: dict) -> dict:
+    """이름 -> (entity 호출, rows 호출)"""
+
+    async def entity_reserved_slots(db):
+        result = await db.scalars(
+            _ENTITY_RESERVED_SLOTS, {"room_id": t["room_id"], "reservation_date": t["busy_date"]}
+        )
+        return [(r.start_time, r.end_time) for r in result.all()]
+
+    async def entity_reservations_of_user(db):
+        return (await db.scalars(_ENTITY_USER_RESERVATIONS, {"user_id": t["user_id"]})).all()
+
+    async def entity_reviews_of_room(db):
+        return (await db.scalars(_ENTITY_ROOM_REVIEWS, {"room_id": t["room_id"]})).all()
+
+    return {
+        "reservations_of_user": (
+            entity_reservations_of_user,
+            lambda db: reservation_repository.find_rows_by_user_id(db, t["user_id"]),
+        ),
+        "reviews_of_room": (
+            entity_reviews_of_room,
+            lambda db: review_repository.find_rows_by_room_id(db, t["room_id"]),
+        ),
+        "reserved_slots": (
+            entity_reserved_slots,
+            lambda db: study_room_repository.get_reserved_slots(db, t["busy_date"], t["busy_date"], room_id=t["room_id"]),
+        ),
+    }
+
+
+async def measure(call, iterations: int) -> tuple[list[float], int, int]:
+    """(지연 시간 샘플, 결과 행 수, 한 번 조회할 때의 최대 할당 바이트)"""
+    samples = []
+    async with AsyncSessionLocal() as db:
+        count = len(await call(db))  # 워밍업
+        db.expunge_all()
+        for _ in range(iterations):
+            start = time.perf_counter()
+            await call(db)
+            samples.append(time.perf_counter() - start)
+            # identity map 에 엔티티가 쌓이지 않도록 매번 비운다 (서비스는 요청마다 새 세션)
+            db.expunge_all()
+
+        tracemalloc.start()
+        await call(db)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        await db.rollback()
+    return samples, count, peak
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    await reset_schema()
+    targets = await seed_history(args.rows)
+
+    report = {"rows": args.rows, "methods": {}}
+    for name, (entity, rows) in query_cases(targets).items():
+        entity_samples, entity_count, entity_peak = await measure(entity, args.iterations)
+        rows_samples, rows_count, rows_peak = await measure(rows, args.iterations)
+        entity_stats, rows_stats = summarize(entity_samples), summarize(rows_samples)
+        report["methods"][name] = {
+            "result_rows": rows_count,
+            "same_count": entity_count == rows_count,
+            "entity": {**entity_stats, "peak_kib": round(entity_peak / 1024)},
+            "rows": {**rows_stats, "peak_kib": round(rows_peak / 1024)},
+            "speedup": round(entity_stats["mean_ms"] / rows_stats["mean_ms"], 2),
+        }
+
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,187 @@
+# benchmarks/repository_queries.py
+"""ReservationRepository 메서드별 호출 오버헤드 마이크로 벤치마크.
+
+    uv run python -m benchmarks.repository_queries --reset --iterations 2000
+
+같은 쿼리를 두 방식으로 번갈아 실행해 비교한다.
+  - inline: 예전처럼 호출마다 select() 를 새로 조립해 실행
+  - prebuilt: 모듈 로드 시 만들어 둔 문장에 bindparam 값만 넘겨 실행 (현재 Repository)
+작은 시드 데이터를 쓰므로 측정값은 대부분 Python 쪽 조립/캐시 조회 비용과 드라이버 왕복 시간이다.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import date, datetime
+
+from sqlalchemy import select, update, and_, or_, literal_column
+from sqlalchemy.orm import joinedload
+
+from async_database import AsyncSessionLocal, DB_PREPARED_STATEMENT_CACHE_SIZE, DB_QUERY_CACHE_SIZE
+from benchmarks.common import reset_schema, seed, summarize
+from study_room.models.reservation import Reservation, ACTIVE_RESERVATION
+from study_room.repositories import reservation_repository as repo_module
+from study_room.repositories.reservation_repository import reservation_repository
+
+
+async def pick_targets() -> dict:
+    async with AsyncSessionLocal() as db:
+        row = await db.scalar(
+            select(Reservation).where(Reservation.reservation_date >= date.today()).order_by(Reservation.id).limit(1)
+        )
+    return {
+        "id": row.id,
+        "user_id": row.user_id,
+        "room_id": row.room_id,
+        "date": row.reservation_date,
+        "start": row.start_time,
+        "end": row.end_time,
+    }
+
+
+def query_cases(t: dict) -> dict:
+    """메서드 이름 -> (inline 호출, prebuilt 호출)"""
+    p = {"user_id": t["user_id"], "room_id": t["room_id"], "reservation_date": t["date"], "start_time": t["start"]}
+
+    async def inline_find_by_id(db):
+        return await db.scalar(
+            select(Reservation).options(joinedload(Reservation.room)).where(Reservation.id == t["id"])
+        )
+
+    async def inline_find_conflict(db):
+        return await db.scalar(select(Reservation).where(and_(
+            Reservation.room_id == t["room_id"],
+            Reservation.reservation_date == t["date"],
+            Reservation.start_time < t["end"],
+            Reservation.end_time > t["start"],
+            ACTIVE_RESERVATION,
+        )).limit(1))
+
+    async def inline_sum_booked_minutes(db):
+        return await db.scalar(select(repo_module._BOOKED_MINUTES).where(
+            Reservation.user_id == t["user_id"],
+            Reservation.reservation_date == t["date"],
+        ))
+
+    async def inline_find_user_conflict(db):
+        return await db.scalar(select(Reservation).where(and_(
+            Reservation.user_id == t["user_id"],
+            Reservation.reservation_date == t["date"],
+            Reservation.start_time < t["end"],
+            Reservation.end_time > t["start"],
+            ACTIVE_RESERVATION,
+        )).limit(1))
+
+    async def inline_find_rows_by_user_id(db):
+        stmt = repo_module._build_user_reservation_rows(keyset=False, limited=True)
+        return (await db.execute(stmt, {"user_id": t["user_id"], "limit": 50})).all()
+
+    async def inline_insert_if_available(db):
+        # 호출마다 CTE 전체를 다시 조립 (예약은 이미 차 있으므로 INSERT 는 일어나지 않는다)
+        stmt = repo_module._build_insert_if_available()
+        return (await db.execute(
+            stmt, {**p, "end_time": t["end"], "duration_minutes": 60, "daily_limit_minutes": 120}
+        )).one()
+
+    async def inline_expire_finished(db):
+        now = datetime(2000, 1, 1)  # 아무 행도 바꾸지 않는 시각
+        stmt = (
+            update(Reservation)
+            .where(
+                Reservation.status == literal_column("'예약확정'"),
+                or_(
+                    Reservation.reservation_date < now.date(),
+                    and_(Reservation.reservation_date == now.date(), Reservation.end_time <= now.time()),
+                ),
+            )
+            .values(status="이용완료")
+            .execution_options(synchronize_session=False)
+        )
+        return (await db.execute(stmt)).rowcount
+
+    return {
+        "find_by_id": (
+            inline_find_by_id,
+            lambda db: reservation_repository.find_by_id(db, t["id"]),
+        ),
+        "find_conflict": (
+            inline_find_conflict,
+            lambda db: reservation_repository.find_conflict(db, t["room_id"], t["date"], t["start"], t["end"]),
+        ),
+        "sum_booked_minutes": (
+            inline_sum_booked_minutes,
+            lambda db: reservation_repository.sum_booked_minutes(db, t["user_id"], t["date"]),
+        ),
+        "find_user_conflict": (
+            inline_find_user_conflict,
+            lambda db: reservation_repository.find_user_conflict(db, t["user_id"], t["date"], t["start"], t["end"]),
+        ),
+        "find_rows_by_user_id": (
+            inline_find_rows_by_user_id,
+            lambda db: reservation_repository.find_rows_by_user_id(db, t["user_id"], limit=50),
+        ),
+        "insert_if_available": (
+            inline_insert_if_available,
+            lambda db: reservation_repository.insert_if_available(
+                db, t["user_id"], t["room_id"], t["date"], t["start"], t["end"], 120
+            ),
+        ),
+        "expire_finished": (
+            inline_expire_finished,
+            lambda db: reservation_repository.expire_finished(db, datetime(2000, 1, 1)),
+        ),
+    }
+
+
+async def measure(call, iterations: int, warmup: int) -> list[float]:
+    samples = []
+    async with AsyncSessionLocal() as db:
+        for i in range(warmup + iterations):
+            start = time.perf_counter()
+            await call(db)
+            if i >= warmup:
+                samples.append(time.perf_counter() - start)
+            # 한 트랜잭션이 길어지지 않도록 주기적으로 되돌린다 (쓰기 쿼리도 DB에 남기지 않는다)
+            if i % 100 == 99:
+                await db.rollback()
+        await db.rollback()
+    return samples
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reset", action="store_true", help="테이블을 지우고 다시 시드")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=3, help="inline / prebuilt 를 번갈아 측정할 횟수")
+    args = parser.parse_args()
+
+    if args.reset:
+        await reset_schema()
+        await seed()
+
+    targets = await pick_targets()
+    report = {
+        "query_cache_size": DB_QUERY_CACHE_SIZE,
+        "prepared_statement_cache_size": DB_PREPARED_STATEMENT_CACHE_SIZE,
+        "methods": {},
+    }
+    for name, (inline, prebuilt) in query_cases(targets).items():
+        samples = {"inline": [], "prebuilt": []}
+        for _ in range(args.rounds):
+            samples["inline"] += await measure(inline, args.iterations, args.warmup)
+            samples["prebuilt"] += await measure(prebuilt, args.iterations, args.warmup)
+        inline_stats = summarize(samples["inline"])
+        prebuilt_stats = summarize(samples["prebuilt"])
+        report["methods"][name] = {
+            "inline": inline_stats,
+            "prebuilt": prebuilt_stats,
+            "mean_saved_us": round((inline_stats["mean_ms"] - prebuilt_stats["mean_ms"]) * 1000, 1),
+        }
+
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,158 @@
+# benchmarks/reservation_indexes.py
+"""reservations 테이블에 100만+ 행을 넣고 각 Repository 쿼리의 실행 계획과 지연 시간을 출력.
+
+    uv run python -m benchmarks.reservation_indexes --reset --rooms 100 --days 800
+    uv run python -m benchmarks.reservation_indexes --compare   # 인덱스 없이 한 번 더 측정
+
+Repository 메서드를 실제로 호출하면서 before_cursor_execute 로 SQL 과 파라미터를 잡아
+같은 문장에 EXPLAIN (ANALYZE, BUFFERS) 를 실행한다.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from sqlalchemy import event, text
+
+from async_database import async_engine, AsyncSessionLocal
+from benchmarks.common import reset_schema, seed, summarize
+from study_room.models import Reservation
+from study_room.repositories.reservation_repository import reservation_repository
+from study_room.repositories.study_room_repository import study_room_repository
+
+NEW_INDEXES = ["uq_room_date_time_active", "ix_reservations_user_date_time"]
+
+# 룸 x 날짜 x 운영 시간(09~21시)을 모두 채우고, 지난 예약은 이용완료/취소로 섞는다
+SEED_SQL = """
+INSERT INTO reservations (user_id, room_id, reservation_date, start_time, end_time, status)
+SELECT
+    -- 같은 날짜/시간의 룸끼리는 서로 다른 유저 (유저 구간 겹침 배타 제약, 유저 수 >= 룸 수)
+    CAST(:min_user AS int) + (r.room_id + h * 7 + (d::date - CURRENT_DATE)) % CAST(:user_count AS int),
+    r.room_id,
+    d::date,
+    make_time(h, 0, 0),
+    make_time(h + 1, 0, 0),
+    CASE
+        WHEN d::date >= CURRENT_DATE THEN '예약확정'
+        WHEN random() < 0.1 THEN '취소'
+        ELSE '이용완료'
+    END
+FROM study_rooms r
+CROSS JOIN generate_series(CURRENT_DATE - CAST(:past_days AS int), CURRENT_DATE + 7, interval '1 day') AS d
+CROSS JOIN generate_series(9, 21) AS h
+"""
+
+
+async def seed_reservations(rooms: int, users: int, days: int):
+    info = await seed(rooms=rooms, users=users, reservations_per_room_day=0)
+    async with async_engine.begin() as conn:
+        await conn.execute(
+            text(SEED_SQL),
+            {"min_user": min(info.user_ids), "user_count": len(info.user_ids), "past_days": days},
+        )
+        await conn.execute(text("ANALYZE reservations"))
+
+
+async def pick_targets() -> dict:
+    async with AsyncSessionLocal() as db:
+        row = (await db.execute(text(
+            "SELECT user_id, room_id, reservation_date, start_time, end_time FROM reservations "
+            "WHERE reservation_date >= CURRENT_DATE ORDER BY random() LIMIT 1"
+        ))).one()
+    return {
+        "user_id": row.user_id,
+        "room_id": row.room_id,
+        "date": row.reservation_date,
+        "start": row.start_time,
+        "end": row.end_time,
+    }
+
+
+def query_cases(t: dict):
+    return {
+        "sum_booked_minutes": lambda db: reservation_repository.sum_booked_minutes(db, t["user_id"], t["date"]),
+        "find_user_conflict": lambda db: reservation_repository.find_user_conflict(db, t["user_id"], t["date"], t["start"], t["end"]),
+        "find_rows_by_user_id": lambda db: reservation_repository.find_rows_by_user_id(db, t["user_id"]),
+        "find_conflict": lambda db: reservation_repository.find_conflict(db, t["room_id"], t["date"], t["start"], t["end"]),
+        "get_reserved_slots": lambda db: study_room_repository.get_reserved_slots(db, t["date"], t["date"], room_id=t["room_id"]),
+    }
+
+
+async def explain_and_time(iterations: int) -> dict:
+    targets = await pick_targets()
+    captured: list[tuple[str, object]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    report = {}
+    for name, call in query_cases(targets).items():
+        event.listen(async_engine.sync_engine, "before_cursor_execute", capture)
+        try:
+            captured.clear()
+            async with AsyncSessionLocal() as db:
+                await call(db)
+            statement, parameters = captured[0]
+        finally:
+            event.remove(async_engine.sync_engine, "before_cursor_execute", capture)
+
+        async with async_engine.connect() as conn:
+            plan = await conn.exec_driver_sql("EXPLAIN (ANALYZE, BUFFERS) " + statement, parameters)
+            plan_lines = [r[0] for r in plan.all()]
+
+        samples = []
+        async with AsyncSessionLocal() as db:
+            for _ in range(iterations):
+                start = time.perf_counter()
+                await call(db)
+                samples.append(time.perf_counter() - start)
+
+        report[name] = {"plan": plan_lines, "latency": summarize(samples)}
+    return report
+
+
+async def drop_indexes():
+    async with async_engine.begin() as conn:
+        for name in NEW_INDEXES:
+            await conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        await conn.execute(text("ANALYZE reservations"))
+
+
+async def create_indexes():
+    async with async_engine.begin() as conn:
+        for index in Reservation.__table__.indexes:
+            await conn.run_sync(lambda sync_conn, i=index: i.create(sync_conn, checkfirst=True))
+        await conn.execute(text("ANALYZE reservations"))
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reset", action="store_true", help="테이블을 지우고 다시 시드")
+    parser.add_argument("--rooms", type=int, default=100)
+    parser.add_argument("--users", type=int, default=20000)
+    parser.add_argument("--days", type=int, default=800, help="과거 예약 일수 (rooms x (days+8) x 13 행)")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--compare", action="store_true", help="인덱스를 지운 상태로도 측정")
+    args = parser.parse_args()
+
+    if args.reset:
+        await reset_schema()
+        await seed_reservations(args.rooms, args.users, args.days)
+
+    async with AsyncSessionLocal() as db:
+        rows = await db.scalar(text("SELECT count(*) FROM reservations"))
+
+    result = {"rows": rows, "with_indexes": await explain_and_time(args.iterations)}
+    if args.compare:
+        await drop_indexes()
+        try:
+            result["without_indexes"] = await explain_and_time(args.iterations)
+        finally:
+            await create_indexes()
+
+    print(json.dumps(result, indent=2, ensure_ascii=False, default=str))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
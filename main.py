@@ -1,13 +1,30 @@
-from fastapi import FastAPI
+import time
+
+from fastapi import FastAPI, status
+from fastapi.responses import JSONResponse, PlainTextResponse
 from contextlib import asynccontextmanager
+from sqlalchemy import text
 
-from async_database import async_engine
+from async_database import (
+    async_engine, read_engine, AsyncSessionLocal, pool_status, replica_pool_status, REPLICA_MAX_LAG_SECONDS,
+)
 from study_room import models
+from study_room.request_metrics import RequestMetricsMiddleware, request_metrics
+from study_room.rate_limit import rate_limiter
+from study_room.services.availability_index import availability_index
+from study_room.services.availability_events import availability_events
+from study_room.services.room_catalog import room_catalog
+from study_room.services.password_hasher import password_hasher
+from study_room.services.auth_service import auth_service
+from study_room.services.reservation_sweeper import reservation_sweeper
+from study_room.services.reservation_partitions import reservation_partitions
+from study_room.services.booking_queue import booking_queue
 
 from study_room.routers.auth_router import router as auth_router
 from study_room.routers.study_room_router import router as study_room_router
 from study_room.routers.reservation_router import router as reservation_router
 from study_room.routers.review_router import router as review_router
+from study_room.routers.waitlist_router import router as waitlist_router
 
 
 @asynccontextmanager
@@ -15,9 +32,35 @@ async def lifespan(app: FastAPI):
     # 서버 시작 시: 테이블 생성
     async with async_engine.begin() as conn:
         await conn.run_sync(models.Base.metadata.create_all)
+    # 예약 파티션 테이블이면 예약을 받기 전에 필요한 월별 파티션을 만든다 (RESERVATION_PARTITIONING=true 일 때만)
+    async with AsyncSessionLocal() as db:
+        async with db.begin():
+            await reservation_partitions.ensure_partitions(db)
+    # 스터디룸 카탈로그 / 예약 가능 시간 인덱스 구성
+    async with AsyncSessionLocal() as db:
+        await room_catalog.refresh(db)
+        await availability_index.rebuild(db)
+    # 종료된 예약을 주기적으로 이용완료 처리, 카탈로그 변경 감지
+    reservation_sweeper.start(AsyncSessionLocal)
+    room_catalog.start(AsyncSessionLocal)
+    # 다음 달 파티션 미리 생성 / 오래된 파티션 보관
+    reservation_partitions.start(AsyncSessionLocal)
+    # 다른 워커의 예약 가능 시간 변경 수신 (AVAILABILITY_EVENTS_BACKEND=postgres 일 때만)
+    availability_events.start(AsyncSessionLocal)
+    # 대기열 예약 모드의 룸별 처리 (BOOKING_QUEUE_ENABLED=true 일 때만 요청이 들어온다)
+    booking_queue.start(AsyncSessionLocal)
     yield
-    # 서버 종료 시: 엔진 정리
+    # 서버 종료 시: 쌓인 대기열 예약 처리 후 백그라운드 작업 / rate limit 백엔드 연결 / 엔진 / 해싱 워커 정리
+    await booking_queue.stop()
+    await availability_events.stop()
+    await room_catalog.stop()
+    await reservation_sweeper.stop()
+    await reservation_partitions.stop()
+    await rate_limiter.close()
     await async_engine.dispose()
+    if read_engine is not None:
+        await read_engine.dispose()
+    password_hasher.shutdown()
 
 
 app = FastAPI(
@@ -27,12 +70,75 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+app.add_middleware(RequestMetricsMiddleware)
+
 app.include_router(auth_router)
 app.include_router(study_room_router)
 app.include_router(reservation_router)
 app.include_router(review_router)
+app.include_router(waitlist_router)
 
 
 @app.get("/", tags=["Health"])
 async def health_check():
-    return {"status": "ok", "message": "스터디룸 예약 시스템이 실행 중입니다."}
\ No newline at end of file
+    return {"status": "ok", "message": "스터디룸 예약 시스템이 실행 중입니다."}
+
+
+# 복제본이 마지막으로 적용한 트랜잭션 이후 경과 시간 (받은 WAL 을 모두 적용했으면 0, 복제본이 아니면 NULL)
+REPLICA_LAG_SQL = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() THEN NULL "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+)
+
+
+async def _replica_health() -> dict:
+    start = time.perf_counter()
+    try:
+        async with read_engine.connect() as conn:
+            lag = await conn.scalar(REPLICA_LAG_SQL)
+    except Exception as e:
+        return {"status": "error", "error": type(e).__name__, "pool": replica_pool_status()}
+    lag_seconds = round(float(lag), 3) if lag is not None else None
+    return {
+        "status": "lagging" if lag_seconds is not None and lag_seconds > REPLICA_MAX_LAG_SECONDS else "ok",
+        "ping_ms": round((time.perf_counter() - start) * 1000, 3),
+        "lag_seconds": lag_seconds,
+        "pool": replica_pool_status(),
+    }
+
+
+@app.get("/health/db", tags=["Health"])
+async def health_check_db():
+    # 풀에서 커넥션을 하나 빌려 SELECT 1 까지 걸린 시간을 함께 보고한다
+    start = time.perf_counter()
+    try:
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    except Exception as e:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "error", "error": type(e).__name__, "pool": pool_status()},
+        )
+    result = {
+        "status": "ok",
+        "ping_ms": round((time.perf_counter() - start) * 1000, 3),
+        "pool": pool_status(),
+    }
+    if read_engine is None:
+        return result
+    # 읽기 전용 라우트가 복제본을 쓰므로 복제본에 연결할 수 없으면 503
+    result["replica"] = await _replica_health()
+    if result["replica"]["status"] == "error":
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content={**result, "status": "error"})
+    return result
+
+
+@app.get("/metrics", tags=["Health"], response_class=PlainTextResponse)
+async def metrics():
+    # Prometheus text exposition format
+    return PlainTextResponse(
+        request_metrics.render() + rate_limiter.render() + booking_queue.render() + password_hasher.render()
+        + auth_service.render(),
+        media_type="text/plain; version=0.0.4",
+    )
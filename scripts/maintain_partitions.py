@@ -0,0 +1,28 @@
+# scripts/maintain_partitions.py
+"""reservations 월별 파티션을 미리 만들고 보관 기간이 지난 파티션을 reservation_history 로 옮긴다.
+
+    uv run python -m scripts.maintain_partitions
+
+서버도 같은 작업을 RESERVATION_PARTITION_CHECK_INTERVAL_SECONDS 마다 실행하므로, cron 등으로 따로 돌리고 싶을 때 쓴다.
+RESERVATION_PARTITIONING=true 로 만든 DB 에서만 동작한다.
+"""
+
+import asyncio
+
+from async_database import AsyncSessionLocal, async_engine
+from study_room.services.reservation_partitions import reservation_partitions
+
+
+async def main():
+    if not reservation_partitions.enabled:
+        print("RESERVATION_PARTITIONING 이 꺼져 있어 할 일이 없습니다.")
+        return
+    created, archived = await reservation_partitions.run_once(AsyncSessionLocal)
+    await async_engine.dispose()
+    print(f"새 파티션 {len(created)}개: {', '.join(f'{m:%Y-%m}' for m in created) or '-'}")
+    for month, rows in archived.items():
+        print(f"{month:%Y-%m} 파티션 보관: {rows}건")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,39 @@
+# scripts/partition_reservations.py
+"""파티션 없이 만들어진 기존 DB 의 reservations 를 월별 파티션 테이블로 바꾼다.
+
+    RESERVATION_PARTITIONING=true uv run python -m scripts.partition_reservations
+
+서버를 모두 멈춘 상태에서 실행한다. 기존 행은 id 그대로 옮기고, 보관 기간이 지난 달은 바로 reservation_history 로 옮긴다.
+이미 파티션 테이블이면 아무것도 하지 않는다.
+"""
+
+import asyncio
+
+from async_database import AsyncSessionLocal, async_engine
+from study_room import models
+from study_room.services.reservation_partitions import reservation_partitions
+
+
+async def main():
+    if not reservation_partitions.enabled:
+        print("RESERVATION_PARTITIONING=true 로 실행해야 합니다.")
+        return
+    # reservation_history 등 없는 테이블만 만든다 (기존 reservations 는 그대로 둔다)
+    async with async_engine.begin() as conn:
+        await conn.run_sync(models.Base.metadata.create_all)
+    async with AsyncSessionLocal() as db:
+        async with db.begin():
+            result = await reservation_partitions.migrate(db)
+    if result is None:
+        print("reservations 는 이미 파티션 테이블입니다.")
+    else:
+        created, rows = result
+        print(f"예약 {rows}건을 파티션 {len(created)}개({created[0]:%Y-%m} ~ {created[-1]:%Y-%m})로 옮겼습니다.")
+        _, archived = await reservation_partitions.run_once(AsyncSessionLocal)
+        for month, archived_rows in archived.items():
+            print(f"{month:%Y-%m} 파티션 보관: {archived_rows}건")
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
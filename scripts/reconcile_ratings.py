@@ -0,0 +1,22 @@
+# scripts/reconcile_ratings.py
+"""reviews 테이블 기준으로 study_rooms 의 rating_sum / review_count / rating 을 다시 계산.
+
+    uv run python -m scripts.reconcile_ratings
+"""
+
+import asyncio
+
+from async_database import AsyncSessionLocal, async_engine
+from study_room.repositories.study_room_repository import study_room_repository
+
+
+async def main():
+    async with AsyncSessionLocal() as db:
+        async with db.begin():
+            rooms = await study_room_repository.reconcile_ratings(db)
+    await async_engine.dispose()
+    print(f"{rooms}개 스터디룸의 평점 집계를 다시 계산했습니다.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,38 @@
+# study_room/conditional.py
+
+import hashlib
+import uuid
+
+from fastapi import Request, Response, status
+
+# 응답은 캐시하되 매번 ETag 로 재검증하게 한다
+CACHE_CONTROL = "no-cache"
+
+# 버전 카운터는 프로세스마다 따로 있으므로, 다른 프로세스가 만든 ETag 와 절대 겹치지 않게 한다
+_PROCESS_TAG = uuid.uuid4().hex[:8]
+
+
+def make_etag(request: Request, *versions) -> str:
+    """URL(경로 + 쿼리)과 리소스 버전으로 강한 ETag 를 만든다"""
+    raw = repr((request.url.path, request.url.query, versions)).encode("utf-8")
+    return f'"{_PROCESS_TAG}-{hashlib.blake2b(raw, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    # If-None-Match 는 약한 비교 (W/ 접두어 무시)
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def cache_headers(etag: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(etag))
+
+
+def set_cache_headers(response: Response, etag: str):
+    response.headers.update(cache_headers(etag))
@@ -1,9 +1,10 @@
 # study_room/dependencies.py
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from fastapi.security import OAuth2PasswordBearer
+from fastapi.security.utils import get_authorization_scheme_param
 from sqlalchemy.ext.asyncio import AsyncSession
-from async_database import get_async_db
+from async_database import get_async_db, primary_session, read_session_factory
 from study_room.services.auth_service import auth_service
 from study_room.models.user import User
 
@@ -14,4 +15,33 @@ async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_async_db),
 ) -> User:
-    return await auth_service.get_current_user(db, token)
\ No newline at end of file
+    user = await auth_service.get_current_user(db, token)
+    # 이 세션에서 커밋하면 이 사용자의 읽기를 잠시 primary 로 보낸다 (read-your-writes)
+    db.info["user_id"] = user.id
+    return user
+
+
+async def get_async_read_db(request: Request):
+    """읽기 전용 라우트용 세션 (복제본이 있으면 복제본).
+
+    방금 쓰기를 한 사용자는 복제 지연 동안 자기 쓰기가 안 보일 수 있으므로 primary 로 보낸다.
+    토큰 검증은 get_current_user 가 하고, 여기서는 이미 확인된 토큰의 사용자만 캐시에서 찾는다.
+    """
+    scheme, token = get_authorization_scheme_param(request.headers.get("Authorization"))
+    # 캐시 적중률 지표에 섞이지 않도록 peek 으로 본다 (토큰 검증 시의 조회만 센다)
+    user_id = auth_service.token_cache.peek(token) if scheme.lower() == "bearer" and token else None
+    async with read_session_factory(user_id)() as session:
+        yield session
+
+
+async def get_current_read_user(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_read_db),
+) -> User:
+    """읽기 전용 라우트용 get_current_user. 라우트와 같은 읽기 세션을 써서 요청당 세션을 하나만 연다"""
+    user_id = auth_service.user_id_from_token(token)
+    if auth_service.user_cache.peek(user_id) is None:
+        # 가입 직후라 복제본에 아직 없을 수 있으므로 캐시에 없는 사용자는 primary 에서 찾는다 (캐시 TTL 동안 한 번)
+        async with primary_session(db) as primary:
+            return await auth_service.get_user(primary, user_id)
+    return await auth_service.get_user(db, user_id)
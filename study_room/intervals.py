@@ -0,0 +1,66 @@
+# study_room/intervals.py
+
+from bisect import bisect_left, bisect_right
+from datetime import time
+
+
+def to_minutes(t: time) -> int:
+    return t.hour * 60 + t.minute
+
+
+class IntervalSet:
+    """서로 겹치지 않는 [start, end) 구간(자정 기준 분)을 시작 시각 순으로 들고 있는 구조.
+
+    구간끼리 겹치지 않으므로(DB 의 배타 제약이 보장) 끝 시각도 정렬되어 있어,
+    겹침 검사는 새 구간의 끝보다 먼저 시작하는 마지막 구간 하나만 보면 된다 (이분 탐색 한 번).
+    """
+
+    __slots__ = ("_starts", "_ends")
+
+    def __init__(self):
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, IntervalSet) and self._starts == other._starts and self._ends == other._ends
+
+    def contains(self, start: int, end: int) -> bool:
+        """[start, end) 구간이 그대로 들어 있는지"""
+        i = bisect_left(self._starts, start)
+        while i < len(self._starts) and self._starts[i] == start:
+            if self._ends[i] == end:
+                return True
+            i += 1
+        return False
+
+    def overlaps(self, start: int, end: int) -> bool:
+        i = bisect_left(self._starts, end)
+        return i > 0 and self._ends[i - 1] > start
+
+    def add(self, start: int, end: int):
+        i = bisect_right(self._starts, start)
+        self._starts.insert(i, start)
+        self._ends.insert(i, end)
+
+    def remove(self, start: int, end: int) -> bool:
+        i = bisect_left(self._starts, start)
+        while i < len(self._starts) and self._starts[i] == start:
+            if self._ends[i] == end:
+                del self._starts[i]
+                del self._ends[i]
+                return True
+            i += 1
+        return False
+
+    def mask(self, origin: int, step: int, count: int) -> int:
+        """origin 부터 step 분 간격 슬롯 count 개 중 구간과 겹치는 슬롯의 비트셋"""
+        mask = 0
+        for start, end in zip(self._starts, self._ends):
+            first = max((start - origin) // step, 0)
+            last = min((end - origin - 1) // step, count - 1)
+            if first <= last:
+                mask |= ((1 << (last - first + 1)) - 1) << first
+        return mask
@@ -3,7 +3,9 @@
 from .user import User
 from .study_room import StudyRoom, Facility
 from .reservation import Reservation
+from .reservation_history import ReservationHistory
 from .review import Review
+from .waitlist import WaitlistEntry
 from database import Base
 
-__all__ = ["Base", "User", "StudyRoom", "Facility", "Reservation", "Review"]
\ No newline at end of file
+__all__ = ["Base", "User", "StudyRoom", "Facility", "Reservation", "ReservationHistory", "Review", "WaitlistEntry"]
\ No newline at end of file
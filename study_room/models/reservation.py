@@ -1,8 +1,10 @@
 # study_room/models/reservation.py
 
+import os
 from datetime import date, time, datetime
-from sqlalchemy import String, Date, Time, DateTime, ForeignKey, UniqueConstraint, func
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import String, Date, Time, DateTime, ForeignKey, Index, DDL, event, func, text, literal_column
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship, declared_attr
 from database import Base
 from typing import TYPE_CHECKING
 
@@ -11,6 +13,20 @@ if TYPE_CHECKING:
     from .study_room import StudyRoom
     from .review import Review
 
+# true 면 reservations 를 reservation_date 기준 월별 RANGE 파티션 테이블로 만든다 (PostgreSQL, 새 DB 를 만들 때만 적용).
+# 파티션 생성/보관은 ReservationPartitionMaintainer 가 담당한다.
+RESERVATION_PARTITIONING = os.getenv("RESERVATION_PARTITIONING", "false").lower() == "true"
+
+# 예약 구간 [시작, 종료). 배타 제약과 GiST 인덱스가 이 식으로 겹침을 검사한다
+PERIOD_SQL = "tsrange(reservation_date + start_time, reservation_date + end_time)"
+_PERIOD = func.tsrange(
+    literal_column("reservation_date + start_time"), literal_column("reservation_date + end_time")
+)
+# 같은 룸 / 같은 유저의 구간 겹침을 막는 배타 제약 (이름, 비교 컬럼). 파티션별 제약은 이름 뒤에 _YYYYMM 이 붙는다
+ROOM_PERIOD_CONSTRAINT = "ex_reservations_room_period"
+USER_PERIOD_CONSTRAINT = "ex_reservations_user_period"
+EXCLUSION_CONSTRAINTS = ((ROOM_PERIOD_CONSTRAINT, "room_id"), (USER_PERIOD_CONSTRAINT, "user_id"))
+
 
 class Reservation(Base):
     __tablename__ = "reservations"
@@ -18,7 +34,8 @@ class Reservation(Base):
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     room_id: Mapped[int] = mapped_column(ForeignKey("study_rooms.room_id"), nullable=False)
-    reservation_date: Mapped[date] = mapped_column(Date, nullable=False)
+    # 파티션 테이블은 PK 에 파티션 키가 들어가야 한다
+    reservation_date: Mapped[date] = mapped_column(Date, primary_key=RESERVATION_PARTITIONING, nullable=False)
     start_time: Mapped[time] = mapped_column(Time, nullable=False)
     end_time: Mapped[time] = mapped_column(Time, nullable=False)
     # 예약확정 / 이용완료 / 취소
@@ -27,11 +44,76 @@ class Reservation(Base):
         DateTime, server_default=func.now(), nullable=False
     )
 
-    # 같은 룸, 같은 날, 같은 시간 중복 예약 방지
     __table_args__ = (
-        UniqueConstraint("room_id", "reservation_date", "start_time", name="uq_room_date_time"),
+        # 같은 룸, 같은 날, 같은 시작 시각 중복 예약 방지 (취소된 예약은 제외 → 취소된 슬롯은 다시 예약 가능)
+        # insert_if_available 의 room_slot CTE / _ROOM_DAY_SLOTS(find_room_day_slots) 조회에도 사용된다.
+        Index(
+            "uq_room_date_time_active",
+            "room_id", "reservation_date", "start_time",
+            unique=True,
+            postgresql_where=text("status <> '취소'"),
+        ),
+        # sum_booked_minutes / find_user_conflict / find_rows_by_user_id 용 (status 포함 → index-only scan)
+        # id 까지 포함해 find_rows_by_user_id 의 keyset 페이지네이션 정렬 키와 일치시킨다.
+        Index(
+            "ix_reservations_user_date_time",
+            "user_id", "reservation_date", "start_time", "id",
+            postgresql_include=["status"],
+        ),
+        # ReservationSweeper 의 일괄 UPDATE 용 (예약확정 건만 담는 작은 인덱스)
+        Index(
+            "ix_reservations_confirmed_end",
+            "reservation_date", "end_time",
+            postgresql_where=text("status = '예약확정'"),
+        ),
+        # 슬롯 길이가 룸마다 다르고 여러 슬롯을 이어서 예약할 수 있으므로 시작 시각이 달라도 구간이 겹치면 안 된다.
+        # 같은 룸 / 같은 유저의 취소되지 않은 예약끼리 구간 겹침을 DB 가 막는다 (GiST 인덱스, btree_gist 필요).
+        # 파티션 테이블에서는 부모에 배타 제약을 둘 수 없으므로 파티션마다 만든다.
+        *(
+            ExcludeConstraint(
+                (literal_column(column), "="),
+                (_PERIOD, "&&"),
+                name=name,
+                using="gist",
+                where=text("status <> '취소'"),
+            ).ddl_if(dialect="postgresql")
+            for name, column in EXCLUSION_CONSTRAINTS
+            if not RESERVATION_PARTITIONING
+        ),
+        {"postgresql_partition_by": "RANGE (reservation_date)"} if RESERVATION_PARTITIONING else {},
     )
 
+    @declared_attr.directive
+    def __mapper_args__(cls):
+        # 파티션 키가 PK 에 들어가도 ORM 식별자는 id 하나로 둔다
+        return {"primary_key": [cls.__table__.c.id]}
+
     user: Mapped["User"] = relationship(back_populates="reservations")
     room: Mapped["StudyRoom"] = relationship(back_populates="reservations")
-    review: Mapped["Review"] = relationship(back_populates="reservation", uselist=False)
\ No newline at end of file
+    review: Mapped["Review"] = relationship(back_populates="reservation", uselist=False)
+
+
+# 배타 제약에서 정수 컬럼(room_id, user_id)을 = 로 비교하려면 btree_gist 확장이 있어야 한다
+event.listen(
+    Reservation.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS btree_gist").execute_if(dialect="postgresql"),
+)
+
+
+# 취소되지 않은 예약 조건.
+# 부분 인덱스(uq_room_date_time_active)의 WHERE 절과 같은 상수 식이어야 플래너가 인덱스를 쓸 수 있다.
+# (바인드 파라미터로 넘기면 generic plan 에서 부분 인덱스를 사용하지 못한다)
+ACTIVE_RESERVATION = Reservation.status != literal_column("'취소'")
+
+
+def effective_status(status: str, reservation_date: date, end_time: time, now: datetime) -> str:
+    """종료 시간이 지난 예약확정 건은 이용완료로 본다.
+
+    DB 상태는 ReservationSweeper 가 주기적으로 일괄 갱신하므로, 그 사이에도 올바른 상태를 보여주기 위해 사용한다.
+    """
+    if status == "예약확정" and (
+        reservation_date < now.date() or (reservation_date == now.date() and end_time <= now.time())
+    ):
+        return "이용완료"
+    return status
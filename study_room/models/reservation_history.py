@@ -0,0 +1,30 @@
+# study_room/models/reservation_history.py
+
+from datetime import date, time, datetime
+from sqlalchemy import String, Date, Time, DateTime, Index, func
+from sqlalchemy.orm import Mapped, mapped_column
+from database import Base
+
+
+class ReservationHistory(Base):
+    """보관 기간이 지나 reservations 파티션에서 옮겨진 예약.
+
+    내 예약 목록을 끝까지 넘기면 이어서 읽는다. 다시 바뀌지 않는 기록이므로 FK / 제약 없이 조회용 인덱스 하나만 둔다.
+    """
+
+    __tablename__ = "reservation_history"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    user_id: Mapped[int] = mapped_column(nullable=False)
+    room_id: Mapped[int] = mapped_column(nullable=False)
+    reservation_date: Mapped[date] = mapped_column(Date, nullable=False)
+    start_time: Mapped[time] = mapped_column(Time, nullable=False)
+    end_time: Mapped[time] = mapped_column(Time, nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        # 내 예약 목록의 keyset 정렬 키 (reservations 의 ix_reservations_user_date_time 과 같은 순서)
+        Index("ix_reservation_history_user_date_time", "user_id", "reservation_date", "start_time", "id"),
+    )
@@ -1,9 +1,10 @@
 # study_room/models/review.py
 
 from datetime import datetime
-from sqlalchemy import Float, String, DateTime, ForeignKey, func
+from sqlalchemy import Float, String, DateTime, ForeignKey, ForeignKeyConstraint, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from database import Base
+from .reservation import RESERVATION_PARTITIONING
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -16,9 +17,7 @@ class Review(Base):
     __tablename__ = "reviews"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    reservation_id: Mapped[int] = mapped_column(
-        ForeignKey("reservations.id"), unique=True, nullable=False
-    )
+    reservation_id: Mapped[int] = mapped_column(unique=True, nullable=False)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     room_id: Mapped[int] = mapped_column(ForeignKey("study_rooms.room_id"), nullable=False)
     rating: Mapped[float] = mapped_column(Float, nullable=False)
@@ -27,6 +26,15 @@ class Review(Base):
         DateTime, server_default=func.now(), nullable=False
     )
 
+    __table_args__ = (
+        # find_rows_by_room_id 의 keyset 페이지네이션 (created_at, id) 정렬 키
+        Index("ix_reviews_room_created", "room_id", "created_at", "id"),
+        # 파티션 테이블은 id 만으로 된 유니크 키가 없고 오래된 예약은 보관 테이블로 옮겨지므로 FK 를 두지 않는다
+        ForeignKeyConstraint(["reservation_id"], ["reservations.id"]).ddl_if(
+            callable_=lambda *args, **kw: not RESERVATION_PARTITIONING
+        ),
+    )
+
     reservation: Mapped["Reservation"] = relationship(back_populates="review")
     user: Mapped["User"] = relationship(back_populates="reviews")
     room: Mapped["StudyRoom"] = relationship(back_populates="reviews")
\ No newline at end of file
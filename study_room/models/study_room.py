@@ -29,8 +29,13 @@ class StudyRoom(Base):
     location: Mapped[str] = mapped_column(String(100), nullable=False)
     max_capacity: Mapped[int] = mapped_column(nullable=False)
     rating: Mapped[float] = mapped_column(Float, default=0.0)
+    # 평점 집계 (리뷰 작성 시 원자적으로 증가, rating = round(rating_sum / review_count, 1))
+    rating_sum: Mapped[float] = mapped_column(Float, default=0.0, server_default="0", nullable=False)
+    review_count: Mapped[int] = mapped_column(default=0, server_default="0", nullable=False)
     open_time: Mapped[time] = mapped_column(Time, nullable=False)
     close_time: Mapped[time] = mapped_column(Time, nullable=False)
+    # 예약 단위(분). 예약은 open_time 부터 이 간격의 슬롯 경계에서 시작하고, 이 길이의 배수만큼 이용한다
+    slot_minutes: Mapped[int] = mapped_column(default=60, server_default="60", nullable=False)
 
     facilities: Mapped[list["Facility"]] = relationship(
         secondary="room_facility_map", back_populates="rooms"
@@ -0,0 +1,53 @@
+# study_room/models/waitlist.py
+
+from datetime import date, time, datetime
+from sqlalchemy import String, Date, Time, DateTime, ForeignKey, ForeignKeyConstraint, Index, func, text, literal_column
+from sqlalchemy.orm import Mapped, mapped_column
+from database import Base
+from .reservation import RESERVATION_PARTITIONING
+
+
+class WaitlistEntry(Base):
+    """이미 예약된 시간(룸, 날짜, 시작~종료 시각)에 대한 대기 신청. 겹치는 예약이 취소되면 먼저 신청한 순서대로 예약으로 전환된다."""
+
+    __tablename__ = "waitlist_entries"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    room_id: Mapped[int] = mapped_column(ForeignKey("study_rooms.room_id"), nullable=False)
+    reservation_date: Mapped[date] = mapped_column(Date, nullable=False)
+    start_time: Mapped[time] = mapped_column(Time, nullable=False)
+    end_time: Mapped[time] = mapped_column(Time, nullable=False)
+    # 대기 / 예약완료 / 취소 / 만료
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="대기")
+    # 예약완료로 전환될 때 만들어진 예약
+    reservation_id: Mapped[int | None] = mapped_column(nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        # 같은 유저가 같은 슬롯에 두 번 대기할 수 없다 (대기 중인 건만)
+        Index(
+            "uq_waitlist_user_slot_waiting",
+            "user_id", "room_id", "reservation_date", "start_time",
+            unique=True,
+            postgresql_where=text("status = '대기'"),
+        ),
+        # 슬롯별 대기열: 승격 대상 조회(시작 시각 범위)와 순번 계산(id 가 더 작은 대기 건 수)에 사용
+        Index(
+            "ix_waitlist_slot_queue",
+            "room_id", "reservation_date", "start_time", "id",
+            postgresql_where=text("status = '대기'"),
+        ),
+        # 내 대기 목록 조회용
+        Index("ix_waitlist_user", "user_id", "id"),
+        # 파티션 테이블에는 id 만으로 된 유니크 키가 없으므로 FK 를 두지 않는다 (Review 와 같음)
+        ForeignKeyConstraint(["reservation_id"], ["reservations.id"]).ddl_if(
+            callable_=lambda *args, **kw: not RESERVATION_PARTITIONING
+        ),
+    )
+
+
+# 대기 중인 건 조건 (부분 인덱스의 WHERE 절과 같은 상수 식)
+WAITING = WaitlistEntry.status == literal_column("'대기'")
@@ -0,0 +1,238 @@
+# study_room/rate_limit.py
+
+import logging
+import math
+import os
+import time
+from collections import Counter, OrderedDict
+
+from dotenv import load_dotenv
+from fastapi import HTTPException, Request, status
+from fastapi.security.utils import get_authorization_scheme_param
+
+from study_room.services.auth_service import auth_service
+
+load_dotenv(encoding="utf-8")
+# 기본은 꺼 둔다 (필요한 배포에서만 켠다)
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "false").lower() == "true"
+# memory: 워커 프로세스마다 따로 센다 / redis: 워커가 버킷을 공유한다 (redis 패키지 필요)
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory").lower()
+RATE_LIMIT_REDIS_URL = os.getenv("RATE_LIMIT_REDIS_URL", "redis://localhost:6379/0")
+# 인메모리 버킷 최대 개수 (넘치면 가장 오래 안 쓴 버킷부터 버린다. 버려진 버킷은 가득 찬 상태로 다시 시작)
+RATE_LIMIT_MAX_BUCKETS = int(os.getenv("RATE_LIMIT_MAX_BUCKETS", "100000"))
+# 리버스 프록시 뒤에서만 true. 앞단 프록시가 RATE_LIMIT_TRUSTED_PROXIES 개일 때 X-Forwarded-For 의 오른쪽에서
+# 그 개수번째 주소(가장 바깥 프록시가 붙인 주소)를 클라이언트 IP 로 쓴다. 그보다 왼쪽은 클라이언트가 마음대로 넣을 수 있다
+RATE_LIMIT_TRUST_FORWARDED_FOR = os.getenv("RATE_LIMIT_TRUST_FORWARDED_FOR", "false").lower() == "true"
+RATE_LIMIT_TRUSTED_PROXIES = int(os.getenv("RATE_LIMIT_TRUSTED_PROXIES", "1"))
+# 로그인 한도를 나눠 세는 계정 값(학번)의 최대 길이 (버킷 키가 커지지 않도록)
+ACCOUNT_KEY_MAX_LENGTH = 64
+
+# 이름 -> "최대 요청 수/초" 기본값. RATE_LIMIT_<이름 대문자> 환경 변수로 바꿀 수 있다 (예: RATE_LIMIT_LOGIN=10/60).
+# 최대 요청 수만큼 연달아 보낼 수 있고, 이후에는 (초 / 최대 요청 수) 마다 한 번씩 다시 허용된다.
+# 로그인은 IP + 학번별(같은 NAT 뒤 사용자끼리 한도를 나눠 쓰지 않도록), 회원가입은 IP 별, 나머지는 토큰의 사용자별로 센다.
+DEFAULT_RATE_LIMITS = {
+    "login": "10/60",
+    "signup": "5/300",
+    "reservation_create": "10/60",
+    "reservation_batch": "5/60",
+    "reservation_cancel": "10/60",
+    "waitlist_join": "10/60",
+    "review_create": "5/60",
+}
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimit:
+    __slots__ = ("name", "burst", "rate")
+
+    def __init__(self, name: str, spec: str):
+        count, seconds = spec.split("/")
+        self.name = name
+        self.burst = int(count)
+        # 초당 채워지는 토큰 수
+        self.rate = int(count) / float(seconds)
+
+
+RATE_LIMITS = {
+    name: RateLimit(name, os.getenv(f"RATE_LIMIT_{name.upper()}", spec))
+    for name, spec in DEFAULT_RATE_LIMITS.items()
+}
+
+
+class MemoryRateLimitBackend:
+    """이 프로세스 안의 토큰 버킷. (이름, 클라이언트) -> [남은 토큰, 마지막 갱신 시각] 을 LRU 로 들고 있다.
+
+    단일 이벤트 루프에서만 사용하므로 락을 두지 않는다.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._buckets: OrderedDict[tuple[str, str], list[float]] = OrderedDict()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    async def take(self, limit: RateLimit, client: str) -> float:
+        return self.take_now(limit, client)
+
+    async def close(self):
+        pass
+
+    def take_now(self, limit: RateLimit, client: str) -> float:
+        """토큰 하나를 쓰고 0 을 반환. 토큰이 없으면 다음 토큰까지 남은 초를 반환"""
+        now = time.monotonic()
+        key = (limit.name, client)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [float(limit.burst), now]
+            while len(self._buckets) > self.maxsize:
+                self._buckets.popitem(last=False)
+                self.evictions += 1
+        else:
+            self._buckets.move_to_end(key)
+            bucket[0] = min(float(limit.burst), bucket[0] + (now - bucket[1]) * limit.rate)
+            bucket[1] = now
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            return 0.0
+        return (1 - bucket[0]) / limit.rate
+
+
+# 토큰 버킷 한 번 갱신을 Redis 안에서 원자적으로 처리. 반환값은 기다려야 할 초 (0 이면 허용)
+_REDIS_TAKE = """
+local rate, burst, now = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = math.min(burst, (tonumber(bucket[1]) or burst) + (now - (tonumber(bucket[2]) or now)) * rate)
+local wait = 0
+if tokens >= 1 then tokens = tokens - 1 else wait = (1 - tokens) / rate end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000))
+return tostring(wait)
+"""
+
+
+class RedisRateLimitBackend:
+    """워커 간에 버킷을 공유하는 Redis 백엔드. 버킷은 가득 찰 시간이 지나면 만료되어 메모리가 늘지 않는다.
+
+    Redis 에 연결할 수 없으면 요청을 막지 않고 프로세스 내 버킷(fallback)으로 센다.
+    """
+
+    def __init__(self, url: str, fallback: MemoryRateLimitBackend):
+        # 선택 의존성: RATE_LIMIT_BACKEND=redis 일 때만 필요
+        import redis.asyncio as redis
+
+        self._client = redis.from_url(url)
+        self._script = self._client.register_script(_REDIS_TAKE)
+        self.fallback = fallback
+        self.errors = 0
+
+    def __len__(self) -> int:
+        return len(self.fallback)
+
+    @property
+    def evictions(self) -> int:
+        return self.fallback.evictions
+
+    async def take(self, limit: RateLimit, client: str) -> float:
+        try:
+            wait = await self._script(
+                keys=[f"rate_limit:{limit.name}:{client}"], args=[limit.rate, limit.burst, time.time()]
+            )
+            return float(wait)
+        except Exception:
+            self.errors += 1
+            logger.warning("rate limit 백엔드 오류, 프로세스 내 버킷 사용", exc_info=True)
+            return self.fallback.take_now(limit, client)
+
+    async def close(self):
+        await self._client.aclose()
+
+
+class RateLimiter:
+    def __init__(self, backend, enabled: bool):
+        self.backend = backend
+        self.enabled = enabled
+        # (이름, allowed / rejected) -> 횟수
+        self.decisions: Counter[tuple[str, str]] = Counter()
+
+    def client_key(self, request: Request, per_user: bool) -> str:
+        """per_user 면 토큰의 사용자, 토큰이 없거나 유효하지 않으면 IP"""
+        if per_user:
+            scheme, token = get_authorization_scheme_param(request.headers.get("Authorization"))
+            if scheme.lower() == "bearer" and token:
+                try:
+                    return f"user:{auth_service.user_id_from_token(token)}"
+                except HTTPException:
+                    pass
+        if RATE_LIMIT_TRUST_FORWARDED_FOR and "x-forwarded-for" in request.headers:
+            hops = [hop.strip() for hop in request.headers["x-forwarded-for"].split(",")]
+            return "ip:" + hops[max(len(hops) - RATE_LIMIT_TRUSTED_PROXIES, 0)]
+        return f"ip:{request.client.host if request.client else 'unknown'}"
+
+    async def account_key(self, request: Request, field: str) -> str:
+        """JSON 본문의 계정 필드 값. 본문이 올바르지 않으면 빈 문자열 (본문 검증은 라우트가 한다)"""
+        try:
+            body = await request.json()
+        except ValueError:
+            return ""
+        value = body.get(field) if isinstance(body, dict) else None
+        return str(value)[:ACCOUNT_KEY_MAX_LENGTH] if value is not None else ""
+
+    async def check(self, limit: RateLimit, request: Request, per_user: bool, account_field: str | None = None):
+        if not self.enabled:
+            return
+        client = self.client_key(request, per_user)
+        if account_field is not None:
+            client += ":account:" + await self.account_key(request, account_field)
+        wait = await self.backend.take(limit, client)
+        if wait <= 0:
+            self.decisions[(limit.name, "allowed")] += 1
+            return
+        self.decisions[(limit.name, "rejected")] += 1
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": str(math.ceil(wait))},
+        )
+
+    def render(self) -> str:
+        """Prometheus text exposition format"""
+        lines = ["# HELP rate_limit_requests_total rate limit 판정 수", "# TYPE rate_limit_requests_total counter"]
+        for (name, result), count in self.decisions.items():
+            lines.append(f'rate_limit_requests_total{{limit="{name}",result="{result}"}} {count}')
+        lines += [
+            "# TYPE rate_limit_buckets gauge", f"rate_limit_buckets {len(self.backend)}",
+            "# TYPE rate_limit_bucket_evictions_total counter", f"rate_limit_bucket_evictions_total {self.backend.evictions}",
+        ]
+        if isinstance(self.backend, RedisRateLimitBackend):
+            lines += ["# TYPE rate_limit_backend_errors_total counter", f"rate_limit_backend_errors_total {self.backend.errors}"]
+        return "\n".join(lines) + "\n"
+
+    async def close(self):
+        await self.backend.close()
+
+
+def _create_backend():
+    memory = MemoryRateLimitBackend(RATE_LIMIT_MAX_BUCKETS)
+    if RATE_LIMIT_BACKEND == "redis":
+        return RedisRateLimitBackend(RATE_LIMIT_REDIS_URL, memory)
+    return memory
+
+
+rate_limiter = RateLimiter(_create_backend(), RATE_LIMIT_ENABLED)
+
+
+def rate_limit(name: str, per_user: bool = True, account_field: str | None = None):
+    """라우트 데코레이터의 dependencies=[...] 에 넣는다. account_field 가 있으면 JSON 본문의 그 값까지 키에 넣어 센다.
+
+    데코레이터 의존성은 파라미터 의존성(get_async_db, get_current_user)보다 먼저 실행되므로
+    거절된 요청은 DB 세션을 열지 않고, 사용자 조회도 하지 않는다.
+    """
+    limit = RATE_LIMITS[name]
+
+    async def dependency(request: Request):
+        await rate_limiter.check(limit, request, per_user, account_field)
+
+    return dependency
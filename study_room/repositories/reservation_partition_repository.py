@@ -0,0 +1,129 @@
+# study_room/repositories/reservation_partition_repository.py
+
+from datetime import date
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from study_room.models.reservation import EXCLUSION_CONSTRAINTS, PERIOD_SQL, Reservation
+
+# 월별 파티션 이름: reservations_p202610 (식별자는 날짜로만 만든다)
+PARTITION_PREFIX = "reservations_p"
+
+_LIST_PARTITIONS = text(
+    "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+    "WHERE i.inhparent = 'reservations'::regclass"
+)
+
+_LOCK = text("SELECT pg_advisory_xact_lock(hashtext('reservation_partitions'))")
+
+_HISTORY_COLUMNS = "id, user_id, room_id, reservation_date, start_time, end_time, status, created_at"
+
+_IS_PARTITIONED = text(
+    "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = 'reservations'::regclass)"
+)
+
+# 파티션 테이블로 옮기는 동안 기존(파티션 없는) 테이블을 두는 이름
+LEGACY_TABLE = "reservations_unpartitioned"
+
+_LEGACY_INDEXES = text(
+    "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+    "WHERE i.indrelid = 'reservations'::regclass"
+)
+
+_LEGACY_FOREIGN_KEYS = text(
+    "SELECT conname FROM pg_constraint WHERE conrelid = 'reservations'::regclass AND contype = 'f'"
+)
+
+_LEGACY_MONTHS = text(
+    f"SELECT DISTINCT date_trunc('month', reservation_date)::date FROM {LEGACY_TABLE} ORDER BY 1"
+)
+
+
+def month_start(d: date) -> date:
+    return d.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARTITION_PREFIX}{month:%Y%m}"
+
+
+class ReservationPartitionRepository:
+    async def lock(self, db: AsyncSession):
+        """트랜잭션이 끝날 때까지 파티션 관리 잠금 (워커 여러 개가 동시에 시작해도 한 곳만 만든다)"""
+        await db.execute(_LOCK)
+
+    async def find_partition_months(self, db: AsyncSession) -> list[date]:
+        """붙어 있는 월별 파티션의 시작일 목록 (오래된 순)"""
+        names = await db.scalars(_LIST_PARTITIONS)
+        return sorted(
+            date(int(name[-6:-2]), int(name[-2:]), 1)
+            for name in names
+            if name.startswith(PARTITION_PREFIX)
+        )
+
+    async def create_partition(self, db: AsyncSession, month: date):
+        """[month, 다음 달) 파티션과 파티션별 배타 제약 생성"""
+        name = partition_name(month)
+        await db.execute(text(
+            f"CREATE TABLE {name} PARTITION OF reservations "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+        ))
+        for constraint, column in EXCLUSION_CONSTRAINTS:
+            await db.execute(text(
+                f"ALTER TABLE {name} ADD CONSTRAINT {constraint}_{month:%Y%m} "
+                f"EXCLUDE USING gist ({column} WITH =, {PERIOD_SQL} WITH &&) WHERE (status <> '취소')"
+            ))
+
+    async def archive_partition(self, db: AsyncSession, month: date) -> int:
+        """파티션을 떼어 내 행을 reservation_history 로 옮기고 삭제. 옮긴 행 수를 반환"""
+        name = partition_name(month)
+        await db.execute(text(f"ALTER TABLE reservations DETACH PARTITION {name}"))
+        result = await db.execute(text(
+            f"INSERT INTO reservation_history ({_HISTORY_COLUMNS}) "
+            f"SELECT {_HISTORY_COLUMNS} FROM {name} ON CONFLICT (id) DO NOTHING"
+        ))
+        await db.execute(text(f"DROP TABLE {name}"))
+        return result.rowcount
+
+    async def is_partitioned(self, db: AsyncSession) -> bool:
+        return await db.scalar(_IS_PARTITIONED)
+
+    async def rename_legacy_table(self, db: AsyncSession):
+        """기존 reservations 테이블과 인덱스(제약 포함) / FK / id 시퀀스 이름을 비켜 새 파티션 테이블이 같은 이름을 쓸 수 있게 한다"""
+        for name in list(await db.scalars(_LEGACY_INDEXES)):
+            await db.execute(text(f"ALTER INDEX {name} RENAME TO {name}_unpartitioned"))
+        for name in list(await db.scalars(_LEGACY_FOREIGN_KEYS)):
+            await db.execute(text(f"ALTER TABLE reservations RENAME CONSTRAINT {name} TO {name}_unpartitioned"))
+        await db.execute(text(f"ALTER SEQUENCE reservations_id_seq RENAME TO {LEGACY_TABLE}_id_seq"))
+        await db.execute(text(f"ALTER TABLE reservations RENAME TO {LEGACY_TABLE}"))
+
+    async def create_table(self, db: AsyncSession):
+        """모델 정의대로 reservations 파티션 부모 테이블 생성 (RESERVATION_PARTITIONING=true 로 불러온 모델이어야 한다)"""
+        conn = await db.connection()
+        await conn.run_sync(Reservation.__table__.create)
+
+    async def find_legacy_months(self, db: AsyncSession) -> list[date]:
+        """기존 테이블에 예약이 있는 달의 시작일 목록 (오래된 순)"""
+        return list(await db.scalars(_LEGACY_MONTHS))
+
+    async def copy_legacy_rows(self, db: AsyncSession) -> int:
+        """기존 테이블의 행을 id 그대로 파티션 테이블로 복사하고 id 시퀀스를 이어 맞춘 뒤 기존 테이블을 삭제.
+
+        reviews / waitlist_entries 의 reservation_id FK 는 기존 테이블과 함께 삭제된다 (파티션 테이블에는 두지 않는다).
+        """
+        result = await db.execute(text(
+            f"INSERT INTO reservations ({_HISTORY_COLUMNS}) SELECT {_HISTORY_COLUMNS} FROM {LEGACY_TABLE}"
+        ))
+        await db.execute(text(
+            "SELECT setval(pg_get_serial_sequence('reservations', 'id'), "
+            "COALESCE((SELECT max(id) FROM reservations), 0) + 1, false)"
+        ))
+        await db.execute(text(f"DROP TABLE {LEGACY_TABLE} CASCADE"))
+        return result.rowcount
+
+
+reservation_partition_repository = ReservationPartitionRepository()
@@ -1,10 +1,237 @@
 # study_room/repositories/reservation_repository.py
 
-from datetime import date, time
+from datetime import date, time, datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
-from sqlalchemy import select, and_, func
-from study_room.models.reservation import Reservation
+from sqlalchemy import select, insert, update, and_, or_, func, bindparam, cast, extract, literal, literal_column, true, tuple_, Date, Time, String, Integer
+from study_room.models.reservation import Reservation, ACTIVE_RESERVATION
+from study_room.models.reservation_history import ReservationHistory
+from study_room.models.study_room import StudyRoom
+from study_room.intervals import to_minutes
+
+STREAM_BATCH_SIZE = 500
+
+# 자주 호출되는 조회문은 모듈 로드 시 한 번만 만들고 값은 bindparam 으로 넘긴다.
+# 매 호출마다 select() 를 새로 조립하고 캐시 키를 계산하는 비용이 사라지고,
+# SQL 문자열이 항상 같아 asyncpg 의 prepared statement 캐시도 그대로 재사용된다.
+_user_id = bindparam("user_id", type_=Integer)
+_room_id = bindparam("room_id", type_=Integer)
+_reservation_id = bindparam("reservation_id", type_=Integer)
+_reservation_date = bindparam("reservation_date", type_=Date)
+_start_time = bindparam("start_time", type_=Time)
+_end_time = bindparam("end_time", type_=Time)
+
+# 예약 구간 [start_time, end_time) 이 [:start_time, :end_time) 과 겹치는 조건.
+# 앞쪽 조건이 (room_id / user_id, reservation_date, start_time) 인덱스의 범위 조회가 된다
+_OVERLAPS = and_(Reservation.start_time < _end_time, Reservation.end_time > _start_time)
+
+
+def _minutes(column):
+    return extract("hour", column) * 60 + extract("minute", column)
+
+
+# 취소되지 않은 예약(예약확정 + 이용완료)의 이용 시간(분) 합계 (하루 한도는 건수가 아니라 분 단위로 센다).
+# ReservationSweeper 가 끝난 예약을 이용완료로 바꾸므로 이용완료 건도 세야 한도가 유지된다
+_BOOKED_MINUTES = cast(
+    func.coalesce(
+        func.sum(_minutes(Reservation.end_time) - _minutes(Reservation.start_time)).filter(
+            ACTIVE_RESERVATION
+        ),
+        0,
+    ),
+    Integer,
+)
+
+
+def _build_user_reservation_rows(keyset: bool, limited: bool, model=Reservation):
+    """목록 응답에 필요한 컬럼만 조회 (Reservation / StudyRoom 엔티티를 만들지 않는다).
+    model=ReservationHistory 면 보관된 예약을 같은 모양으로 읽는다."""
+    stmt = (
+        select(
+            model.id,
+            model.reservation_date,
+            model.start_time,
+            model.end_time,
+            model.status,
+            StudyRoom.name.label("room_name"),
+        )
+        .join(StudyRoom, StudyRoom.room_id == model.room_id)
+        .where(model.user_id == _user_id)
+        .order_by(model.reservation_date.desc(), model.start_time.desc(), model.id.desc())
+    )
+    if keyset:
+        stmt = stmt.where(
+            tuple_(model.reservation_date, model.start_time, model.id)
+            < tuple_(bindparam("after_date", type_=Date), bindparam("after_time", type_=Time), bindparam("after_id", type_=Integer))
+        )
+    if limited:
+        stmt = stmt.limit(bindparam("limit", type_=Integer))
+    return stmt
+
+
+# (keyset 여부, limit 여부) -> 조회문
+_USER_RESERVATION_ROWS = {
+    (keyset, limited): _build_user_reservation_rows(keyset, limited)
+    for keyset in (False, True)
+    for limited in (False, True)
+}
+_HISTORY_ROWS = {
+    (keyset, limited): _build_user_reservation_rows(keyset, limited, ReservationHistory)
+    for keyset in (False, True)
+    for limited in (False, True)
+}
+
+_FIND_BY_ID = (
+    select(Reservation)
+    .options(joinedload(Reservation.room))
+    .where(Reservation.id == _reservation_id)
+)
+
+_FIND_CONFLICT = select(Reservation).where(
+    and_(
+        Reservation.room_id == _room_id,
+        Reservation.reservation_date == _reservation_date,
+        _OVERLAPS,
+        ACTIVE_RESERVATION,
+    )
+).limit(1)
+
+_SUM_BOOKED_MINUTES = select(_BOOKED_MINUTES).where(
+    Reservation.user_id == _user_id,
+    Reservation.reservation_date == _reservation_date,
+)
+
+_FIND_USER_CONFLICT = select(Reservation).where(
+    and_(
+        Reservation.user_id == _user_id,
+        Reservation.reservation_date == _reservation_date,
+        _OVERLAPS,
+        ACTIVE_RESERVATION,
+    )
+).limit(1)
+# 일괄 예약 검증용: 유저들의 해당 날짜들 예약 / 룸들의 해당 날짜들 예약 (취소 제외)
+_USER_DAY_SLOTS = select(
+    Reservation.user_id, Reservation.reservation_date, Reservation.start_time, Reservation.end_time
+).where(
+    Reservation.user_id.in_(bindparam("user_ids", expanding=True)),
+    Reservation.reservation_date.in_(bindparam("dates", expanding=True)),
+    ACTIVE_RESERVATION,
+)
+
+_ROOM_DAY_SLOTS = select(
+    Reservation.room_id, Reservation.reservation_date, Reservation.start_time, Reservation.end_time
+).where(
+    Reservation.room_id.in_(bindparam("room_ids", expanding=True)),
+    Reservation.reservation_date.in_(bindparam("dates", expanding=True)),
+    ACTIVE_RESERVATION,
+)
+
+# 대기열 승격 검증용: 룸의 그날 예약과 대기자들의 그날 예약을 한 번에 (취소 제외)
+_PROMOTION_SLOTS = select(
+    Reservation.user_id, Reservation.room_id, Reservation.start_time, Reservation.end_time
+).where(
+    Reservation.reservation_date == _reservation_date,
+    or_(Reservation.room_id == _room_id, Reservation.user_id.in_(bindparam("user_ids", expanding=True))),
+    ACTIVE_RESERVATION,
+)
+
+_INSERT_MANY = insert(Reservation).returning(
+    Reservation.id, Reservation.room_id, Reservation.reservation_date, Reservation.start_time
+)
+
+_CANCEL_CONFIRMED = (
+    update(Reservation)
+    .where(Reservation.id == _reservation_id, Reservation.status == "예약확정")
+    .values(status="취소")
+    .returning(Reservation.id)
+    .execution_options(synchronize_session=False)
+)
+
+_EXPIRE_FINISHED = (
+    update(Reservation)
+    .where(
+        # 부분 인덱스(ix_reservations_confirmed_end)를 쓰도록 상수로 비교
+        Reservation.status == literal_column("'예약확정'"),
+        or_(
+            Reservation.reservation_date < bindparam("today", type_=Date),
+            and_(
+                Reservation.reservation_date == bindparam("today", type_=Date),
+                Reservation.end_time <= bindparam("now_time", type_=Time),
+            ),
+        ),
+    )
+    .values(status="이용완료")
+    .execution_options(synchronize_session=False)
+)
+
+
+def _build_insert_if_available():
+    room = (
+        select(StudyRoom.name, StudyRoom.open_time, StudyRoom.close_time)
+        .where(StudyRoom.room_id == _room_id)
+        .cte("room")
+    )
+    user_day = (
+        select(
+            _BOOKED_MINUTES.label("daily_minutes"),
+            func.count().filter(and_(_OVERLAPS, ACTIVE_RESERVATION)).label("user_conflicts"),
+        )
+        .select_from(Reservation)
+        .where(Reservation.user_id == _user_id, Reservation.reservation_date == _reservation_date)
+        .cte("user_day")
+    )
+    room_slot = (
+        select(func.count().label("room_conflicts"))
+        .select_from(Reservation)
+        .where(
+            Reservation.room_id == _room_id,
+            Reservation.reservation_date == _reservation_date,
+            _OVERLAPS,
+            ACTIVE_RESERVATION,
+        )
+        .cte("room_slot")
+    )
+    inserted = (
+        insert(Reservation)
+        .from_select(
+            ["user_id", "room_id", "reservation_date", "start_time", "end_time", "status"],
+            select(
+                _user_id,
+                _room_id,
+                _reservation_date,
+                _start_time,
+                _end_time,
+                literal("예약확정", String),
+            )
+            .select_from(room)
+            .join(user_day, true())
+            .join(room_slot, true())
+            .where(
+                room.c.open_time <= _start_time,
+                room.c.close_time >= _end_time,
+                user_day.c.daily_minutes + bindparam("duration_minutes", type_=Integer)
+                <= bindparam("daily_limit_minutes", type_=Integer),
+                user_day.c.user_conflicts == 0,
+                room_slot.c.room_conflicts == 0,
+            ),
+        )
+        .returning(Reservation.id)
+        .cte("inserted")
+    )
+    return select(
+        room.c.name,
+        room.c.open_time,
+        room.c.close_time,
+        user_day.c.daily_minutes,
+        user_day.c.user_conflicts,
+        room_slot.c.room_conflicts,
+        inserted.c.id,
+    ).select_from(
+        user_day.join(room_slot, true()).outerjoin(room, true()).outerjoin(inserted, true())
+    )
+
+
+_INSERT_IF_AVAILABLE = _build_insert_if_available()
 
 
 class ReservationRepository:
@@ -12,53 +239,149 @@ class ReservationRepository:
         db.add(reservation)
         return reservation
 
-    async def find_by_user_id(self, db: AsyncSession, user_id: int):
-        stmt = (
-            select(Reservation)
-            .options(joinedload(Reservation.room))
-            .where(Reservation.user_id == user_id)
-            .order_by(Reservation.reservation_date.desc(), Reservation.start_time.desc())
+    def _user_params(self, user_id: int, limit: int | None, after: tuple[date, time, int] | None) -> dict:
+        params = {"user_id": user_id}
+        if after is not None:
+            params["after_date"], params["after_time"], params["after_id"] = after
+        if limit is not None:
+            params["limit"] = limit
+        return params
+
+    async def find_rows_by_user_id(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        limit: int | None = None,
+        after: tuple[date, time, int] | None = None,
+    ):
+        """(id, reservation_date, start_time, end_time, status, room_name) Row 목록.
+
+        (reservation_date, start_time, id) 내림차순. after 가 있으면 그 다음 행부터 (keyset)
+        """
+        result = await db.execute(
+            _USER_RESERVATION_ROWS[(after is not None, limit is not None)],
+            self._user_params(user_id, limit, after),
+        )
+        return result.all()
+
+    async def stream_rows_by_user_id(self, db: AsyncSession, user_id: int):
+        return await db.stream(
+            _USER_RESERVATION_ROWS[(False, False)],
+            {"user_id": user_id},
+            execution_options={"yield_per": STREAM_BATCH_SIZE},
+        )
+
+    async def find_history_rows_by_user_id(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        limit: int | None = None,
+        after: tuple[date, time, int] | None = None,
+    ):
+        """reservation_history 에서 find_rows_by_user_id 와 같은 순서/컬럼으로 조회 (보관된 예약은 모두 현재 예약보다 오래됐다)"""
+        result = await db.execute(
+            _HISTORY_ROWS[(after is not None, limit is not None)],
+            self._user_params(user_id, limit, after),
         )
-        result = await db.scalars(stmt)
         return result.all()
 
+    async def stream_history_rows_by_user_id(self, db: AsyncSession, user_id: int):
+        return await db.stream(
+            _HISTORY_ROWS[(False, False)],
+            {"user_id": user_id},
+            execution_options={"yield_per": STREAM_BATCH_SIZE},
+        )
+
     async def find_by_id(self, db: AsyncSession, reservation_id: int):
-        stmt = (
-            select(Reservation)
-            .options(joinedload(Reservation.room))
-            .where(Reservation.id == reservation_id)
+        return await db.scalar(_FIND_BY_ID, {"reservation_id": reservation_id})
+
+    async def find_conflict(
+        self, db: AsyncSession, room_id: int, reservation_date: date, start_time: time, end_time: time
+    ):
+        """룸에 [start_time, end_time) 과 겹치는 예약이 있으면 그중 한 건"""
+        return await db.scalar(
+            _FIND_CONFLICT,
+            {"room_id": room_id, "reservation_date": reservation_date, "start_time": start_time, "end_time": end_time},
         )
-        return await db.scalar(stmt)
 
-    async def find_conflict(self, db: AsyncSession, room_id: int, reservation_date: date, start_time: time):
-        stmt = select(Reservation).where(
-            and_(
-                Reservation.room_id == room_id,
-                Reservation.reservation_date == reservation_date,
-                Reservation.start_time == start_time,
-                Reservation.status != "취소",
-            )
+    async def sum_booked_minutes(self, db: AsyncSession, user_id: int, res_date: date) -> int:
+        """유저가 그날 예약확정 상태로 잡아 둔 이용 시간(분) 합계"""
+        return await db.scalar(
+            _SUM_BOOKED_MINUTES, {"user_id": user_id, "reservation_date": res_date}
+        ) or 0
+
+    async def find_user_conflict(
+        self, db: AsyncSession, user_id: int, reservation_date: date, start_time: time, end_time: time
+    ):
+        """같은 유저가 같은 날 겹치는 시간에 다른 방을 예약했는지 확인"""
+        return await db.scalar(
+            _FIND_USER_CONFLICT,
+            {"user_id": user_id, "reservation_date": reservation_date, "start_time": start_time, "end_time": end_time},
         )
-        return await db.scalar(stmt)
 
-    async def count_by_user_and_date(self, db: AsyncSession, user_id: int, res_date: date) -> int:
-        stmt = select(func.count()).select_from(Reservation).where(
-            Reservation.user_id == user_id,
-            Reservation.reservation_date == res_date,
-            Reservation.status == "예약확정",
+    async def find_user_day_slots(self, db: AsyncSession, user_ids: list[int], dates: list[date]):
+        """유저들의 (user_id, reservation_date, start_time, end_time) 목록 (취소 제외)"""
+        result = await db.execute(_USER_DAY_SLOTS, {"user_ids": user_ids, "dates": dates})
+        return result.all()
+
+    async def find_room_day_slots(self, db: AsyncSession, room_ids: list[int], dates: list[date]):
+        """룸들의 (room_id, reservation_date, start_time, end_time) 목록 (취소 제외)"""
+        result = await db.execute(_ROOM_DAY_SLOTS, {"room_ids": room_ids, "dates": dates})
+        return result.all()
+
+    async def find_promotion_slots(self, db: AsyncSession, room_id: int, reservation_date: date, user_ids: list[int]):
+        """룸의 그날 예약 + 유저들의 그날 예약. (user_id, room_id, start_time, end_time) 목록 (취소 제외)"""
+        result = await db.execute(
+            _PROMOTION_SLOTS, {"room_id": room_id, "reservation_date": reservation_date, "user_ids": user_ids}
         )
-        return await db.scalar(stmt) or 0
-    
-    async def find_user_conflict(self, db: AsyncSession, user_id: int, reservation_date: date, start_time: time):
-        """같은 유저가 같은 날 같은 시간에 다른 방을 예약했는지 확인"""
-        stmt = select(Reservation).where(
-            and_(
-                Reservation.user_id == user_id,
-                Reservation.reservation_date == reservation_date,
-                Reservation.start_time == start_time,
-                Reservation.status != "취소",
-            )
+        return result.all()
+
+    async def insert_many(self, db: AsyncSession, rows: list[dict]):
+        """여러 예약을 저장하고 (id, room_id, reservation_date, start_time) 반환.
+
+        파라미터 목록으로 실행하면 SQLAlchemy 가 다중 VALUES INSERT 한 문장으로 묶는다 (insertmanyvalues)
+        """
+        if not rows:
+            return []
+        result = await db.execute(_INSERT_MANY, rows)
+        return result.all()
+
+    async def cancel_confirmed(self, db: AsyncSession, reservation_id: int) -> bool:
+        """예약확정 상태일 때만 취소로 바꾸고, 바뀌었는지 반환"""
+        return await db.scalar(_CANCEL_CONFIRMED, {"reservation_id": reservation_id}) is not None
+
+    async def expire_finished(self, db: AsyncSession, now: datetime) -> int:
+        """종료 시간이 지난 예약확정 건을 이용완료로 일괄 변경"""
+        result = await db.execute(_EXPIRE_FINISHED, {"today": now.date(), "now_time": now.time()})
+        return result.rowcount
+
+    async def insert_if_available(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        room_id: int,
+        reservation_date: date,
+        start_time: time,
+        end_time: time,
+        daily_limit_minutes: int,
+    ):
+        """운영 시간 / 하루 한도(분) / 유저 구간 겹침 / 룸 구간 겹침 검증과 INSERT를 한 문장(CTE)으로 실행.
+
+        검증 결과와 함께 반환하며, 조건을 모두 통과한 경우에만 id 가 채워진다.
+        """
+        result = await db.execute(
+            _INSERT_IF_AVAILABLE,
+            {
+                "user_id": user_id,
+                "room_id": room_id,
+                "reservation_date": reservation_date,
+                "start_time": start_time,
+                "end_time": end_time,
+                "duration_minutes": to_minutes(end_time) - to_minutes(start_time),
+                "daily_limit_minutes": daily_limit_minutes,
+            },
         )
-        return await db.scalar(stmt)
+        return result.one()
+
 
 reservation_repository = ReservationRepository()
\ No newline at end of file
@@ -1,9 +1,43 @@
 # study_room/repositories/review_repository.py
 
+from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
-from sqlalchemy import select, func
+from sqlalchemy import select, bindparam, tuple_, DateTime, Integer
 from study_room.models.review import Review
+from study_room.models.user import User
+
+STREAM_BATCH_SIZE = 500
+
+# reservation_repository 와 같이 조회문은 모듈 로드 시 한 번만 만들고 값은 bindparam 으로 넘긴다
+_room_id = bindparam("room_id", type_=Integer)
+
+
+def _build_room_review_rows(keyset: bool, limited: bool):
+    """목록 응답에 필요한 컬럼만 조회 (Review / User 엔티티를 만들지 않는다)"""
+    stmt = (
+        select(Review.id, User.student_id, Review.rating, Review.content, Review.created_at)
+        .join(User, User.id == Review.user_id)
+        .where(Review.room_id == _room_id)
+        .order_by(Review.created_at.desc(), Review.id.desc())
+    )
+    if keyset:
+        stmt = stmt.where(
+            tuple_(Review.created_at, Review.id)
+            < tuple_(bindparam("after_created_at", type_=DateTime), bindparam("after_id", type_=Integer))
+        )
+    if limited:
+        stmt = stmt.limit(bindparam("limit", type_=Integer))
+    return stmt
+
+
+# (keyset 여부, limit 여부) -> 조회문
+_ROOM_REVIEW_ROWS = {
+    (keyset, limited): _build_room_review_rows(keyset, limited)
+    for keyset in (False, True)
+    for limited in (False, True)
+}
+
+_FIND_BY_RESERVATION_ID = select(Review).where(Review.reservation_id == bindparam("reservation_id", type_=Integer))
 
 
 class ReviewRepository:
@@ -11,23 +45,34 @@ class ReviewRepository:
         db.add(review)
         return review
 
-    async def find_by_room_id(self, db: AsyncSession, room_id: int):
-        stmt = (
-            select(Review)
-            .options(joinedload(Review.user))
-            .where(Review.room_id == room_id)
-            .order_by(Review.created_at.desc())
-        )
-        result = await db.scalars(stmt)
+    async def find_rows_by_room_id(
+        self,
+        db: AsyncSession,
+        room_id: int,
+        limit: int | None = None,
+        after: tuple[datetime, int] | None = None,
+    ):
+        """(id, student_id, rating, content, created_at) Row 목록.
+
+        (created_at, id) 내림차순. after 가 있으면 그 다음 행부터 (keyset)
+        """
+        params = {"room_id": room_id}
+        if after is not None:
+            params["after_created_at"], params["after_id"] = after
+        if limit is not None:
+            params["limit"] = limit
+        result = await db.execute(_ROOM_REVIEW_ROWS[(after is not None, limit is not None)], params)
         return result.all()
 
-    async def find_by_reservation_id(self, db: AsyncSession, reservation_id: int):
-        stmt = select(Review).where(Review.reservation_id == reservation_id)
-        return await db.scalar(stmt)
+    async def stream_rows_by_room_id(self, db: AsyncSession, room_id: int):
+        return await db.stream(
+            _ROOM_REVIEW_ROWS[(False, False)],
+            {"room_id": room_id},
+            execution_options={"yield_per": STREAM_BATCH_SIZE},
+        )
 
-    async def get_average_rating(self, db: AsyncSession, room_id: int) -> float:
-        result = await db.scalar(select(func.avg(Review.rating)).where(Review.room_id == room_id))
-        return round(float(result), 1) if result else 0.0
+    async def find_by_reservation_id(self, db: AsyncSession, reservation_id: int):
+        return await db.scalar(_FIND_BY_RESERVATION_ID, {"reservation_id": reservation_id})
 
 
-review_repository = ReviewRepository()
\ No newline at end of file
+review_repository = ReviewRepository()
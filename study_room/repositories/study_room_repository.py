@@ -1,40 +1,220 @@
 # study_room/repositories/study_room_repository.py
 
-from datetime import date, time
+from datetime import date
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
-from sqlalchemy import select, and_
-from study_room.models.study_room import StudyRoom
-from study_room.models.reservation import Reservation
+from sqlalchemy import select, update, and_, bindparam, case, cast, func, literal_column, Date, Float, Integer, Numeric
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from study_room.models.study_room import StudyRoom, Facility, RoomFacilityMap
+from study_room.models.reservation import Reservation, ACTIVE_RESERVATION
+from study_room.models.review import Review
+
+_room_id = bindparam("room_id", type_=Integer)
+_floor = bindparam("floor", type_=Integer)
+_capacity = bindparam("capacity", type_=Integer)
+_start_date = bindparam("start_date", type_=Date)
+_end_date = bindparam("end_date", type_=Date)
+
+
+def _filter_rooms(stmt, by_floor: bool, by_capacity: bool):
+    if by_floor:
+        stmt = stmt.where(StudyRoom.floor == _floor)
+    if by_capacity:
+        stmt = stmt.where(StudyRoom.max_capacity >= _capacity)
+    return stmt
+
+
+def _filter_params(floor: int | None, capacity: int | None) -> dict:
+    params = {}
+    if floor is not None:
+        params["floor"] = floor
+    if capacity is not None:
+        params["capacity"] = capacity
+    return params
+
+
+# reservation_repository 와 같이 조회문은 모듈 로드 시 한 번만 만들고 값은 bindparam 으로 넘긴다.
+# 선택 필터가 있는 조회는 (층 필터 여부, 인원 필터 여부) -> 조회문
+_FIND_ALL = {
+    (by_floor, by_capacity): _filter_rooms(
+        select(StudyRoom).options(selectinload(StudyRoom.facilities)), by_floor, by_capacity
+    )
+    for by_floor in (False, True)
+    for by_capacity in (False, True)
+}
+
+_FIND_BY_ID = select(StudyRoom).options(selectinload(StudyRoom.facilities)).where(StudyRoom.room_id == _room_id)
+
+
+def _build_catalog_fingerprint():
+    room_row = func.concat_ws(
+        "|",
+        StudyRoom.room_id, StudyRoom.name, StudyRoom.floor, StudyRoom.location,
+        StudyRoom.max_capacity, StudyRoom.rating, StudyRoom.open_time, StudyRoom.close_time,
+        StudyRoom.slot_minutes,
+    )
+    rooms_text = select(
+        func.string_agg(room_row, aggregate_order_by(literal_column("','"), StudyRoom.room_id))
+    ).scalar_subquery()
+    facility_row = func.concat_ws(":", RoomFacilityMap.room_id, Facility.facility_id, Facility.name)
+    facilities_text = (
+        select(
+            func.string_agg(
+                facility_row,
+                aggregate_order_by(literal_column("','"), RoomFacilityMap.room_id, Facility.facility_id),
+            )
+        )
+        .join(Facility, Facility.facility_id == RoomFacilityMap.facility_id)
+        .scalar_subquery()
+    )
+    return select(func.md5(func.concat_ws("#", rooms_text, facilities_text)))
+
+
+_CATALOG_FINGERPRINT = _build_catalog_fingerprint()
+
+_ALL_HOURS = select(StudyRoom.room_id, StudyRoom.open_time, StudyRoom.close_time, StudyRoom.slot_minutes)
+
+_HOURS_BY_IDS = select(
+    StudyRoom.room_id, StudyRoom.name, StudyRoom.open_time, StudyRoom.close_time, StudyRoom.slot_minutes
+).where(
+    StudyRoom.room_id.in_(bindparam("room_ids", expanding=True))
+)
+
+_RESERVED_SLOTS = select(
+    Reservation.room_id, Reservation.reservation_date, Reservation.start_time, Reservation.end_time
+).where(
+    Reservation.reservation_date >= _start_date,
+    Reservation.reservation_date <= _end_date,
+    ACTIVE_RESERVATION,
+)
+# room_id 지정 여부 -> 조회문
+_RESERVED_SLOTS_BY_ROOM = {False: _RESERVED_SLOTS, True: _RESERVED_SLOTS.where(Reservation.room_id == _room_id)}
+
+
+def _build_reservation_grid(by_floor: bool, by_capacity: bool):
+    stmt = (
+        select(
+            StudyRoom.room_id,
+            StudyRoom.name,
+            StudyRoom.open_time,
+            StudyRoom.close_time,
+            StudyRoom.slot_minutes,
+            Reservation.reservation_date,
+            func.array_agg(Reservation.start_time),
+            func.array_agg(Reservation.end_time),
+        )
+        .outerjoin(
+            Reservation,
+            and_(
+                Reservation.room_id == StudyRoom.room_id,
+                Reservation.reservation_date >= _start_date,
+                Reservation.reservation_date <= _end_date,
+                ACTIVE_RESERVATION,
+            ),
+        )
+        .group_by(StudyRoom.room_id, Reservation.reservation_date)
+        .order_by(StudyRoom.room_id)
+    )
+    return _filter_rooms(stmt, by_floor, by_capacity)
+
+
+_RESERVATION_GRID = {
+    (by_floor, by_capacity): _build_reservation_grid(by_floor, by_capacity)
+    for by_floor in (False, True)
+    for by_capacity in (False, True)
+}
+
+# UPDATE 문의 bindparam 은 컬럼 이름(room_id, rating)과 겹치면 안 된다
+_rating = bindparam("review_rating", type_=Float)
+_ADD_REVIEW_RATING = (
+    update(StudyRoom)
+    .where(StudyRoom.room_id == bindparam("target_room_id", type_=Integer))
+    .values(
+        rating_sum=StudyRoom.rating_sum + _rating,
+        review_count=StudyRoom.review_count + 1,
+        rating=func.round(
+            cast((StudyRoom.rating_sum + _rating) / (StudyRoom.review_count + 1), Numeric), 1
+        ),
+    )
+    .returning(StudyRoom.rating)
+    .execution_options(synchronize_session=False)
+)
 
 
 class StudyRoomRepository:
     async def find_all(self, db: AsyncSession, floor: int | None = None, capacity: int | None = None):
-        stmt = select(StudyRoom).options(selectinload(StudyRoom.facilities))
-        if floor is not None:
-            stmt = stmt.where(StudyRoom.floor == floor)
-        if capacity is not None:
-            stmt = stmt.where(StudyRoom.max_capacity >= capacity)
-        result = await db.scalars(stmt)
+        result = await db.scalars(
+            _FIND_ALL[(floor is not None, capacity is not None)], _filter_params(floor, capacity)
+        )
         return result.all()
 
     async def find_by_id(self, db: AsyncSession, room_id: int):
-        stmt = select(StudyRoom).options(selectinload(StudyRoom.facilities)).where(StudyRoom.room_id == room_id)
-        return await db.scalar(stmt)
+        return await db.scalar(_FIND_BY_ID, {"room_id": room_id})
 
-    async def get_reserved_times(self, db: AsyncSession, room_id: int, reservation_date: date) -> list[time]:
-        stmt = select(Reservation).where(
-            and_(
-                Reservation.room_id == room_id,
-                Reservation.reservation_date == reservation_date,
-                Reservation.status != "취소",
-            )
+    async def catalog_fingerprint(self, db: AsyncSession) -> str | None:
+        """룸/시설 카탈로그 전체의 해시. 값이 바뀌었으면 카탈로그를 다시 읽는다."""
+        return await db.scalar(_CATALOG_FINGERPRINT)
+
+    async def find_all_hours(self, db: AsyncSession):
+        result = await db.execute(_ALL_HOURS)
+        return result.all()
+
+    async def find_hours_by_ids(self, db: AsyncSession, room_ids: list[int]):
+        result = await db.execute(_HOURS_BY_IDS, {"room_ids": room_ids})
+        return result.all()
+
+    async def get_reserved_slots(
+        self, db: AsyncSession, start_date: date, end_date: date, room_id: int | None = None
+    ):
+        """기간 내 취소되지 않은 예약의 (room_id, reservation_date, start_time, end_time) 목록"""
+        params = {"start_date": start_date, "end_date": end_date}
+        if room_id is not None:
+            params["room_id"] = room_id
+        result = await db.execute(_RESERVED_SLOTS_BY_ROOM[room_id is not None], params)
+        return result.all()
+
+    async def find_reservation_grid(
+        self,
+        db: AsyncSession,
+        start_date: date,
+        end_date: date,
+        floor: int | None = None,
+        capacity: int | None = None,
+    ):
+        """룸별, 날짜별 예약된 시작/종료 시각 목록을 GROUP BY room_id, reservation_date 한 번으로 조회"""
+        result = await db.execute(
+            _RESERVATION_GRID[(floor is not None, capacity is not None)],
+            {"start_date": start_date, "end_date": end_date, **_filter_params(floor, capacity)},
         )
-        result = await db.scalars(stmt)
-        return [r.start_time for r in result.all()]
+        return result.all()
 
-    async def update_rating(self, db: AsyncSession, room: StudyRoom, new_rating: float):
-        room.rating = new_rating
+    async def add_review_rating(self, db: AsyncSession, room_id: int, rating: float) -> float | None:
+        """평점 집계에 리뷰 한 건을 더하고 새 평균을 반환 (UPDATE 한 번, 행 잠금으로 동시 작성에도 안전)"""
+        return await db.scalar(_ADD_REVIEW_RATING, {"target_room_id": room_id, "review_rating": rating})
+
+    async def reconcile_ratings(self, db: AsyncSession) -> int:
+        """reviews 테이블에서 모든 룸의 평점 집계를 다시 계산 (가끔 실행하는 관리 스크립트용이라 미리 만들어 두지 않는다)"""
+        reviews_of_room = Review.room_id == StudyRoom.room_id
+        result = await db.execute(
+            update(StudyRoom)
+            .values(
+                rating_sum=select(func.coalesce(func.sum(Review.rating), 0.0)).where(reviews_of_room).scalar_subquery(),
+                review_count=select(func.count()).select_from(Review).where(reviews_of_room).scalar_subquery(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await db.execute(
+            update(StudyRoom)
+            .values(
+                rating=case(
+                    (StudyRoom.review_count > 0,
+                     func.round(cast(StudyRoom.rating_sum / StudyRoom.review_count, Numeric), 1)),
+                    else_=0.0,
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
 
 
 study_room_repository = StudyRoomRepository()
\ No newline at end of file
@@ -1,7 +1,7 @@
 # study_room/repositories/user_repository.py
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update
 from study_room.models.user import User
 
 
@@ -17,6 +17,15 @@ class UserRepository:
     async def find_by_id(self, db: AsyncSession, user_id: int):
         return await db.get(User, user_id)
 
+    async def update_password(self, db: AsyncSession, user_id: int, hashed_password: str):
+        stmt = (
+            update(User)
+            .where(User.id == user_id)
+            .values(password=hashed_password)
+            .execution_options(synchronize_session=False)
+        )
+        await db.execute(stmt)
+
     async def exists_by_student_id(self, db: AsyncSession, student_id: str) -> bool:
         stmt = select(User).where(User.student_id == student_id)
         return await db.scalar(stmt) is not None
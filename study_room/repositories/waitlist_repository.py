@@ -0,0 +1,140 @@
+# study_room/repositories/waitlist_repository.py
+
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from sqlalchemy import select, update, and_, or_, case, func, bindparam, literal_column, Date, Time, Integer
+from study_room.models.waitlist import WaitlistEntry, WAITING
+from study_room.models.study_room import StudyRoom
+
+_user_id = bindparam("user_id", type_=Integer)
+_room_id = bindparam("room_id", type_=Integer)
+_entry_id = bindparam("entry_id", type_=Integer)
+_reservation_date = bindparam("reservation_date", type_=Date)
+_start_time = bindparam("start_time", type_=Time)
+_end_time = bindparam("end_time", type_=Time)
+
+# 순번 = 나와 겹치는 시간에 나보다 먼저(id 가 작거나 같은) 대기 중인 건 수.
+# ix_waitlist_slot_queue 부분 인덱스 범위 조회 한 번이라 대기열 전체를 읽지 않는다.
+_ahead = aliased(WaitlistEntry)
+_POSITION = case(
+    (
+        WAITING,
+        select(func.count())
+        .select_from(_ahead)
+        .where(
+            _ahead.room_id == WaitlistEntry.room_id,
+            _ahead.reservation_date == WaitlistEntry.reservation_date,
+            _ahead.start_time < WaitlistEntry.end_time,
+            _ahead.end_time > WaitlistEntry.start_time,
+            _ahead.status == literal_column("'대기'"),
+            _ahead.id <= WaitlistEntry.id,
+        )
+        .correlate(WaitlistEntry)
+        .scalar_subquery(),
+    ),
+    else_=None,
+).label("position")
+
+_ENTRY_ROWS = select(
+    WaitlistEntry.id,
+    WaitlistEntry.user_id,
+    WaitlistEntry.room_id,
+    StudyRoom.name.label("room_name"),
+    WaitlistEntry.reservation_date,
+    WaitlistEntry.start_time,
+    WaitlistEntry.end_time,
+    WaitlistEntry.status,
+    WaitlistEntry.reservation_id,
+    WaitlistEntry.created_at,
+    _POSITION,
+).join(StudyRoom, StudyRoom.room_id == WaitlistEntry.room_id)
+
+_FIND_ROW_BY_ID = _ENTRY_ROWS.where(WaitlistEntry.id == _entry_id)
+
+_FIND_ROWS_BY_USER_ID = (
+    _ENTRY_ROWS.where(WaitlistEntry.user_id == _user_id)
+    .order_by(WaitlistEntry.id.desc())
+    .limit(bindparam("limit", type_=Integer))
+)
+
+_FIND_BY_ID = select(WaitlistEntry).where(WaitlistEntry.id == _entry_id)
+
+# 승격 대상: 비운 구간과 겹치는 대기 건을 신청 순서대로 잠근다 (동시에 다른 취소가 같은 건을 승격하지 못하게)
+_QUEUE_FOR_UPDATE = (
+    select(WaitlistEntry)
+    .where(
+        WaitlistEntry.room_id == _room_id,
+        WaitlistEntry.reservation_date == _reservation_date,
+        WaitlistEntry.start_time < _end_time,
+        WaitlistEntry.end_time > _start_time,
+        WAITING,
+    )
+    .order_by(WaitlistEntry.id)
+    .with_for_update()
+)
+
+_CANCEL_WAITING = (
+    update(WaitlistEntry)
+    .where(WaitlistEntry.id == _entry_id, WAITING)
+    .values(status="취소")
+    .returning(WaitlistEntry.id)
+    .execution_options(synchronize_session=False)
+)
+
+_EXPIRE_STARTED = (
+    update(WaitlistEntry)
+    .where(
+        WAITING,
+        or_(
+            WaitlistEntry.reservation_date < bindparam("today", type_=Date),
+            and_(
+                WaitlistEntry.reservation_date == bindparam("today", type_=Date),
+                WaitlistEntry.start_time <= bindparam("now_time", type_=Time),
+            ),
+        ),
+    )
+    .values(status="만료")
+    .execution_options(synchronize_session=False)
+)
+
+
+class WaitlistRepository:
+    async def save(self, db: AsyncSession, entry: WaitlistEntry):
+        db.add(entry)
+        return entry
+
+    async def find_by_id(self, db: AsyncSession, entry_id: int):
+        return await db.scalar(_FIND_BY_ID, {"entry_id": entry_id})
+
+    async def find_row_by_id(self, db: AsyncSession, entry_id: int):
+        """(id, user_id, room_id, room_name, reservation_date, start_time, end_time, status, reservation_id, created_at, position) Row.
+
+        position 은 대기 중일 때만 채워지며 1부터 시작한다.
+        """
+        result = await db.execute(_FIND_ROW_BY_ID, {"entry_id": entry_id})
+        return result.one_or_none()
+
+    async def find_rows_by_user_id(self, db: AsyncSession, user_id: int, limit: int):
+        """find_row_by_id 와 같은 Row 목록 (최근 신청 순)"""
+        result = await db.execute(_FIND_ROWS_BY_USER_ID, {"user_id": user_id, "limit": limit})
+        return result.all()
+
+    async def find_queue_for_update(self, db: AsyncSession, room_id: int, reservation_date, start_time, end_time):
+        result = await db.scalars(
+            _QUEUE_FOR_UPDATE,
+            {"room_id": room_id, "reservation_date": reservation_date, "start_time": start_time, "end_time": end_time},
+        )
+        return result.all()
+
+    async def cancel_waiting(self, db: AsyncSession, entry_id: int) -> bool:
+        """대기 중인 건만 취소로 바꾸고, 바뀌었는지 반환"""
+        return await db.scalar(_CANCEL_WAITING, {"entry_id": entry_id}) is not None
+
+    async def expire_started(self, db: AsyncSession, now: datetime) -> int:
+        """시작 시각이 지난 슬롯의 대기 건을 만료로 일괄 변경"""
+        result = await db.execute(_EXPIRE_STARTED, {"today": now.date(), "now_time": now.time()})
+        return result.rowcount
+
+
+waitlist_repository = WaitlistRepository()
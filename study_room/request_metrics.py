@@ -0,0 +1,230 @@
+# study_room/request_metrics.py
+
+import logging
+import os
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+
+from dotenv import load_dotenv
+from sqlalchemy import event
+
+from async_database import engines, pool_metrics, pool_status, replica_pool_status
+
+load_dotenv(encoding="utf-8")
+# 라우트별 예산이 없을 때 쓰는 요청당 최대 쿼리 수
+QUERY_BUDGET_DEFAULT = int(os.getenv("QUERY_BUDGET_DEFAULT", "10"))
+# true 면 예산을 넘긴 요청에서 QueryBudgetExceeded 를 던진다 (테스트/벤치마크용)
+QUERY_BUDGET_STRICT = os.getenv("QUERY_BUDGET_STRICT", "false").lower() == "true"
+
+# (method, 라우트 경로) -> 요청당 최대 쿼리 수.
+# 인증이 필요한 라우트는 사용자 캐시가 비어 있을 때의 조회 1회를 포함한다.
+QUERY_BUDGETS: dict[tuple[str, str], int] = {
+    ("POST", "/auth/signup"): 3,
+    ("POST", "/auth/login"): 2,
+    ("GET", "/rooms"): 0,
+    ("GET", "/rooms/availability"): 1,
+    ("GET", "/rooms/{room_id}"): 1,
+    ("GET", "/rooms/{room_id}/available-times"): 2,
+    ("GET", "/rooms/{room_id}/reviews"): 2,
+    ("GET", "/rooms/{room_id}/availability/stream"): 1,
+    # 예약 생성/취소는 AVAILABILITY_EVENTS_BACKEND=postgres 일 때 쓰기 트랜잭션 안에서 pg_notify 를 한 번 더 실행한다
+    ("POST", "/reservations"): 4,
+    ("POST", "/reservations/batch"): 6,
+    ("GET", "/reservations/tickets/{ticket_id}"): 1,
+    # 파티션 모드의 마지막 페이지는 reservation_history 를 한 번 더 읽는다
+    ("GET", "/reservations/my"): 3,
+    # 대기자가 있으면 승격 검증/INSERT 까지 같은 요청에서 처리한다 (대기자 수와 무관하게 일정)
+    ("DELETE", "/reservations/{reservation_id}"): 7,
+    # postgres 이벤트 백엔드면 평점 변경 pg_notify 포함
+    ("POST", "/reviews"): 7,
+    ("POST", "/waitlist"): 6,
+    ("GET", "/waitlist/my"): 1,
+    ("GET", "/waitlist/{entry_id}"): 1,
+    ("DELETE", "/waitlist/{entry_id}"): 2,
+}
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21)
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(RuntimeError):
+    pass
+
+
+class RequestStats:
+    """요청 하나 동안 누적되는 DB 지표"""
+
+    __slots__ = ("queries", "db_seconds", "pool_wait_seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.pool_wait_seconds = 0.0
+
+
+_current: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+def current_stats() -> RequestStats | None:
+    return _current.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    stats = _current.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += elapsed
+
+
+# primary 와 복제본 쿼리를 함께 센다
+for _engine in engines:
+    event.listen(_engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(_engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _on_pool_wait(seconds: float):
+    stats = _current.get()
+    if stats is not None:
+        stats.pool_wait_seconds += seconds
+
+
+pool_metrics.wait_listeners.append(_on_pool_wait)
+
+
+class Histogram:
+    """라벨별 누적 버킷을 가진 Prometheus 히스토그램"""
+
+    def __init__(self, name: str, help: str, buckets: tuple[float, ...]):
+        self.name = name
+        self.help = help
+        self.buckets = buckets
+        # labels -> [버킷별 개수..., +Inf 개수], 합계
+        self._counts: dict[tuple[str, ...], list[int]] = {}
+        self._sums: dict[tuple[str, ...], float] = {}
+
+    def observe(self, labels: tuple[str, ...], value: float):
+        counts = self._counts.get(labels)
+        if counts is None:
+            counts = self._counts[labels] = [0] * (len(self.buckets) + 1)
+            self._sums[labels] = 0.0
+        counts[bisect_left(self.buckets, value)] += 1
+        self._sums[labels] += value
+
+    def render(self, label_names: tuple[str, ...]) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labels, counts in self._counts.items():
+            base = ",".join(f'{k}="{v}"' for k, v in zip(label_names, labels))
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{base},le="{bound}"}} {cumulative}')
+            cumulative += counts[-1]
+            lines.append(f'{self.name}_bucket{{{base},le="+Inf"}} {cumulative}')
+            lines.append(f"{self.name}_sum{{{base}}} {self._sums[labels]}")
+            lines.append(f"{self.name}_count{{{base}}} {cumulative}")
+        return lines
+
+
+class RequestMetrics:
+    """라우트별 지연 시간 / 쿼리 수 / DB 시간 / 풀 대기 시간 히스토그램과 예산 초과 횟수"""
+
+    LABELS = ("method", "route")
+
+    def __init__(self):
+        self.duration = Histogram("http_request_duration_seconds", "요청 처리 시간", DURATION_BUCKETS)
+        self.queries = Histogram("db_queries_per_request", "요청당 실행한 쿼리 수", QUERY_COUNT_BUCKETS)
+        self.db_time = Histogram("db_time_seconds", "요청당 DB 실행 시간", DURATION_BUCKETS)
+        self.pool_wait = Histogram("db_pool_wait_seconds", "요청당 커넥션 체크아웃 대기 시간", DURATION_BUCKETS)
+        self.requests: dict[tuple[str, str, str], int] = {}
+        self.budget_exceeded: dict[tuple[str, str], int] = {}
+
+    def record(self, method: str, route: str, status: int, total: float, stats: RequestStats):
+        labels = (method, route)
+        self.duration.observe(labels, total)
+        self.queries.observe(labels, stats.queries)
+        self.db_time.observe(labels, stats.db_seconds)
+        self.pool_wait.observe(labels, stats.pool_wait_seconds)
+        key = (method, route, str(status))
+        self.requests[key] = self.requests.get(key, 0) + 1
+
+    def check_budget(self, method: str, route: str, stats: RequestStats):
+        budget = QUERY_BUDGETS.get((method, route), QUERY_BUDGET_DEFAULT)
+        if stats.queries <= budget:
+            return
+        key = (method, route)
+        self.budget_exceeded[key] = self.budget_exceeded.get(key, 0) + 1
+        message = f"{method} {route}: 쿼리 {stats.queries}회 (예산 {budget}회)"
+        if QUERY_BUDGET_STRICT:
+            raise QueryBudgetExceeded(message)
+        logger.warning("쿼리 예산 초과 - %s", message)
+
+    def render(self) -> str:
+        lines = ["# HELP http_requests_total 처리한 요청 수", "# TYPE http_requests_total counter"]
+        for (method, route, status), count in self.requests.items():
+            lines.append(f'http_requests_total{{method="{method}",route="{route}",status="{status}"}} {count}')
+        for histogram in (self.duration, self.queries, self.db_time, self.pool_wait):
+            lines += histogram.render(self.LABELS)
+        lines += ["# HELP query_budget_exceeded_total 쿼리 예산을 넘긴 요청 수", "# TYPE query_budget_exceeded_total counter"]
+        for (method, route), count in self.budget_exceeded.items():
+            lines.append(f'query_budget_exceeded_total{{method="{method}",route="{route}"}} {count}')
+        pool = pool_status()
+        for key in ("in_use", "idle", "overflow"):
+            lines += [f"# TYPE db_pool_{key} gauge", f"db_pool_{key} {pool[key]}"]
+        lines += ["# TYPE db_pool_timeouts_total counter", f"db_pool_timeouts_total {pool['timeouts']}"]
+        replica = replica_pool_status()
+        if replica is not None:
+            for key in ("in_use", "idle", "overflow"):
+                lines += [f"# TYPE db_replica_pool_{key} gauge", f"db_replica_pool_{key} {replica[key]}"]
+        return "\n".join(lines) + "\n"
+
+
+request_metrics = RequestMetrics()
+
+
+class RequestMetricsMiddleware:
+    """요청마다 쿼리 수 / DB 시간 / 풀 대기 시간을 모아 Server-Timing 헤더와 /metrics 에 반영하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                total_ms = (time.perf_counter() - start) * 1000
+                timing = (
+                    f'db;dur={stats.db_seconds * 1000:.3f};desc="{stats.queries} queries", '
+                    f"pool;dur={stats.pool_wait_seconds * 1000:.3f}, "
+                    f"total;dur={total_ms:.3f}"
+                )
+                message = {**message, "headers": [*message.get("headers", []), (b"server-timing", timing.encode())]}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            # 매칭된 라우트의 경로 템플릿을 라벨로 쓴다 (404 등은 하나로 묶어 라벨 수를 제한)
+            route = scope.get("route")
+            route_path = getattr(route, "path", "unmatched")
+            method = scope["method"]
+            request_metrics.record(method, route_path, status_code, time.perf_counter() - start, stats)
+        request_metrics.check_budget(method, route_path, stats)
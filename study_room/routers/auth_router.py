@@ -5,16 +5,26 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from async_database import get_async_db
 from study_room.services.auth_service import auth_service
 from study_room.schemas.auth import UserCreate, UserResponse, UserLogin, TokenResponse
+from study_room.rate_limit import rate_limit
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
 
-@router.post("/signup", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/signup",
+    response_model=UserResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(rate_limit("signup", per_user=False))],
+)
 async def signup(data: UserCreate, db: AsyncSession = Depends(get_async_db)):
     return await auth_service.signup(db, data)
 
 
-@router.post("/login", response_model=TokenResponse)
+@router.post(
+    "/login",
+    response_model=TokenResponse,
+    dependencies=[Depends(rate_limit("login", per_user=False, account_field="student_id"))],
+)
 async def login(data: UserLogin, db: AsyncSession = Depends(get_async_db)):
     access_token = await auth_service.login(db, data)
     return {"access_token": access_token}
\ No newline at end of file
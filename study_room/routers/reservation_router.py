@@ -1,34 +1,101 @@
 # study_room/routers/reservation_router.py
 
-from fastapi import APIRouter, Depends, status
+from typing import Literal
+from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from async_database import get_async_db
 from study_room.services.reservation_service import reservation_service
-from study_room.schemas.reservation import ReservationCreate, ReservationResponse, MyReservationsResponse
-from study_room.dependencies import get_current_user
+from study_room.services.booking_queue import booking_queue, BOOKING_QUEUE_WAIT_SECONDS
+from study_room.schemas.reservation import (
+    ReservationCreate,
+    ReservationResponse,
+    MyReservationsResponse,
+    ReservationBatchCreate,
+    ReservationBatchResponse,
+    BookingTicketResponse,
+)
+from study_room.dependencies import get_current_user, get_current_read_user, get_async_read_db
 from study_room.models.user import User
+from study_room.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from study_room.rate_limit import rate_limit
+from study_room.serialization import render_json
 
 router = APIRouter(prefix="/reservations", tags=["Reservation"])
 
+MY_RESERVATIONS_ADAPTER = TypeAdapter(MyReservationsResponse)
 
-@router.post("", response_model=ReservationResponse, status_code=status.HTTP_201_CREATED)
+
+@router.post(
+    "",
+    response_model=ReservationResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_202_ACCEPTED: {"model": BookingTicketResponse, "description": "대기열 모드에서 접수됨"}},
+    dependencies=[Depends(rate_limit("reservation_create"))],
+)
 async def create_reservation(
     data: ReservationCreate,
+    wait: bool = Query(False, description="대기열 모드에서 처리 결과를 기다렸다가 201/409 등으로 응답"),
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
-    return await reservation_service.create_reservation(db, data, current_user)
+    if not booking_queue.enabled:
+        return await reservation_service.create_reservation(db, data, current_user)
+    # 대기열 모드: 룸별 줄에 넣고 접수 번호를 돌려준다 (결과는 GET /reservations/tickets/{ticket_id})
+    ticket = await booking_queue.submit(db, data, current_user)
+    if wait and await booking_queue.wait(ticket, BOOKING_QUEUE_WAIT_SECONDS):
+        return booking_queue.outcome(ticket)
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=booking_queue.to_response(ticket).model_dump(mode="json"),
+        headers={"Location": f"/reservations/tickets/{ticket.id}"},
+    )
+
+
+# 항목별 성공/실패를 본문으로 돌려주므로 일부가 실패해도 200
+@router.post("/batch", response_model=ReservationBatchResponse, dependencies=[Depends(rate_limit("reservation_batch"))])
+async def create_reservations_batch(
+    data: ReservationBatchCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    return await reservation_service.create_reservations_batch(db, data, current_user)
 
 
 @router.get("/my", response_model=MyReservationsResponse)
 async def read_my_reservations(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor"),
+    format: Literal["json", "ndjson"] = Query("json", description="ndjson: 전체 예약을 한 줄씩 스트리밍"),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_read_user),
+):
+    if format == "ndjson":
+        return StreamingResponse(
+            reservation_service.stream_my_reservations(db, current_user),
+            media_type="application/x-ndjson",
+        )
+    reservations = await reservation_service.read_my_reservations(db, current_user, limit, cursor)
+    return render_json(MY_RESERVATIONS_ADAPTER, reservations, response)
+
+
+@router.get("/tickets/{ticket_id}", response_model=BookingTicketResponse)
+async def read_booking_ticket(
+    ticket_id: str,
+    wait: bool = Query(False, description="처리 중이면 결과가 나올 때까지 잠시 기다림"),
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
-    return await reservation_service.read_my_reservations(db, current_user)
+    return await booking_queue.read_ticket(db, ticket_id, current_user, wait)
 
 
-@router.delete("/{reservation_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/{reservation_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(rate_limit("reservation_cancel"))],
+)
 async def cancel_reservation(
     reservation_id: int,
     db: AsyncSession = Depends(get_async_db),
@@ -7,11 +7,17 @@ from study_room.services.review_service import review_service
 from study_room.schemas.review import ReviewCreate, ReviewResponse
 from study_room.dependencies import get_current_user
 from study_room.models.user import User
+from study_room.rate_limit import rate_limit
 
 router = APIRouter(prefix="/reviews", tags=["Review"])
 
 
-@router.post("", response_model=ReviewResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "",
+    response_model=ReviewResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(rate_limit("review_create"))],
+)
 async def create_review(
     data: ReviewCreate,
     db: AsyncSession = Depends(get_async_db),
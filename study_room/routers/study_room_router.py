@@ -1,40 +1,119 @@
 # study_room/routers/study_room_router.py
 
 from datetime import date
-from fastapi import APIRouter, Depends, Query
+from typing import Literal
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from async_database import get_async_db
+from study_room.dependencies import get_async_read_db
 from study_room.services.study_room_service import study_room_service
 from study_room.services.review_service import review_service
-from study_room.schemas.study_room import StudyRoomListResponse, StudyRoomDetailResponse, AvailableTimesResponse
+from study_room.schemas.study_room import (
+    StudyRoomListResponse,
+    StudyRoomDetailResponse,
+    AvailableTimesResponse,
+    AvailabilityGridResponse,
+)
 from study_room.schemas.review import RoomReviewsResponse
+from study_room.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from study_room.conditional import make_etag, etag_matches, not_modified, set_cache_headers, cache_headers
+from study_room.serialization import render_json
 
 router = APIRouter(prefix="/rooms", tags=["StudyRoom"])
 
+ROOM_LIST_ADAPTER = TypeAdapter(list[StudyRoomListResponse])
+ROOM_REVIEWS_ADAPTER = TypeAdapter(RoomReviewsResponse)
+
 
 @router.get("", response_model=list[StudyRoomListResponse])
 async def read_rooms(
+    request: Request,
+    response: Response,
     floor: int | None = Query(None, description="층 필터 (4 또는 5)"),
     capacity: int | None = Query(None, description="최소 수용 인원"),
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    etag = make_etag(request, study_room_service.catalog_version())
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_cache_headers(response, etag)
+    rooms = await study_room_service.read_rooms(db, floor=floor, capacity=capacity)
+    return render_json(ROOM_LIST_ADAPTER, rooms, response)
+
+
+# /{room_id} 보다 먼저 등록해야 한다
+@router.get("/availability", response_model=AvailabilityGridResponse)
+async def read_availability_grid(
+    floor: int | None = Query(None, description="층 필터 (4 또는 5)"),
+    capacity: int | None = Query(None, description="최소 수용 인원"),
+    start_date: date | None = Query(None, description="시작 날짜 (기본값: 오늘)"),
+    end_date: date | None = Query(None, description="종료 날짜 (기본값: 오늘 + 7일)"),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
-    return await study_room_service.read_rooms(db, floor=floor, capacity=capacity)
+    return await study_room_service.read_availability_grid(db, floor, capacity, start_date, end_date)
 
 
 @router.get("/{room_id}", response_model=StudyRoomDetailResponse)
-async def read_room(room_id: int, db: AsyncSession = Depends(get_async_db)):
+async def read_room(
+    room_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    etag = make_etag(request, study_room_service.catalog_version())
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_cache_headers(response, etag)
     return await study_room_service.read_room_detail(db, room_id)
 
 
 @router.get("/{room_id}/available-times", response_model=AvailableTimesResponse)
 async def read_available_times(
     room_id: int,
+    request: Request,
+    response: Response,
     date: date = Query(..., description="조회할 날짜 (YYYY-MM-DD)"),
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
+    etag = make_etag(request, study_room_service.available_times_version(room_id))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_cache_headers(response, etag)
     return await study_room_service.read_available_times(db, room_id, date)
 
 
+# 예약 가능 시간을 폴링하는 대신 변경분을 Server-Sent Events 로 받는다
+@router.get("/{room_id}/availability/stream")
+async def stream_availability(room_id: int, db: AsyncSession = Depends(get_async_db)):
+    return StreamingResponse(
+        await study_room_service.stream_availability(db, room_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/{room_id}/reviews", response_model=RoomReviewsResponse)
-async def read_room_reviews(room_id: int, db: AsyncSession = Depends(get_async_db)):
-    return await review_service.read_room_reviews(db, room_id)
\ No newline at end of file
+async def read_room_reviews(
+    room_id: int,
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor"),
+    format: Literal["json", "ndjson"] = Query("json", description="ndjson: 전체 리뷰를 한 줄씩 스트리밍"),
+    # ETag 는 primary 기준 버전이므로 본문도 primary 에서 읽는다 (지연된 복제본의 본문이 새 ETag 로 캐시되지 않도록)
+    db: AsyncSession = Depends(get_async_db),
+):
+    etag = make_etag(request, study_room_service.room_version(room_id))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    if format == "ndjson":
+        return StreamingResponse(
+            await review_service.stream_room_reviews(db, room_id),
+            media_type="application/x-ndjson",
+            headers=cache_headers(etag),
+        )
+    set_cache_headers(response, etag)
+    reviews = await review_service.read_room_reviews(db, room_id, limit, cursor)
+    return render_json(ROOM_REVIEWS_ADAPTER, reviews, response)
\ No newline at end of file
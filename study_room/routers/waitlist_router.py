@@ -0,0 +1,54 @@
+# study_room/routers/waitlist_router.py
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from async_database import get_async_db
+from study_room.services.waitlist_service import waitlist_service
+from study_room.schemas.waitlist import WaitlistCreate, WaitlistResponse, MyWaitlistResponse
+from study_room.dependencies import get_current_user, get_current_read_user, get_async_read_db
+from study_room.models.user import User
+from study_room.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from study_room.rate_limit import rate_limit
+
+router = APIRouter(prefix="/waitlist", tags=["Waitlist"])
+
+
+@router.post(
+    "",
+    response_model=WaitlistResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(rate_limit("waitlist_join"))],
+)
+async def join_waitlist(
+    data: WaitlistCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    return await waitlist_service.join(db, data, current_user)
+
+
+@router.get("/my", response_model=MyWaitlistResponse)
+async def read_my_waitlist(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="최근 신청 순 최대 개수"),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_read_user),
+):
+    return await waitlist_service.read_my_entries(db, current_user, limit)
+
+
+@router.get("/{entry_id}", response_model=WaitlistResponse)
+async def read_waitlist_entry(
+    entry_id: int,
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_read_user),
+):
+    return await waitlist_service.read_entry(db, entry_id, current_user)
+
+
+@router.delete("/{entry_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def leave_waitlist(
+    entry_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    await waitlist_service.leave(db, entry_id, current_user)
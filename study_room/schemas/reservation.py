@@ -1,13 +1,22 @@
 # study_room/schemas/reservation.py
 
-from datetime import date
-from pydantic import BaseModel, ConfigDict
+from datetime import date, timedelta
+from typing import Literal
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+# 한 번의 일괄 예약 요청에서 처리할 수 있는 최대 항목 수 / 반복 규칙의 최대 기간(일)
+MAX_BATCH_SIZE = 30
+MAX_RECURRENCE_DAYS = 31
+# 이용 시간(분) 상한. 예약은 하루를 넘을 수 없다 (큰 값이 날짜 계산에서 OverflowError 를 내지 않도록 입력에서 막는다)
+MAX_DURATION_MINUTES = 24 * 60
 
 
 class ReservationCreate(BaseModel):
     room_id: int
     reservation_date: date
     start_time: str  # "14:00" 형태
+    # 이용 시간(분). 생략하면 룸의 슬롯 길이 한 칸, 지정하면 슬롯 길이의 배수여야 한다
+    duration_minutes: int | None = Field(None, gt=0, le=MAX_DURATION_MINUTES)
 
 
 class ReservationResponse(BaseModel):
@@ -22,4 +31,85 @@ class ReservationResponse(BaseModel):
 
 
 class MyReservationsResponse(BaseModel):
-    reservations: list[ReservationResponse]
\ No newline at end of file
+    reservations: list[ReservationResponse]
+    next_cursor: str | None = None  # 다음 페이지 요청 시 cursor 로 전달 (없으면 마지막 페이지)
+
+
+class RecurrenceRule(BaseModel):
+    room_id: int
+    start_time: str  # "14:00" 형태
+    duration_minutes: int | None = Field(None, gt=0, le=MAX_DURATION_MINUTES)
+    start_date: date
+    end_date: date
+    weekdays: list[int] = Field(min_length=1, description="반복 요일 (0=월 ~ 6=일)")
+
+    @model_validator(mode="after")
+    def check_range(self):
+        if self.end_date < self.start_date:
+            raise ValueError("end_date 는 start_date 이후여야 합니다.")
+        if (self.end_date - self.start_date).days >= MAX_RECURRENCE_DAYS:
+            raise ValueError(f"반복 기간은 최대 {MAX_RECURRENCE_DAYS}일입니다.")
+        if any(d < 0 or d > 6 for d in self.weekdays):
+            raise ValueError("weekdays 는 0(월) ~ 6(일) 사이여야 합니다.")
+        return self
+
+    def expand(self) -> list[ReservationCreate]:
+        weekdays = set(self.weekdays)
+        days = (self.end_date - self.start_date).days + 1
+        return [
+            ReservationCreate(
+                room_id=self.room_id, reservation_date=d, start_time=self.start_time, duration_minutes=self.duration_minutes
+            )
+            for d in (self.start_date + timedelta(days=i) for i in range(days))
+            if d.weekday() in weekdays
+        ]
+
+
+class ReservationBatchCreate(BaseModel):
+    """items(예약 목록) 또는 recurrence(반복 규칙) 중 하나만 지정"""
+
+    items: list[ReservationCreate] | None = Field(None, min_length=1, max_length=MAX_BATCH_SIZE)
+    recurrence: RecurrenceRule | None = None
+    atomic: bool = Field(True, description="true: 하나라도 실패하면 전부 예약하지 않음 / false: 가능한 항목만 예약")
+
+    @model_validator(mode="after")
+    def check_source(self):
+        if (self.items is None) == (self.recurrence is None):
+            raise ValueError("items 와 recurrence 중 하나만 지정해야 합니다.")
+        if self.recurrence is not None and len(self.recurrence.expand()) > MAX_BATCH_SIZE:
+            raise ValueError(f"한 번에 최대 {MAX_BATCH_SIZE}건까지 예약할 수 있습니다.")
+        return self
+
+    def expand(self) -> list[ReservationCreate]:
+        return self.items if self.items is not None else self.recurrence.expand()
+
+
+class ReservationBatchItemResult(BaseModel):
+    index: int  # 요청(또는 반복 규칙을 펼친 목록)에서의 순서
+    room_id: int
+    reservation_date: date
+    start_time: str
+    success: bool
+    reservation: ReservationResponse | None = None
+    detail: str | None = None  # 실패 사유
+
+
+class ReservationBatchResponse(BaseModel):
+    atomic: bool
+    created: int
+    failed: int
+    results: list[ReservationBatchItemResult]
+
+
+class BookingTicketResponse(BaseModel):
+    """대기열 예약 모드(BOOKING_QUEUE_ENABLED)에서 POST /reservations 가 돌려주는 접수 번호"""
+
+    ticket_id: str
+    status: Literal["접수", "완료", "실패"]
+    room_id: int
+    reservation_date: date
+    start_time: str
+    position: int | None = None  # 접수 상태일 때 같은 룸에서 앞에 남은 요청 수
+    reservation: ReservationResponse | None = None  # 완료
+    status_code: int | None = None  # 실패 시 바로 예약했다면 받았을 상태 코드
+    detail: str | None = None  # 실패 사유
@@ -33,4 +33,5 @@ class ReviewListItem(BaseModel):
 class RoomReviewsResponse(BaseModel):
     room_id: int
     average_rating: float
-    reviews: list[ReviewListItem]
\ No newline at end of file
+    reviews: list[ReviewListItem]
+    next_cursor: str | None = None  # 다음 페이지 요청 시 cursor 로 전달 (없으면 마지막 페이지)
\ No newline at end of file
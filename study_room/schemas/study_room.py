@@ -1,6 +1,6 @@
 # study_room/schemas/study_room.py
 
-from datetime import time
+from datetime import date, time
 from pydantic import BaseModel, ConfigDict
 
 
@@ -32,6 +32,7 @@ class StudyRoomDetailResponse(BaseModel):
     rating: float
     open_time: time
     close_time: time
+    slot_minutes: int  # 예약 단위(분)
     facilities: list[str]
 
     model_config = ConfigDict(from_attributes=True)
@@ -45,4 +46,33 @@ class AvailableTimeSlot(BaseModel):
 class AvailableTimesResponse(BaseModel):
     room_id: int
     date: str
-    available_times: list[AvailableTimeSlot]
\ No newline at end of file
+    available_times: list[AvailableTimeSlot]
+
+
+class AvailabilitySnapshot(BaseModel):
+    """실시간 스트림의 snapshot 이벤트: 예약 가능 기간 전체의 날짜별 슬롯"""
+    room_id: int
+    days: list[AvailableTimesResponse]
+
+
+class SlotAvailabilityEvent(BaseModel):
+    """실시간 스트림의 slot 이벤트: 예약 구간 [time, end_time) 에 걸친 슬롯들의 변경 후 상태"""
+    room_id: int
+    date: str
+    time: str
+    end_time: str
+    available: bool
+
+class RoomAvailabilityGrid(BaseModel):
+    room_id: int
+    name: str
+    slots: list[str]  # 슬롯 시작 시각 ("09:00", ...)
+    # dates 순서대로 날짜별 예약 비트마스크 (비트 i = slots[i] 예약됨)
+    reserved: list[int]
+
+
+class AvailabilityGridResponse(BaseModel):
+    start_date: date
+    end_date: date
+    dates: list[date]
+    rooms: list[RoomAvailabilityGrid]
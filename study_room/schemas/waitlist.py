@@ -0,0 +1,29 @@
+# study_room/schemas/waitlist.py
+
+from datetime import date, datetime
+from pydantic import BaseModel, Field
+from study_room.schemas.reservation import MAX_DURATION_MINUTES
+
+
+class WaitlistCreate(BaseModel):
+    room_id: int
+    reservation_date: date
+    start_time: str  # "14:00" 형태
+    duration_minutes: int | None = Field(None, gt=0, le=MAX_DURATION_MINUTES)  # 생략하면 룸의 슬롯 길이 한 칸
+
+
+class WaitlistResponse(BaseModel):
+    id: int
+    room_id: int
+    room_name: str
+    reservation_date: date
+    start_time: str
+    end_time: str
+    status: str  # 대기 / 예약완료 / 취소 / 만료
+    position: int | None = None  # 대기 순번 (1부터, 대기 중일 때만)
+    reservation_id: int | None = None  # 예약완료로 전환된 경우 만들어진 예약
+    created_at: datetime
+
+
+class MyWaitlistResponse(BaseModel):
+    entries: list[WaitlistResponse]
@@ -0,0 +1,29 @@
+# study_room/serialization.py
+
+import os
+
+from dotenv import load_dotenv
+from fastapi import Response
+from pydantic import TypeAdapter
+
+load_dotenv(encoding="utf-8")
+# true 면 목록 응답을 이미 만들어진 모델에서 바로 JSON bytes 로 직렬화한다
+FAST_JSON_RESPONSES = os.getenv("FAST_JSON_RESPONSES", "true").lower() == "true"
+
+
+def render_json(adapter: TypeAdapter, content, response: Response):
+    """서비스가 만든(이미 검증된) 응답 모델을 TypeAdapter.dump_json 으로 바로 직렬화한 Response 를 반환.
+
+    FastAPI 의 response_model 재검증 -> 파이썬 객체 변환 -> json.dumps 단계를 건너뛰며,
+    결과 바이트는 기본 JSONResponse 와 같다. 꺼져 있으면 content 를 그대로 돌려 기존 경로를 탄다.
+    response 에 설정된 헤더(ETag 등)와 상태 코드는 그대로 옮긴다.
+    """
+    if not FAST_JSON_RESPONSES:
+        return content
+    rendered = Response(
+        content=adapter.dump_json(content, by_alias=True),
+        media_type="application/json",
+        status_code=response.status_code or 200,
+    )
+    rendered.headers.raw.extend(response.headers.raw)
+    return rendered
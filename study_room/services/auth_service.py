@@ -3,13 +3,16 @@
 import os
 from datetime import datetime, timedelta, timezone
 
-import bcrypt
 import jwt
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
 from fastapi import HTTPException, status
 from dotenv import load_dotenv
 
+from study_room.cache import TTLCache
 from study_room.repositories.user_repository import user_repository
+from study_room.services.password_hasher import password_hasher
 from study_room.models.user import User
 from study_room.schemas.auth import UserCreate, UserLogin
 
@@ -17,28 +20,55 @@ load_dotenv(encoding="utf-8")
 SECRET_KEY = os.getenv("JWT_SECRET_KEY")
 ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 EXPIRE_MINUTES = int(os.getenv("JWT_EXPIRE_MINUTES", "60"))
+AUTH_CACHE_SIZE = int(os.getenv("AUTH_CACHE_SIZE", "10000"))
+AUTH_USER_CACHE_TTL_SECONDS = int(os.getenv("AUTH_USER_CACHE_TTL_SECONDS", "300"))
+
+# 캐시하는 사용자 컬럼 (비밀번호 해시는 인증 이후에 쓰지 않으므로 메모리에 두지 않는다)
+_USER_COLUMNS = ("id", "student_id", "name", "created_at")
 
 
 class AuthService:
-    def _hash_password(self, password: str) -> str:
-        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    def __init__(self):
+        # token -> user_id (토큰의 exp 에 만료), user_id -> 사용자 컬럼 스냅샷
+        self.token_cache = TTLCache(AUTH_CACHE_SIZE, ttl=EXPIRE_MINUTES * 60)
+        self.user_cache = TTLCache(AUTH_CACHE_SIZE, ttl=AUTH_USER_CACHE_TTL_SECONDS)
+
+    def invalidate_user(self, user_id: int):
+        self.user_cache.pop(user_id)
+
+    def render(self) -> str:
+        """Prometheus text exposition format (토큰 / 사용자 캐시 적중 수)"""
+        lines = ["# HELP auth_cache_requests_total 인증 캐시 조회 수", "# TYPE auth_cache_requests_total counter"]
+        caches = (("token", self.token_cache), ("user", self.user_cache))
+        for name, cache in caches:
+            lines.append(f'auth_cache_requests_total{{cache="{name}",result="hit"}} {cache.hits}')
+            lines.append(f'auth_cache_requests_total{{cache="{name}",result="miss"}} {cache.misses}')
+        lines += ["# TYPE auth_cache_evictions_total counter"]
+        lines += [f'auth_cache_evictions_total{{cache="{name}"}} {cache.evictions}' for name, cache in caches]
+        lines += ["# TYPE auth_cache_size gauge"]
+        lines += [f'auth_cache_size{{cache="{name}"}} {len(cache)}' for name, cache in caches]
+        return "\n".join(lines) + "\n"
+
+    async def _hash_password(self, password: str) -> str:
+        return await password_hasher.hash(password)
 
-    def _verify_password(self, password: str, hashed: str) -> bool:
-        return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+    async def _verify_password(self, password: str, hashed: str) -> bool:
+        return await password_hasher.verify(password, hashed)
 
-    def _create_access_token(self, user_id: int) -> str:
+    def create_access_token(self, user_id: int) -> str:
         expire = datetime.now(timezone.utc) + timedelta(minutes=EXPIRE_MINUTES)
         payload = {"sub": str(user_id), "exp": expire}
         return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
 
     async def signup(self, db: AsyncSession, data: UserCreate):
+        # 해싱은 트랜잭션 밖에서 (커넥션을 잡은 채로 기다리지 않도록)
+        hashed_password = await self._hash_password(data.password)
         async with db.begin():
             if await user_repository.exists_by_student_id(db, data.student_id):
                 raise HTTPException(
                     status_code=status.HTTP_409_CONFLICT,
                     detail="이미 등록된 학번입니다.",
                 )
-            hashed_password = self._hash_password(data.password)
             new_user = User(
                 student_id=data.student_id,
                 password=hashed_password,
@@ -51,33 +81,82 @@ class AuthService:
 
     async def login(self, db: AsyncSession, data: UserLogin) -> str:
         user = await user_repository.find_by_student_id(db, data.student_id)
+        # 조회로 시작된 읽기 트랜잭션을 닫는다 (해싱을 기다리는 동안 커넥션을 잡지 않도록)
+        await db.commit()
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="학번 또는 비밀번호가 올바르지 않습니다.",
             )
-        if not self._verify_password(data.password, user.password):
+        if not await self._verify_password(data.password, user.password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="학번 또는 비밀번호가 올바르지 않습니다.",
             )
-        return self._create_access_token(user.id)
 
-    async def get_current_user(self, db: AsyncSession, token: str) -> User:
-        try:
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-            user_id: int = int(payload.get("sub"))
-            if user_id is None:
+        # BCRYPT_ROUNDS 가 바뀌었으면 로그인 성공 시점에 새 cost 로 다시 해싱 (쓰기만 짧은 트랜잭션으로)
+        if password_hasher.needs_rehash(user.password):
+            hashed_password = await self._hash_password(data.password)
+            async with db.begin():
+                await user_repository.update_password(db, user.id, hashed_password)
+            self.invalidate_user(user.id)
+        return self.create_access_token(user.id)
+
+    def user_id_from_token(self, token: str) -> int:
+        """토큰을 검증해 사용자 id 를 반환 (DB 조회 없음, 결과는 토큰 만료 시각까지 캐시)"""
+        user_id = self.token_cache.get(token)
+        if user_id is None:
+            try:
+                payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+                user_id: int = int(payload.get("sub"))
+                if user_id is None:
+                    raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="유효하지 않은 토큰입니다.")
+            except jwt.ExpiredSignatureError:
+                raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="토큰이 만료되었습니다.")
+            except jwt.InvalidTokenError:
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="유효하지 않은 토큰입니다.")
-        except jwt.ExpiredSignatureError:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="토큰이 만료되었습니다.")
-        except jwt.InvalidTokenError:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="유효하지 않은 토큰입니다.")
+            self.token_cache.set(token, user_id, expires_at=payload.get("exp"))
+        return user_id
+
+    async def get_current_user(self, db: AsyncSession, token: str) -> User:
+        return await self.get_user(db, self.user_id_from_token(token))
+
+    async def get_user(self, db: AsyncSession, user_id: int) -> User:
+        """검증된 토큰의 사용자 (캐시된 스냅샷, 없으면 DB 조회)"""
+        snapshot = self.user_cache.get(user_id)
+        if snapshot is not None:
+            # 요청마다 새 detached 인스턴스를 만들어 세션 간에 객체가 공유되지 않게 한다
+            user = User(**snapshot)
+            make_transient_to_detached(user)
+            return user
 
         user = await user_repository.find_by_id(db, user_id)
         if not user:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="사용자를 찾을 수 없습니다.")
+        self.user_cache.set(user_id, {c: getattr(user, c) for c in _USER_COLUMNS})
         return user
 
 
-auth_service = AuthService()
\ No newline at end of file
+auth_service = AuthService()
+
+
+# ORM 으로 사용자를 수정/삭제하면 캐시된 스냅샷을 버린다.
+# flush 시점에 한 번, 커밋 후에 한 번 더 지워 커밋 전에 다른 요청이 옛 값을 다시 캐시한 경우도 막는다
+@event.listens_for(Session, "after_flush")
+def _collect_changed_users(session, flush_context):
+    changed = {obj.id for obj in (*session.dirty, *session.deleted) if isinstance(obj, User)}
+    if changed:
+        session.info.setdefault("changed_user_ids", set()).update(changed)
+        for user_id in changed:
+            auth_service.invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_users(session):
+    for user_id in session.info.pop("changed_user_ids", ()):
+        auth_service.invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session):
+    session.info.pop("changed_user_ids", None)
\ No newline at end of file
@@ -0,0 +1,261 @@
+# study_room/services/availability_events.py
+
+import asyncio
+import json
+import logging
+import os
+import uuid
+from contextlib import contextmanager
+from datetime import date, time
+
+import asyncpg
+from dotenv import load_dotenv
+from fastapi import HTTPException, status
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from async_database import SYNC_DATABASE_URL
+from study_room.services.availability_index import availability_index
+from study_room.services.room_catalog import room_catalog
+from study_room.services.room_versions import room_versions
+
+load_dotenv(encoding="utf-8")
+# memory: 이 프로세스 안에서만 전달 / postgres: LISTEN/NOTIFY 로 다른 워커에도 전달
+AVAILABILITY_EVENTS_BACKEND = os.getenv("AVAILABILITY_EVENTS_BACKEND", "memory").lower()
+# 구독자별로 쌓아 둘 수 있는 변경 수. 넘치면 쌓인 변경을 버리고 스냅샷을 다시 보낸다
+STREAM_QUEUE_SIZE = int(os.getenv("AVAILABILITY_STREAM_QUEUE_SIZE", "100"))
+STREAM_MAX_SUBSCRIBERS = int(os.getenv("AVAILABILITY_STREAM_MAX_SUBSCRIBERS", "1000"))
+STREAM_HEARTBEAT_SECONDS = float(os.getenv("AVAILABILITY_STREAM_HEARTBEAT_SECONDS", "15"))
+# 놓친 변경이 남지 않도록 예약 가능 시간 인덱스를 DB 에서 다시 읽어 맞추는 주기 (0 이면 끔)
+RESYNC_INTERVAL_SECONDS = float(os.getenv("AVAILABILITY_RESYNC_INTERVAL_SECONDS", "300"))
+NOTIFY_CHANNEL = "room_availability"
+NOTIFY_RECONNECT_SECONDS = 5.0
+# NOTIFY payload 한도(8000 바이트) 안에 들어가도록 한 번에 보내는 변경 수
+NOTIFY_CHUNK_SIZE = 50
+_NOTIFY = text("SELECT pg_notify(:channel, :payload)")
+
+logger = logging.getLogger(__name__)
+
+
+class SlotChange:
+    """예약 구간 하나의 예약 가능 여부 변경 (available 은 변경 후 상태라 여러 번 받아도 결과가 같다)"""
+
+    __slots__ = ("room_id", "reservation_date", "start_time", "end_time", "available")
+
+    def __init__(self, room_id: int, reservation_date: date, start_time: time, end_time: time, available: bool):
+        self.room_id = room_id
+        self.reservation_date = reservation_date
+        self.start_time = start_time
+        self.end_time = end_time
+        self.available = available
+
+    def to_dict(self) -> dict:
+        return {
+            "room_id": self.room_id,
+            "date": self.reservation_date.isoformat(),
+            "time": self.start_time.strftime("%H:%M"),
+            "end_time": self.end_time.strftime("%H:%M"),
+            "available": self.available,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SlotChange":
+        return cls(
+            data["room_id"],
+            date.fromisoformat(data["date"]),
+            time.fromisoformat(data["time"]),
+            time.fromisoformat(data["end_time"]),
+            data["available"],
+        )
+
+
+# 구독자 큐가 넘쳤을 때 넣는 표시. 받으면 스냅샷을 다시 보낸다
+RESYNC = object()
+
+
+class Subscription:
+    __slots__ = ("room_id", "queue", "resync")
+
+    def __init__(self, room_id: int):
+        self.room_id = room_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+        self.resync = False
+
+    def deliver(self, change: SlotChange):
+        if self.resync:
+            # 어차피 스냅샷을 다시 보낼 예정
+            return
+        try:
+            self.queue.put_nowait(change)
+        except asyncio.QueueFull:
+            # 느린 구독자 때문에 발행 쪽이 기다리거나 메모리가 늘지 않도록 쌓인 변경을 버린다
+            self.request_resync()
+
+    def request_resync(self):
+        if self.resync:
+            return
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.resync = True
+        self.queue.put_nowait(RESYNC)
+
+    async def next(self, timeout: float):
+        """다음 변경(SlotChange), RESYNC, 또는 timeout 동안 없으면 None"""
+        try:
+            item = await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if item is RESYNC:
+            self.resync = False
+        return item
+
+
+class AvailabilityBroker:
+    """예약 생성/취소 커밋 후 슬롯 변경을 룸별 구독자(SSE 스트림)에게 나눠 준다.
+
+    postgres 백엔드에서는 쓰기 트랜잭션 안에서 변경을 NOTIFY 로도 보내고, 다른 워커가 보낸 변경을 받으면
+    이 워커의 예약 가능 시간 인덱스 / 룸 버전도 함께 갱신한다. 리뷰로 바뀐 평점도 같은 채널로 보내
+    모든 워커의 카탈로그와 룸 버전(ETag)이 함께 올라가게 한다.
+    """
+
+    def __init__(self, backend: str):
+        self.backend = backend
+        self._subscribers: dict[int, set[Subscription]] = {}
+        self._count = 0
+        # 자기 자신이 보낸 NOTIFY 를 구분하기 위한 워커 식별자
+        self._origin = uuid.uuid4().hex
+        self._task: asyncio.Task | None = None
+        self._resync_task: asyncio.Task | None = None
+
+    def ensure_capacity(self):
+        """스트림 응답을 시작하기 전에 호출 (시작된 뒤에는 상태 코드를 바꿀 수 없다)"""
+        if self._count >= STREAM_MAX_SUBSCRIBERS:
+            raise HTTPException(status.HTTP_503_SERVICE_UNAVAILABLE, "실시간 구독자가 너무 많습니다. 잠시 후 다시 시도해주세요.")
+
+    @contextmanager
+    def subscribe(self, room_id: int):
+        subscription = Subscription(room_id)
+        self._subscribers.setdefault(room_id, set()).add(subscription)
+        self._count += 1
+        try:
+            yield subscription
+        finally:
+            subscribers = self._subscribers.get(room_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[room_id]
+            self._count -= 1
+
+    async def notify(self, db: AsyncSession, changes: list[SlotChange]):
+        """쓰기 트랜잭션 안에서 호출: 다른 워커에 보낼 NOTIFY 를 같은 트랜잭션에 넣는다.
+
+        NOTIFY 는 커밋될 때 함께 전달되고 롤백되면 버려지므로 커밋된 변경만 빠짐없이 나간다.
+        """
+        if self.backend != "postgres":
+            return
+        for i in range(0, len(changes), NOTIFY_CHUNK_SIZE):
+            payload = json.dumps(
+                {"origin": self._origin, "changes": [c.to_dict() for c in changes[i:i + NOTIFY_CHUNK_SIZE]]}
+            )
+            await db.execute(_NOTIFY, {"channel": NOTIFY_CHANNEL, "payload": payload})
+
+    async def notify_rating(self, db: AsyncSession, room_id: int, rating: float):
+        """리뷰 작성 트랜잭션 안에서 호출: 다른 워커도 룸 평점과 버전을 갱신하게 한다"""
+        if self.backend != "postgres":
+            return
+        payload = json.dumps({"origin": self._origin, "changes": [], "ratings": {str(room_id): rating}})
+        await db.execute(_NOTIFY, {"channel": NOTIFY_CHANNEL, "payload": payload})
+
+    def publish(self, changes: list[SlotChange]):
+        """커밋 후 호출: 이 프로세스의 구독자에게 전달 (인덱스/버전은 호출한 쪽이 이미 갱신)"""
+        for change in changes:
+            for subscription in tuple(self._subscribers.get(change.room_id, ())):
+                subscription.deliver(change)
+
+    def _on_notify(self, connection, pid, channel, payload):
+        data = json.loads(payload)
+        if data["origin"] == self._origin:
+            return
+        changes = [SlotChange.from_dict(c) for c in data["changes"]]
+        for change in changes:
+            args = (change.room_id, change.reservation_date, change.start_time, change.end_time)
+            if change.available:
+                availability_index.mark_released(*args)
+            else:
+                availability_index.mark_reserved(*args)
+        for room_id in {c.room_id for c in changes}:
+            room_versions.bump(room_id)
+        for room_id, rating in data.get("ratings", {}).items():
+            room_catalog.update_rating(int(room_id), rating)
+            room_versions.bump(int(room_id))
+        self.publish(changes)
+
+    def start(self, session_factory: async_sessionmaker[AsyncSession]):
+        if self.backend == "postgres" and self._task is None:
+            self._task = asyncio.create_task(self._listen(session_factory))
+        if RESYNC_INTERVAL_SECONDS > 0 and self._resync_task is None:
+            self._resync_task = asyncio.create_task(self._resync_loop(session_factory))
+
+    async def stop(self):
+        for task in (self._task, self._resync_task):
+            if task is None:
+                continue
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self._resync_task = None
+
+    async def _resync(self, session_factory: async_sessionmaker[AsyncSession]) -> set[int]:
+        """인덱스를 DB 에서 다시 읽고, 예약 구간이 달라진 룸은 버전을 올리고 구독자에게 스냅샷을 다시 보낸다"""
+        async with session_factory() as db:
+            changed = await availability_index.rebuild(db)
+        for room_id in changed:
+            room_versions.bump(room_id)
+            for subscription in tuple(self._subscribers.get(room_id, ())):
+                subscription.request_resync()
+        return changed
+
+    async def _resync_loop(self, session_factory: async_sessionmaker[AsyncSession]):
+        while True:
+            await asyncio.sleep(RESYNC_INTERVAL_SECONDS)
+            try:
+                changed = await self._resync(session_factory)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("예약 가능 시간 인덱스 재동기화 실패")
+                continue
+            if changed:
+                logger.warning("예약 가능 시간 인덱스가 DB 와 달라 다시 맞췄습니다: 룸 %s", sorted(changed))
+
+    async def _listen(self, session_factory: async_sessionmaker[AsyncSession]):
+        dsn = SYNC_DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://")
+        connected_before = False
+        while True:
+            conn = None
+            try:
+                conn = await asyncpg.connect(dsn)
+                closed = asyncio.Event()
+                conn.add_termination_listener(lambda _: closed.set())
+                await conn.add_listener(NOTIFY_CHANNEL, self._on_notify)
+                if connected_before:
+                    # 끊긴 동안 놓친 변경이 있을 수 있으므로 인덱스를 다시 읽어 맞춘다
+                    await self._resync(session_factory)
+                connected_before = True
+                await closed.wait()
+                logger.warning("LISTEN/NOTIFY 연결이 끊겼습니다. 다시 연결합니다.")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("LISTEN/NOTIFY 연결 실패")
+            finally:
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+            await asyncio.sleep(NOTIFY_RECONNECT_SECONDS)
+
+
+availability_events = AvailabilityBroker(AVAILABILITY_EVENTS_BACKEND)
@@ -0,0 +1,151 @@
+# study_room/services/availability_index.py
+
+from datetime import date, time, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from study_room.intervals import IntervalSet, to_minutes
+from study_room.repositories.study_room_repository import study_room_repository
+
+# 예약 가능 기간: 오늘 ~ 오늘 + 7일
+BOOKING_WINDOW_DAYS = 7
+
+
+class RoomSlots:
+    """룸별 슬롯 정보 (운영 시간과 슬롯 길이 기준으로 한 번만 계산)"""
+
+    __slots__ = ("open_minutes", "slot_minutes", "labels")
+
+    def __init__(self, open_time: time, close_time: time, slot_minutes: int = 60):
+        self.open_minutes = to_minutes(open_time)
+        self.slot_minutes = slot_minutes
+        close_minutes = to_minutes(close_time)
+        # 마지막 슬롯도 운영 종료 전에 끝나야 한다
+        self.labels = tuple(
+            f"{m // 60:02d}:{m % 60:02d}"
+            for m in range(self.open_minutes, close_minutes - slot_minutes + 1, slot_minutes)
+        )
+
+    def mask_of(self, intervals: IntervalSet) -> int:
+        """예약 구간과 겹치는 슬롯의 비트셋 (비트 i = 운영 시작 + i * 슬롯 길이)"""
+        return intervals.mask(self.open_minutes, self.slot_minutes, len(self.labels))
+
+
+class AvailabilityIndex:
+    """룸 x 날짜별 예약 구간을 정렬된 구간 목록(IntervalSet)으로 들고 있는 인메모리 인덱스.
+
+    예약은 여러 슬롯에 걸칠 수 있으므로 슬롯 비트가 아니라 [시작, 종료) 구간을 저장하고,
+    조회할 때 룸의 슬롯 길이에 맞춰 겹치는 슬롯을 예약된 것으로 표시한다.
+    서버 시작 시 DB에서 재구성하고, 예약 생성/취소 커밋 후 갱신한다.
+    놓친 변경이 남지 않도록 주기적으로 DB 에서 다시 읽어 맞춘다 (availability_events).
+    """
+
+    def __init__(self):
+        self._rooms: dict[int, RoomSlots] = {}
+        self._reserved: dict[tuple[int, date], IntervalSet] = {}
+        self._window_start: date | None = None
+        # 진행 중인 rebuild 마다 DB 를 읽는 동안 들어온 변경을 모아 두는 목록
+        self._journals: list[list[tuple[bool, int, date, time, time]]] = []
+
+    def has_room(self, room_id: int) -> bool:
+        return room_id in self._rooms
+
+    async def rebuild(self, db: AsyncSession) -> set[int]:
+        """DB 에서 다시 읽어 한 번에 교체하고, 예약 구간이 달라진 룸 id 를 반환.
+
+        읽는 동안 들어온 변경은 DB 결과에 빠져 있을 수 있으므로 새 인덱스에 다시 적용한다
+        (이미 반영된 변경은 건너뛴다).
+        """
+        journal = []
+        self._journals.append(journal)
+        try:
+            today = date.today()
+            rooms = {
+                room_id: RoomSlots(open_time, close_time, slot_minutes)
+                for room_id, open_time, close_time, slot_minutes in await study_room_repository.find_all_hours(db)
+            }
+            reserved: dict[tuple[int, date], IntervalSet] = {}
+            rows = await study_room_repository.get_reserved_slots(
+                db, today, today + timedelta(days=BOOKING_WINDOW_DAYS)
+            )
+        finally:
+            self._journals.remove(journal)
+        for room_id, reservation_date, start_time, end_time in rows:
+            if room_id in rooms:
+                reserved.setdefault((room_id, reservation_date), IntervalSet()).add(
+                    to_minutes(start_time), to_minutes(end_time)
+                )
+        for reserve, room_id, reservation_date, start_time, end_time in journal:
+            if room_id not in rooms:
+                continue
+            start, end = to_minutes(start_time), to_minutes(end_time)
+            intervals = reserved.setdefault((room_id, reservation_date), IntervalSet())
+            if reserve and not intervals.contains(start, end):
+                intervals.add(start, end)
+            elif not reserve:
+                intervals.remove(start, end)
+            if not intervals:
+                del reserved[(room_id, reservation_date)]
+
+        old = self._reserved
+        changed = {
+            room_id
+            for room_id, reservation_date in old.keys() | reserved.keys()
+            if reservation_date >= today and old.get((room_id, reservation_date)) != reserved.get((room_id, reservation_date))
+        }
+        # 새로 만든 뒤 한 번에 교체
+        self._rooms = rooms
+        self._reserved = reserved
+        self._window_start = today
+        return changed
+
+    async def load_room(self, db: AsyncSession, room_id: int, open_time: time, close_time: time, slot_minutes: int):
+        """인덱스에 없는 룸을 DB에서 읽어 추가 (서버 시작 이후 추가된 룸 등)"""
+        self._prune()
+        today = date.today()
+        room = RoomSlots(open_time, close_time, slot_minutes)
+        rows = await study_room_repository.get_reserved_slots(
+            db, today, today + timedelta(days=BOOKING_WINDOW_DAYS), room_id=room_id
+        )
+        for key in [k for k in self._reserved if k[0] == room_id]:
+            del self._reserved[key]
+        self._rooms[room_id] = room
+        for _, reservation_date, start_time, end_time in rows:
+            self.mark_reserved(room_id, reservation_date, start_time, end_time)
+
+    def mark_reserved(self, room_id: int, reservation_date: date, start_time: time, end_time: time):
+        for journal in self._journals:
+            journal.append((True, room_id, reservation_date, start_time, end_time))
+        if room_id not in self._rooms:
+            return
+        self._reserved.setdefault((room_id, reservation_date), IntervalSet()).add(
+            to_minutes(start_time), to_minutes(end_time)
+        )
+
+    def mark_released(self, room_id: int, reservation_date: date, start_time: time, end_time: time):
+        for journal in self._journals:
+            journal.append((False, room_id, reservation_date, start_time, end_time))
+        key = (room_id, reservation_date)
+        intervals = self._reserved.get(key)
+        if intervals is None:
+            return
+        intervals.remove(to_minutes(start_time), to_minutes(end_time))
+        if not intervals:
+            del self._reserved[key]
+
+    def slots(self, room_id: int, target_date: date) -> list[tuple[str, bool]]:
+        self._prune()
+        room = self._rooms[room_id]
+        intervals = self._reserved.get((room_id, target_date))
+        mask = room.mask_of(intervals) if intervals is not None else 0
+        return [(label, not (mask >> i) & 1) for i, label in enumerate(room.labels)]
+
+    def _prune(self):
+        # 날짜가 바뀌면 지난 날짜의 구간은 버린다
+        today = date.today()
+        if self._window_start == today:
+            return
+        self._reserved = {k: v for k, v in self._reserved.items() if k[1] >= today}
+        self._window_start = today
+
+
+availability_index = AvailabilityIndex()
@@ -0,0 +1,290 @@
+# study_room/services/booking_queue.py
+
+import asyncio
+import contextvars
+import logging
+import os
+import time
+import uuid
+from collections import deque
+
+from dotenv import load_dotenv
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from study_room.cache import TTLCache
+from study_room.models.user import User
+from study_room.schemas.reservation import ReservationCreate, ReservationResponse, BookingTicketResponse
+from study_room.services.reservation_service import reservation_service
+
+load_dotenv(encoding="utf-8")
+# true 면 POST /reservations 를 룸별 대기열에 넣고 접수 번호를 돌려준다 (줄은 워커 프로세스마다 따로 선다)
+BOOKING_QUEUE_ENABLED = os.getenv("BOOKING_QUEUE_ENABLED", "false").lower() == "true"
+# 한 룸의 요청을 한 트랜잭션에서 최대 몇 건까지 함께 처리할지
+BOOKING_QUEUE_MAX_BATCH = int(os.getenv("BOOKING_QUEUE_MAX_BATCH", "50"))
+# 전체 대기 요청 한도 (넘치면 503 + Retry-After)
+BOOKING_QUEUE_MAX_PENDING = int(os.getenv("BOOKING_QUEUE_MAX_PENDING", "5000"))
+# 동시에 DB 트랜잭션을 여는 룸 수 (나머지 룸은 차례를 기다리고, 남은 커넥션은 조회 API 가 쓴다)
+BOOKING_QUEUE_CONCURRENCY = int(os.getenv("BOOKING_QUEUE_CONCURRENCY", "4"))
+# 처리 결과를 GET /reservations/tickets/{ticket_id} 로 조회할 수 있는 시간
+BOOKING_TICKET_TTL_SECONDS = float(os.getenv("BOOKING_TICKET_TTL_SECONDS", "300"))
+# wait=true 요청이 결과를 기다리는 최대 시간 (넘기면 202 + 접수 번호)
+BOOKING_QUEUE_WAIT_SECONDS = float(os.getenv("BOOKING_QUEUE_WAIT_SECONDS", "10"))
+# 서버 종료 시 쌓인 요청을 처리할 최대 시간 (넘기면 남은 요청은 503 으로 끝낸다)
+BOOKING_QUEUE_DRAIN_SECONDS = float(os.getenv("BOOKING_QUEUE_DRAIN_SECONDS", "10"))
+
+logger = logging.getLogger(__name__)
+
+
+class BookingTicket:
+    """접수된 예약 요청 하나. result 는 처리 후 예약 또는 바로 예약했다면 받았을 HTTPException"""
+
+    __slots__ = ("id", "user_id", "data", "start_time", "seq", "enqueued_at", "done", "result")
+
+    def __init__(self, user_id: int, data: ReservationCreate, start_time, seq: int):
+        self.id = uuid.uuid4().hex
+        self.user_id = user_id
+        self.data = data
+        self.start_time = start_time
+        # 룸 안에서의 접수 순번
+        self.seq = seq
+        self.enqueued_at = time.monotonic()
+        self.done = asyncio.Event()
+        self.result: ReservationResponse | HTTPException | None = None
+
+
+class RoomQueue:
+    """룸 하나의 대기 요청과 처리 통계"""
+
+    __slots__ = (
+        "pending", "processing", "worker", "enqueued", "dequeued", "confirmed", "failed",
+        "batches", "max_batch", "busy_seconds", "wait_seconds",
+    )
+
+    def __init__(self):
+        self.pending: deque[BookingTicket] = deque()
+        self.processing: list[BookingTicket] = []
+        self.worker: asyncio.Task | None = None
+        self.enqueued = 0
+        self.dequeued = 0
+        self.confirmed = 0
+        self.failed = 0
+        self.batches = 0
+        self.max_batch = 0
+        # 트랜잭션 처리에 쓴 시간 / 접수부터 결과까지 걸린 시간의 합
+        self.busy_seconds = 0.0
+        self.wait_seconds = 0.0
+
+    def stats(self) -> dict:
+        processed = self.confirmed + self.failed
+        return {
+            "depth": len(self.pending),
+            "processed": processed,
+            "confirmed": self.confirmed,
+            "failed": self.failed,
+            "batches": self.batches,
+            "avg_batch_size": round(processed / self.batches, 2) if self.batches else 0,
+            "max_batch_size": self.max_batch,
+            # DB 처리 시간 기준 초당 처리 건수
+            "throughput_per_second": round(processed / self.busy_seconds, 1) if self.busy_seconds else 0,
+            "avg_wait_ms": round(self.wait_seconds / processed * 1000, 3) if processed else 0,
+        }
+
+
+class BookingQueue:
+    """예약 생성 요청을 룸별로 줄 세워 접수 순서대로, 여러 건씩 한 트랜잭션에서 처리하는 write-behind 대기열.
+
+    예약 오픈 순간 같은 룸에 몰린 요청이 각자 SERIALIZABLE 트랜잭션을 열어 충돌/재시도하는 대신,
+    룸마다 워커 하나가 쌓인 요청을 모아 reservation_service.create_reservations_in_order 로
+    집합 조회 + 다중 행 INSERT 한 번에 처리한다. 워커는 요청이 있을 때만 떠 있고,
+    동시에 DB 를 쓰는 룸 수는 BOOKING_QUEUE_CONCURRENCY 로 제한한다.
+    단일 이벤트 루프에서만 사용하므로 락을 두지 않는다.
+    """
+
+    def __init__(self, enabled: bool, max_batch: int, max_pending: int, concurrency: int):
+        self.enabled = enabled
+        self.max_batch = max_batch
+        self.max_pending = max_pending
+        self.concurrency = concurrency
+        self._rooms: dict[int, RoomQueue] = {}
+        # 접수 번호 -> 처리 전 BookingTicket. 최대 max_pending 건이고 만료/축출되지 않는다
+        self._pending_tickets: dict[str, BookingTicket] = {}
+        # 접수 번호 -> 처리된 BookingTicket (처리 후 BOOKING_TICKET_TTL_SECONDS 동안 조회 가능)
+        self._tickets = TTLCache(max_pending * 10, BOOKING_TICKET_TTL_SECONDS)
+        self._session_factory: async_sessionmaker[AsyncSession] | None = None
+        self._db_slots: asyncio.Semaphore | None = None
+        self._accepting = False
+        self.pending = 0
+        self.rejected = 0
+
+    def start(self, session_factory: async_sessionmaker[AsyncSession]):
+        self._session_factory = session_factory
+        self._db_slots = asyncio.Semaphore(self.concurrency)
+        self._accepting = True
+
+    async def stop(self):
+        """새 접수를 막고 쌓인 요청을 처리한 뒤 끝낸다"""
+        self._accepting = False
+        workers = [room.worker for room in self._rooms.values() if room.worker is not None]
+        if workers:
+            _, unfinished = await asyncio.wait(workers, timeout=BOOKING_QUEUE_DRAIN_SECONDS)
+            for task in unfinished:
+                task.cancel()
+            await asyncio.gather(*unfinished, return_exceptions=True)
+        error = HTTPException(status.HTTP_503_SERVICE_UNAVAILABLE, "서버가 종료 중이라 예약을 처리하지 못했습니다.")
+        for room in self._rooms.values():
+            for ticket in [*room.processing, *room.pending]:
+                if not ticket.done.is_set():
+                    self._finish(room, ticket, error)
+            room.pending.clear()
+            room.processing = []
+
+    async def submit(self, db: AsyncSession, data: ReservationCreate, current_user: User) -> BookingTicket:
+        # 예약 현황과 무관한 입력 오류는 줄을 세우지 않고 바로 돌려준다
+        start_time, _ = await reservation_service.validate_request(db, data)
+        if not self._accepting or self.pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="예약 요청이 많아 접수하지 못했습니다. 잠시 후 다시 시도해주세요.",
+                headers={"Retry-After": "1"},
+            )
+        # 인증/룸 조회로 시작된 읽기 트랜잭션을 닫아 기다리는 동안 커넥션을 잡지 않는다
+        if db.in_transaction():
+            await db.commit()
+
+        room = self._rooms.get(data.room_id)
+        if room is None:
+            room = self._rooms[data.room_id] = RoomQueue()
+        ticket = BookingTicket(current_user.id, data, start_time, room.enqueued)
+        room.enqueued += 1
+        room.pending.append(ticket)
+        self.pending += 1
+        self._pending_tickets[ticket.id] = ticket
+        if room.worker is None:
+            # 워커의 쿼리가 처음 접수한 요청의 통계(request_metrics)에 잡히지 않도록 빈 컨텍스트에서 실행
+            room.worker = asyncio.create_task(self._drain(room), context=contextvars.Context())
+        return ticket
+
+    async def wait(self, ticket: BookingTicket, timeout: float) -> bool:
+        """처리가 끝나면 True, timeout 초 안에 끝나지 않으면 False"""
+        try:
+            await asyncio.wait_for(ticket.done.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def outcome(self, ticket: BookingTicket) -> ReservationResponse:
+        """처리된 요청의 예약. 실패했으면 바로 예약했을 때와 같은 HTTPException 을 던진다"""
+        if isinstance(ticket.result, HTTPException):
+            raise ticket.result
+        return ticket.result
+
+    async def read_ticket(
+        self, db: AsyncSession, ticket_id: str, current_user: User, wait: bool
+    ) -> BookingTicketResponse:
+        ticket = self._pending_tickets.get(ticket_id) or self._tickets.get(ticket_id)
+        if ticket is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="존재하지 않거나 만료된 접수 번호입니다.")
+        if ticket.user_id != current_user.id:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="본인 예약 요청만 조회할 수 있습니다.")
+        if wait and not ticket.done.is_set():
+            if db.in_transaction():
+                await db.commit()
+            await self.wait(ticket, BOOKING_QUEUE_WAIT_SECONDS)
+        return self.to_response(ticket)
+
+    def to_response(self, ticket: BookingTicket) -> BookingTicketResponse:
+        data = ticket.data
+        response = BookingTicketResponse(
+            ticket_id=ticket.id,
+            status="접수",
+            room_id=data.room_id,
+            reservation_date=data.reservation_date,
+            start_time=data.start_time,
+        )
+        if not ticket.done.is_set():
+            response.position = max(ticket.seq - self._rooms[data.room_id].dequeued, 0)
+        elif isinstance(ticket.result, HTTPException):
+            response.status = "실패"
+            response.status_code = ticket.result.status_code
+            response.detail = ticket.result.detail
+        else:
+            response.status = "완료"
+            response.reservation = ticket.result
+        return response
+
+    async def _drain(self, room: RoomQueue):
+        """룸의 대기 요청이 빌 때까지 접수 순서대로 max_batch 건씩 처리"""
+        try:
+            while room.pending:
+                async with self._db_slots:
+                    # DB 차례를 기다리는 동안 쌓인 요청까지 한 번에 가져간다
+                    count = min(self.max_batch, len(room.pending))
+                    room.processing = [room.pending.popleft() for _ in range(count)]
+                    room.dequeued += count
+                    await self._process(room, room.processing)
+                room.processing = []
+        finally:
+            room.worker = None
+
+    async def _process(self, room: RoomQueue, batch: list[BookingTicket]):
+        start = time.perf_counter()
+        try:
+            async with self._session_factory() as db:
+                results = await reservation_service.create_reservations_in_order(
+                    db, [t.data for t in batch], [t.user_id for t in batch], [t.start_time for t in batch]
+                )
+        except Exception:
+            logger.exception("대기열 예약 처리 실패")
+            error = HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, "예약 저장 중 오류가 발생했습니다.")
+            results = [error] * len(batch)
+        room.busy_seconds += time.perf_counter() - start
+        room.batches += 1
+        room.max_batch = max(room.max_batch, len(batch))
+        for ticket, result in zip(batch, results):
+            self._finish(room, ticket, result)
+
+    def _finish(self, room: RoomQueue, ticket: BookingTicket, result: ReservationResponse | HTTPException):
+        ticket.result = result
+        ticket.done.set()
+        if isinstance(result, HTTPException):
+            room.failed += 1
+        else:
+            room.confirmed += 1
+        room.wait_seconds += time.monotonic() - ticket.enqueued_at
+        self.pending -= 1
+        # 처리된 뒤에만 TTL 캐시로 옮겨, 처리 시각부터 TTL 동안 조회할 수 있게 한다
+        self._pending_tickets.pop(ticket.id, None)
+        self._tickets.set(ticket.id, ticket)
+
+    def stats(self) -> dict[int, dict]:
+        return {room_id: room.stats() for room_id, room in sorted(self._rooms.items())}
+
+    def render(self) -> str:
+        """Prometheus text exposition format"""
+        lines = [
+            "# TYPE booking_queue_pending gauge", f"booking_queue_pending {self.pending}",
+            "# TYPE booking_queue_rejected_total counter", f"booking_queue_rejected_total {self.rejected}",
+            "# HELP booking_queue_requests_total 룸별 대기열 처리 결과 수", "# TYPE booking_queue_requests_total counter",
+        ]
+        rooms = sorted(self._rooms.items())
+        for room_id, room in rooms:
+            lines.append(f'booking_queue_requests_total{{room_id="{room_id}",result="confirmed"}} {room.confirmed}')
+            lines.append(f'booking_queue_requests_total{{room_id="{room_id}",result="failed"}} {room.failed}')
+        lines += ["# TYPE booking_queue_depth gauge"]
+        lines += [f'booking_queue_depth{{room_id="{room_id}"}} {len(room.pending)}' for room_id, room in rooms]
+        lines += ["# TYPE booking_queue_batches_total counter"]
+        lines += [f'booking_queue_batches_total{{room_id="{room_id}"}} {room.batches}' for room_id, room in rooms]
+        lines += ["# HELP booking_queue_busy_seconds_total 룸별 배치 트랜잭션 처리 시간", "# TYPE booking_queue_busy_seconds_total counter"]
+        lines += [f'booking_queue_busy_seconds_total{{room_id="{room_id}"}} {room.busy_seconds:.6f}' for room_id, room in rooms]
+        lines += ["# HELP booking_queue_wait_seconds 접수부터 처리 완료까지 걸린 시간", "# TYPE booking_queue_wait_seconds summary"]
+        for room_id, room in rooms:
+            lines.append(f'booking_queue_wait_seconds_sum{{room_id="{room_id}"}} {room.wait_seconds:.6f}')
+            lines.append(f'booking_queue_wait_seconds_count{{room_id="{room_id}"}} {room.confirmed + room.failed}')
+        return "\n".join(lines) + "\n"
+
+
+booking_queue = BookingQueue(
+    BOOKING_QUEUE_ENABLED, BOOKING_QUEUE_MAX_BATCH, BOOKING_QUEUE_MAX_PENDING, BOOKING_QUEUE_CONCURRENCY
+)
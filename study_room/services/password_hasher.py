@@ -0,0 +1,123 @@
+# study_room/services/password_hasher.py
+
+import asyncio
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+import bcrypt
+from dotenv import load_dotenv
+
+load_dotenv(encoding="utf-8")
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# thread: 스레드 풀 (bcrypt 는 해싱 중 GIL 을 놓는다) / process: 프로세스 풀 / inline: 이벤트 루프에서 바로 실행
+BCRYPT_EXECUTOR = os.getenv("BCRYPT_EXECUTOR", "thread")
+BCRYPT_MAX_WORKERS = int(os.getenv("BCRYPT_MAX_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+
+# 프로세스 풀에서도 쓸 수 있도록 모듈 수준 함수로 둔다
+def _hashpw(password: bytes, rounds: int) -> bytes:
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds=rounds))
+
+
+def _checkpw(password: bytes, hashed: bytes) -> bool:
+    return bcrypt.checkpw(password, hashed)
+
+
+class PasswordHasher:
+    """bcrypt 해싱/검증을 워커 풀에서 실행해 이벤트 루프가 막히지 않게 한다.
+
+    동시에 실행되는 작업 수는 max_workers 로 제한하고, 나머지는 세마포어에서 대기한다.
+    """
+
+    def __init__(self, rounds: int, executor: str, max_workers: int):
+        self.rounds = rounds
+        self.executor_kind = executor
+        self.max_workers = max_workers
+        self._executor: Executor | None = None
+        self._semaphore = asyncio.Semaphore(max_workers)
+
+        self.waiting = 0
+        self.running = 0
+        self.completed = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    async def hash(self, password: str) -> str:
+        hashed = await self._run(_hashpw, password.encode("utf-8"), self.rounds)
+        return hashed.decode("utf-8")
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self._run(_checkpw, password.encode("utf-8"), hashed.encode("utf-8"))
+
+    def needs_rehash(self, hashed: str) -> bool:
+        # "$2b$12$..." 형식에서 cost 를 읽는다
+        try:
+            return int(hashed.split("$")[2]) != self.rounds
+        except (IndexError, ValueError):
+            return True
+
+    def stats(self) -> dict:
+        return {
+            "executor": self.executor_kind,
+            "max_workers": self.max_workers,
+            "rounds": self.rounds,
+            "waiting": self.waiting,
+            "running": self.running,
+            "completed": self.completed,
+            "avg_wait_ms": round(self.total_wait_seconds / self.completed * 1000, 3) if self.completed else 0.0,
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+        }
+
+    def render(self) -> str:
+        """Prometheus text exposition format"""
+        lines = [
+            "# HELP password_hasher_waiting 워커 차례를 기다리는 해싱/검증 수", "# TYPE password_hasher_waiting gauge",
+            f"password_hasher_waiting {self.waiting}",
+            "# TYPE password_hasher_running gauge", f"password_hasher_running {self.running}",
+            "# TYPE password_hasher_max_workers gauge", f"password_hasher_max_workers {self.max_workers}",
+            "# HELP password_hasher_wait_seconds 워커 차례를 기다린 시간", "# TYPE password_hasher_wait_seconds summary",
+            f"password_hasher_wait_seconds_sum {self.total_wait_seconds:.6f}",
+            f"password_hasher_wait_seconds_count {self.completed}",
+            "# TYPE password_hasher_max_wait_seconds gauge", f"password_hasher_max_wait_seconds {self.max_wait_seconds:.6f}",
+        ]
+        return "\n".join(lines) + "\n"
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _run(self, fn, *args):
+        if self.executor_kind == "inline":
+            return fn(*args)
+
+        queued_at = time.perf_counter()
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        wait = time.perf_counter() - queued_at
+        self.total_wait_seconds += wait
+        self.max_wait_seconds = max(self.max_wait_seconds, wait)
+
+        self.running += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            self.running -= 1
+            self.completed += 1
+            self._semaphore.release()
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="bcrypt")
+        return self._executor
+
+
+password_hasher = PasswordHasher(BCRYPT_ROUNDS, BCRYPT_EXECUTOR, BCRYPT_MAX_WORKERS)
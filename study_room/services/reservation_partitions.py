@@ -0,0 +1,133 @@
+# study_room/services/reservation_partitions.py
+
+import asyncio
+import logging
+import os
+from datetime import date, datetime
+
+from dotenv import load_dotenv
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from study_room.models.reservation import RESERVATION_PARTITIONING
+from study_room.repositories.reservation_partition_repository import (
+    reservation_partition_repository,
+    month_start,
+    add_months,
+)
+
+load_dotenv(encoding="utf-8")
+# 이번 달 이후 몇 개월치 파티션을 미리 만들어 둘지
+PARTITION_MONTHS_AHEAD = int(os.getenv("RESERVATION_PARTITION_MONTHS_AHEAD", "3"))
+# 이 개월 수보다 오래된 파티션은 reservation_history 로 옮긴다
+RETENTION_MONTHS = int(os.getenv("RESERVATION_RETENTION_MONTHS", "12"))
+PARTITION_CHECK_INTERVAL_SECONDS = float(os.getenv("RESERVATION_PARTITION_CHECK_INTERVAL_SECONDS", "86400"))
+
+logger = logging.getLogger(__name__)
+
+
+class ReservationPartitionMaintainer:
+    """reservations 월별 파티션을 관리하는 백그라운드 작업 (RESERVATION_PARTITIONING=true 일 때만 동작).
+
+    보관 기간(RETENTION_MONTHS) ~ 이번 달 + PARTITION_MONTHS_AHEAD 까지의 파티션을 미리 만들고,
+    보관 기간이 지난 파티션은 떼어 내 reservation_history 로 옮긴다.
+    """
+
+    def __init__(self, interval: float, enabled: bool):
+        self.interval = interval
+        self.enabled = enabled
+        self._task: asyncio.Task | None = None
+        self.last_run_at: datetime | None = None
+        self.last_created: list[date] = []
+        self.last_archived: dict[date, int] = {}
+
+    def retention_start(self, today: date) -> date:
+        """이 날짜가 속한 달부터는 reservations 에 남는다"""
+        return add_months(month_start(today), -RETENTION_MONTHS)
+
+    async def ensure_partitions(self, db: AsyncSession, today: date | None = None) -> list[date]:
+        """보관 기간 시작 ~ 이번 달 + PARTITION_MONTHS_AHEAD 중 없는 파티션을 만들고 만든 달 목록을 반환"""
+        if not self.enabled:
+            return []
+        today = today or date.today()
+        await reservation_partition_repository.lock(db)
+        existing = set(await reservation_partition_repository.find_partition_months(db))
+        month, last = self.retention_start(today), add_months(month_start(today), PARTITION_MONTHS_AHEAD)
+        created = []
+        while month <= last:
+            if month not in existing:
+                await reservation_partition_repository.create_partition(db, month)
+                created.append(month)
+            month = add_months(month, 1)
+        return created
+
+    async def migrate(self, db: AsyncSession, today: date | None = None) -> tuple[list[date], int] | None:
+        """파티션 없이 만들어진 기존 reservations 를 월별 파티션 테이블로 바꾼다 (서버를 멈춘 상태에서 한 트랜잭션으로).
+
+        보관 기간이 지난 달도 일단 파티션으로 옮기므로, 이후 run_once 가 reservation_history 로 보낸다.
+        이미 파티션 테이블이면 None, 아니면 (만든 달 목록, 옮긴 행 수) 를 반환.
+        """
+        if not self.enabled or await reservation_partition_repository.is_partitioned(db):
+            return None
+        await reservation_partition_repository.lock(db)
+        await reservation_partition_repository.rename_legacy_table(db)
+        await reservation_partition_repository.create_table(db)
+        created = []
+        for month in await reservation_partition_repository.find_legacy_months(db):
+            await reservation_partition_repository.create_partition(db, month)
+            created.append(month)
+        created += await self.ensure_partitions(db, today)
+        rows = await reservation_partition_repository.copy_legacy_rows(db)
+        return sorted(created), rows
+
+    async def run_once(
+        self, session_factory: async_sessionmaker[AsyncSession], create: bool = True
+    ) -> tuple[list[date], dict[date, int]]:
+        """없는 파티션을 만들고(create) 보관 기간이 지난 파티션을 옮긴다. (만든 달 목록, {옮긴 달: 행 수}) 를 반환"""
+        if not self.enabled:
+            return [], {}
+        today = date.today()
+        cutoff = self.retention_start(today)
+        async with session_factory() as db:
+            async with db.begin():
+                created = await self.ensure_partitions(db, today) if create else []
+                expired = [m for m in await reservation_partition_repository.find_partition_months(db) if m < cutoff]
+            # DETACH 는 부모 테이블 잠금을 잡으므로 파티션마다 짧은 트랜잭션으로 나눈다
+            archived = {}
+            for month in expired:
+                async with db.begin():
+                    await reservation_partition_repository.lock(db)
+                    if month not in await reservation_partition_repository.find_partition_months(db):
+                        continue  # 다른 워커가 먼저 옮김
+                    archived[month] = await reservation_partition_repository.archive_partition(db, month)
+                logger.info("예약 파티션 %s 보관: %d건", f"{month:%Y-%m}", archived[month])
+        self.last_run_at = datetime.now()
+        self.last_created = created
+        self.last_archived = archived
+        return created, archived
+
+    def start(self, session_factory: async_sessionmaker[AsyncSession]):
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self._loop(session_factory))
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _loop(self, session_factory: async_sessionmaker[AsyncSession]):
+        # 시작 시의 파티션 생성은 lifespan 이 예약을 받기 전에 이미 했으므로 첫 회는 보관만 한다
+        create = False
+        while True:
+            try:
+                await self.run_once(session_factory, create=create)
+            except Exception:
+                logger.exception("예약 파티션 관리 실패")
+            create = True
+            await asyncio.sleep(self.interval)
+
+
+reservation_partitions = ReservationPartitionMaintainer(PARTITION_CHECK_INTERVAL_SECONDS, RESERVATION_PARTITIONING)
@@ -1,106 +1,452 @@
 # study_room/services/reservation_service.py
 
-from datetime import date, datetime, timedelta
+from collections import Counter, defaultdict
+from datetime import date, datetime, time, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import DBAPIError, IntegrityError
 from fastapi import HTTPException, status
 
+from async_database import recent_writers
 from study_room.repositories.reservation_repository import reservation_repository
+from study_room.repositories.study_room_repository import study_room_repository
+from study_room.repositories.waitlist_repository import waitlist_repository
+from study_room.intervals import IntervalSet, to_minutes
+from study_room.services.availability_index import availability_index
+from study_room.services.availability_events import availability_events, SlotChange
+from study_room.services.room_versions import room_versions
 from study_room.services.study_room_service import study_room_service
-from study_room.models.reservation import Reservation
+from study_room.models.reservation import effective_status, RESERVATION_PARTITIONING, USER_PERIOD_CONSTRAINT
+from study_room.models.waitlist import WaitlistEntry
+from study_room.pagination import encode_cursor, decode_cursor
 from study_room.models.user import User
-from study_room.schemas.reservation import ReservationCreate, ReservationResponse, MyReservationsResponse
+from study_room.schemas.reservation import (
+    ReservationCreate,
+    ReservationResponse,
+    MyReservationsResponse,
+    ReservationBatchCreate,
+    ReservationBatchItemResult,
+    ReservationBatchResponse,
+)
+
+# 하루 예약 한도 (취소되지 않은 예약의 이용 시간 합계, 분)
+DAILY_RESERVATION_LIMIT_MINUTES = 120
+DAILY_LIMIT_DETAIL = f"하루에 최대 {DAILY_RESERVATION_LIMIT_MINUTES // 60}시간까지만 예약 가능합니다."
+MAX_SERIALIZATION_RETRIES = 5
+SERIALIZATION_FAILURE = "40001"
+ROOM_NOT_FOUND_DETAIL = "존재하지 않는 스터디룸입니다."
+USER_CONFLICT_DETAIL = "해당 시간에 이미 다른 방 예약이 있습니다."
+ROOM_CONFLICT_DETAIL = "이미 예약된 시간입니다."
+# 일괄 검증의 실패 사유 -> create_reservation 이 같은 사유로 내는 상태 코드 (없으면 400)
+BATCH_DETAIL_STATUS = {
+    ROOM_NOT_FOUND_DETAIL: status.HTTP_404_NOT_FOUND,
+    USER_CONFLICT_DETAIL: status.HTTP_409_CONFLICT,
+    ROOM_CONFLICT_DETAIL: status.HTTP_409_CONFLICT,
+}
+
+
+def _conflict_detail(e: IntegrityError) -> str:
+    """겹침 제약 위반의 응답 메시지 (유저 구간 배타 제약이면 유저 중복, 그 외에는 룸 중복)"""
+    # 위반한 제약 이름은 asyncpg 예외(e.orig.__cause__)에 있다
+    constraint = getattr(getattr(e.orig, "__cause__", None), "constraint_name", None) or ""
+    return USER_CONFLICT_DETAIL if constraint.startswith(USER_PERIOD_CONSTRAINT) else ROOM_CONFLICT_DETAIL
 
 
 class ReservationService:
-    async def create_reservation(self, db: AsyncSession, data: ReservationCreate, current_user: User) -> ReservationResponse:
-        room = await study_room_service.read_room_by_id(db, data.room_id)
+    def booking_interval(
+        self, room, reservation_date: date, start_time: time, duration_minutes: int | None
+    ) -> tuple[time, time]:
+        """룸의 슬롯 길이에 맞춘 예약 구간 (start_time, end_time).
+
+        room 은 open_time / close_time / slot_minutes 를 가진 RoomRecord 또는 조회 Row.
+        시작 시각은 운영 시작부터 슬롯 길이 간격의 경계여야 하고, 이용 시간은 슬롯 길이의 배수여야 한다.
+        """
+        slot_minutes = room.slot_minutes
+        duration = duration_minutes or slot_minutes
+        if duration % slot_minutes:
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, f"이용 시간은 {slot_minutes}분 단위로만 예약 가능합니다.")
+        if start_time.second or (to_minutes(start_time) - to_minutes(room.open_time)) % slot_minutes:
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, f"예약은 {slot_minutes}분 단위 슬롯의 시작 시각에만 가능합니다.")
+        end_dt = datetime.combine(reservation_date, start_time) + timedelta(minutes=duration)
+        if end_dt.date() != reservation_date:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"운영 시간({room.open_time.strftime('%H:%M')} ~ {room.close_time.strftime('%H:%M')}) 내에서만 예약 가능합니다.",
+            )
+        return start_time, end_dt.time()
 
+    async def validate_request(self, db: AsyncSession, data: ReservationCreate) -> tuple[time, time]:
+        """DB 의 예약 현황과 무관한 입력 검증 (날짜 범위, 시간 형식, 룸, 슬롯 단위). 예약 구간을 반환"""
         today = date.today()
         if data.reservation_date < today or data.reservation_date > today + timedelta(days=7):
             raise HTTPException(status_code=400, detail="예약은 오늘부터 7일 이내의 날짜만 가능합니다.")
 
-        user_daily_count = await reservation_repository.count_by_user_and_date(db, current_user.id, data.reservation_date)
-        if user_daily_count >= 2:
-            raise HTTPException(status_code=400, detail="하루에 최대 2시간(2회)까지만 예약 가능합니다.")
-
         try:
             start_time = datetime.strptime(data.start_time, "%H:%M").time()
         except ValueError:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="시간 형식이 올바르지 않습니다. (예: 14:00)")
 
-        end_dt = datetime.combine(data.reservation_date, start_time) + timedelta(hours=1)
-        end_time = end_dt.time()
+        # 슬롯 길이는 카탈로그에서 읽는다 (없는 룸이면 여기서 404)
+        room = await study_room_service.read_room_by_id(db, data.room_id)
+        return self.booking_interval(room, data.reservation_date, start_time, data.duration_minutes)
+
+    async def create_reservation(self, db: AsyncSession, data: ReservationCreate, current_user: User) -> ReservationResponse:
+        start_time, end_time = await self.validate_request(db, data)
+        duration = to_minutes(end_time) - to_minutes(start_time)
+        user_id = current_user.id
+
+        # 인증 단계에서 시작된 읽기 트랜잭션이 있으면 먼저 닫는다
+        if db.in_transaction():
+            await db.commit()
 
-        if start_time < room.open_time or end_time > room.close_time:
+        change = SlotChange(data.room_id, data.reservation_date, start_time, end_time, False)
+        # 검증 + INSERT를 SERIALIZABLE 트랜잭션 안의 한 문장으로 실행하고,
+        # 동시 요청끼리 직렬화 충돌이 나면 다시 시도한다 (재시도 시 상대 예약이 보인다)
+        for attempt in range(MAX_SERIALIZATION_RETRIES):
+            try:
+                async with db.begin():
+                    await db.connection(execution_options={"isolation_level": "SERIALIZABLE"})
+                    result = await reservation_repository.insert_if_available(
+                        db, user_id, data.room_id, data.reservation_date, start_time, end_time,
+                        DAILY_RESERVATION_LIMIT_MINUTES,
+                    )
+                    if result.id is not None:
+                        # 다른 워커에 보낼 변경은 같은 트랜잭션에서 NOTIFY (커밋될 때만 전달된다)
+                        await availability_events.notify(db, [change])
+                break
+            except IntegrityError as e:
+                # uq_room_date_time_active / 배타 제약: 겹치는 구간을 동시에 잡은 요청이 먼저 커밋됨
+                raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=_conflict_detail(e))
+            except DBAPIError as e:
+                if getattr(e.orig, "sqlstate", None) != SERIALIZATION_FAILURE:
+                    raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="예약 저장 중 오류가 발생했습니다.")
+        else:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="예약 요청이 몰려 처리하지 못했습니다. 다시 시도해주세요.")
+
+        if result.name is None:
+            raise HTTPException(status.HTTP_404_NOT_FOUND, ROOM_NOT_FOUND_DETAIL)
+        if result.daily_minutes + duration > DAILY_RESERVATION_LIMIT_MINUTES:
+            raise HTTPException(status_code=400, detail=DAILY_LIMIT_DETAIL)
+        if start_time < result.open_time or end_time > result.close_time:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"운영 시간({room.open_time.strftime('%H:%M')} ~ {room.close_time.strftime('%H:%M')}) 내에서만 예약 가능합니다.",
+                detail=f"운영 시간({result.open_time.strftime('%H:%M')} ~ {result.close_time.strftime('%H:%M')}) 내에서만 예약 가능합니다.",
             )
-        
-        if await reservation_repository.find_user_conflict(db, current_user.id, data.reservation_date, start_time):
+        if result.user_conflicts:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
-                detail="해당 시간에 이미 다른 방 예약이 있습니다.",
+                detail=USER_CONFLICT_DETAIL,
             )
-        
-        if await reservation_repository.find_conflict(db, data.room_id, data.reservation_date, start_time):
-            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="이미 예약된 시간입니다.")
+        if result.room_conflicts:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=ROOM_CONFLICT_DETAIL)
 
-        new_reservation = Reservation(
-            user_id=current_user.id,
-            room_id=room.room_id,
+        availability_index.mark_reserved(data.room_id, data.reservation_date, start_time, end_time)
+        room_versions.bump(data.room_id)
+        availability_events.publish([change])
+        # INSERT 가 SELECT 안의 CTE 라 PrimarySession 이 쓰기로 보지 못하므로 직접 기록한다 (read-your-writes)
+        recent_writers.set(user_id, True)
+
+        return ReservationResponse(
+            id=result.id,
+            room_name=result.name,
             reservation_date=data.reservation_date,
-            start_time=start_time,
-            end_time=end_time,
+            start_time=start_time.strftime("%H:%M"),
+            end_time=end_time.strftime("%H:%M"),
             status="예약확정",
         )
 
+    async def create_reservations_batch(
+        self, db: AsyncSession, data: ReservationBatchCreate, current_user: User
+    ) -> ReservationBatchResponse:
+        """여러 예약을 한 트랜잭션에서 검증하고 다중 행 INSERT 한 번으로 저장한다.
+
+        검증은 create_reservation 과 같은 규칙을 따르되, 항목마다 쿼리를 보내지 않고
+        관련 룸/날짜의 예약을 한 번에 읽어 메모리에서 판단한다 (배치 안의 항목끼리도 서로 반영).
+        """
+        items = data.expand()
+        today = date.today()
+        user_id = current_user.id
+        details: list[str | None] = [None] * len(items)
+        # index -> start_time (종료 시각은 룸의 슬롯 길이를 읽은 뒤 _check_batch 에서 정한다)
+        pending: dict[int, time] = {}
+
+        for i, item in enumerate(items):
+            if item.reservation_date < today or item.reservation_date > today + timedelta(days=7):
+                details[i] = "예약은 오늘부터 7일 이내의 날짜만 가능합니다."
+                continue
+            try:
+                start_time = datetime.strptime(item.start_time, "%H:%M").time()
+            except ValueError:
+                details[i] = "시간 형식이 올바르지 않습니다. (예: 14:00)"
+                continue
+            pending[i] = start_time
+
+        created: dict[int, tuple[int, str]] = {}
+        intervals: dict[int, tuple[time, time]] = {}
+        if pending:
+            if db.in_transaction():
+                await db.commit()
+            batch_details, intervals, created = await self._book_batch(
+                db, items, [user_id] * len(items), pending, data.atomic
+            )
+            for i, detail in batch_details.items():
+                details[i] = detail
+
+        if data.atomic and any(details):
+            details = [d or "다른 항목이 실패해 예약하지 않았습니다." for d in details]
+
+        reservations = self._created_responses(items, intervals, created)
+        results = [
+            ReservationBatchItemResult(
+                index=i,
+                room_id=item.room_id,
+                reservation_date=item.reservation_date,
+                start_time=item.start_time,
+                success=i in reservations,
+                reservation=reservations.get(i),
+                detail=None if i in reservations else details[i],
+            )
+            for i, item in enumerate(items)
+        ]
+        self._apply_created(items, intervals, created)
+
+        return ReservationBatchResponse(
+            atomic=data.atomic,
+            created=len(created),
+            failed=len(items) - len(created),
+            results=results,
+        )
+
+    async def create_reservations_in_order(
+        self,
+        db: AsyncSession,
+        items: list[ReservationCreate],
+        users: list[int],
+        start_times: list[time],
+    ) -> list[ReservationResponse | HTTPException]:
+        """여러 사용자의 예약 요청을 접수 순서대로 한 트랜잭션에서 검증하고 다중 행 INSERT 한 번으로 저장.
+
+        booking_queue 가 같은 룸에 쌓인 요청을 모아 부른다. 앞 요청이 잡은 구간은 뒤 요청 검증에 반영되며,
+        항목별로 예약 또는 create_reservation 과 같은 상태 코드의 HTTPException 을 돌려준다.
+        """
         try:
-            async with db.begin():
-                await reservation_repository.save(db, new_reservation)
-            await db.refresh(new_reservation)
-        except Exception:
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="예약 저장 중 오류가 발생했습니다.")
+            details, intervals, created = await self._book_batch(
+                db, items, users, dict(enumerate(start_times)), atomic=False
+            )
+        except HTTPException as e:
+            return [e] * len(items)
+        reservations = self._created_responses(items, intervals, created)
+        self._apply_created(items, intervals, created)
+        for i in created:
+            recent_writers.set(users[i], True)
+        return [
+            reservations[i] if i in reservations
+            else HTTPException(BATCH_DETAIL_STATUS.get(details[i], status.HTTP_400_BAD_REQUEST), details[i])
+            for i in range(len(items))
+        ]
+
+    async def _book_batch(
+        self,
+        db: AsyncSession,
+        items: list[ReservationCreate],
+        users: list[int],
+        pending: dict[int, time],
+        atomic: bool,
+    ) -> tuple[dict[int, str | None], dict[int, tuple[time, time]], dict[int, tuple[int, str]]]:
+        """pending 항목을 SERIALIZABLE 트랜잭션에서 검증 + 저장 (직렬화 충돌 시 재시도).
+
+        반환: (index -> 실패 사유 또는 None, index -> 예약 구간, index -> (예약 id, 룸 이름))
+        """
+        for attempt in range(MAX_SERIALIZATION_RETRIES):
+            created = {}
+            try:
+                async with db.begin():
+                    await db.connection(execution_options={"isolation_level": "SERIALIZABLE"})
+                    rooms, details, intervals = await self._check_batch(db, items, users, pending)
+                    accepted = [i for i, detail in details.items() if detail is None]
+                    # atomic 이면 모든 항목이 통과했을 때만 저장
+                    if accepted and not (atomic and len(accepted) < len(items)):
+                        created = await self._insert_batch(db, items, users, intervals, accepted, rooms)
+                        await availability_events.notify(db, self._slot_changes(items, intervals, created))
+                return details, intervals, created
+            except DBAPIError as e:
+                # 유니크/배타 제약 위반도 재시도하면 상대 예약이 보여 항목별 실패로 처리된다
+                if not isinstance(e, IntegrityError) and getattr(e.orig, "sqlstate", None) != SERIALIZATION_FAILURE:
+                    raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="예약 저장 중 오류가 발생했습니다.")
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="예약 요청이 몰려 처리하지 못했습니다. 다시 시도해주세요.")
+
+    def _created_responses(
+        self,
+        items: list[ReservationCreate],
+        intervals: dict[int, tuple[time, time]],
+        created: dict[int, tuple[int, str]],
+    ) -> dict[int, ReservationResponse]:
+        responses = {}
+        for i, (reservation_id, room_name) in created.items():
+            start_time, end_time = intervals[i]
+            responses[i] = ReservationResponse(
+                id=reservation_id,
+                room_name=room_name,
+                reservation_date=items[i].reservation_date,
+                start_time=start_time.strftime("%H:%M"),
+                end_time=end_time.strftime("%H:%M"),
+                status="예약확정",
+            )
+        return responses
+
+    def _slot_changes(
+        self,
+        items: list[ReservationCreate],
+        intervals: dict[int, tuple[time, time]],
+        created: dict[int, tuple[int, str]],
+    ) -> list[SlotChange]:
+        return [SlotChange(items[i].room_id, items[i].reservation_date, *intervals[i], False) for i in sorted(created)]
+
+    def _apply_created(
+        self,
+        items: list[ReservationCreate],
+        intervals: dict[int, tuple[time, time]],
+        created: dict[int, tuple[int, str]],
+    ):
+        """커밋된 예약을 예약 가능 시간 인덱스 / 룸 버전 / 구독자에게 반영"""
+        for i in created:
+            availability_index.mark_reserved(items[i].room_id, items[i].reservation_date, *intervals[i])
+        for room_id in {items[i].room_id for i in created}:
+            room_versions.bump(room_id)
+        availability_events.publish(self._slot_changes(items, intervals, created))
+
+    async def _check_batch(
+        self,
+        db: AsyncSession,
+        items: list[ReservationCreate],
+        users: list[int],
+        pending: dict[int, time],
+    ) -> tuple[dict, dict[int, str | None], dict[int, tuple[time, time]]]:
+        """pending 항목을 현재 트랜잭션에서 index 순서대로 검증 (users[i] 는 항목 i 의 예약자).
+
+        반환: (room_id -> 룸 행, index -> 실패 사유 또는 None, index -> 예약 구간)
+        """
+        room_ids = sorted({items[i].room_id for i in pending})
+        dates = sorted({items[i].reservation_date for i in pending})
+        user_ids = sorted({users[i] for i in pending})
+        rooms = {r.room_id: r for r in await study_room_repository.find_hours_by_ids(db, room_ids)}
+
+        daily_minutes: Counter[tuple[int, date]] = Counter()
+        user_taken: defaultdict[tuple[int, date], IntervalSet] = defaultdict(IntervalSet)
+        for user_id, reservation_date, start_time, end_time in await reservation_repository.find_user_day_slots(db, user_ids, dates):
+            start, end = to_minutes(start_time), to_minutes(end_time)
+            # 취소 건은 조회에서 빠진다. 이용완료 건도 하루 한도에 센다
+            daily_minutes[(user_id, reservation_date)] += end - start
+            user_taken[(user_id, reservation_date)].add(start, end)
+        room_taken: defaultdict[tuple[int, date], IntervalSet] = defaultdict(IntervalSet)
+        for room_id, reservation_date, start_time, end_time in await reservation_repository.find_room_day_slots(db, room_ids, dates):
+            room_taken[(room_id, reservation_date)].add(to_minutes(start_time), to_minutes(end_time))
+
+        # 검사 순서는 create_reservation 과 같다: 룸 -> 슬롯 단위 -> 하루 한도 -> 운영 시간 -> 유저 중복 -> 룸 중복
+        details: dict[int, str | None] = {}
+        intervals: dict[int, tuple[time, time]] = {}
+        for i, start_time in sorted(pending.items()):
+            item = items[i]
+            user_day = (users[i], item.reservation_date)
+            room = rooms.get(item.room_id)
+            if room is None:
+                details[i] = ROOM_NOT_FOUND_DETAIL
+                continue
+            try:
+                start_time, end_time = self.booking_interval(room, item.reservation_date, start_time, item.duration_minutes)
+            except HTTPException as e:
+                details[i] = e.detail
+                continue
+            start, end = to_minutes(start_time), to_minutes(end_time)
+            if daily_minutes[user_day] + end - start > DAILY_RESERVATION_LIMIT_MINUTES:
+                details[i] = DAILY_LIMIT_DETAIL
+            elif start_time < room.open_time or end_time > room.close_time:
+                details[i] = f"운영 시간({room.open_time.strftime('%H:%M')} ~ {room.close_time.strftime('%H:%M')}) 내에서만 예약 가능합니다."
+            elif user_taken[user_day].overlaps(start, end):
+                details[i] = USER_CONFLICT_DETAIL
+            elif room_taken[(item.room_id, item.reservation_date)].overlaps(start, end):
+                details[i] = ROOM_CONFLICT_DETAIL
+            else:
+                details[i] = None
+                intervals[i] = (start_time, end_time)
+                # 같은 배치의 뒤 항목 검증에 반영
+                daily_minutes[user_day] += end - start
+                user_taken[user_day].add(start, end)
+                room_taken[(item.room_id, item.reservation_date)].add(start, end)
+        return rooms, details, intervals
+
+    async def _insert_batch(
+        self,
+        db: AsyncSession,
+        items: list[ReservationCreate],
+        users: list[int],
+        intervals: dict[int, tuple[time, time]],
+        accepted: list[int],
+        rooms: dict,
+    ) -> dict[int, tuple[int, str]]:
+        """검증을 통과한 항목을 한 문장으로 INSERT. 반환: index -> (예약 id, 룸 이름)"""
+        inserted = await reservation_repository.insert_many(db, [
+            {
+                "user_id": users[i],
+                "room_id": items[i].room_id,
+                "reservation_date": items[i].reservation_date,
+                "start_time": intervals[i][0],
+                "end_time": intervals[i][1],
+                "status": "예약확정",
+            }
+            for i in accepted
+        ])
+        ids = {(row.room_id, row.reservation_date, row.start_time): row.id for row in inserted}
+        return {
+            i: (ids[(items[i].room_id, items[i].reservation_date, intervals[i][0])], rooms[items[i].room_id].name)
+            for i in accepted
+        }
 
+    def _to_response(self, r, now: datetime) -> ReservationResponse:
+        """r: reservation_repository 의 컬럼 조회 Row (id, reservation_date, start_time, end_time, status, room_name)"""
         return ReservationResponse(
-            id=new_reservation.id,
-            room_name=room.name,
-            reservation_date=new_reservation.reservation_date,
-            start_time=new_reservation.start_time.strftime("%H:%M"),
-            end_time=new_reservation.end_time.strftime("%H:%M"),
-            status=new_reservation.status,
+            id=r.id,
+            room_name=r.room_name,
+            reservation_date=r.reservation_date,
+            start_time=r.start_time.strftime("%H:%M"),
+            end_time=r.end_time.strftime("%H:%M"),
+            status=effective_status(r.status, r.reservation_date, r.end_time, now),
         )
 
-    async def read_my_reservations(self, db: AsyncSession, current_user: User) -> MyReservationsResponse:
-        reservations = await reservation_repository.find_by_user_id(db, current_user.id)
+    async def read_my_reservations(
+        self, db: AsyncSession, current_user: User, limit: int, cursor: str | None = None
+    ) -> MyReservationsResponse:
+        after = decode_cursor(cursor, date.fromisoformat, time.fromisoformat, int) if cursor else None
+        # 한 건 더 읽어 다음 페이지 존재 여부를 판단
+        reservations = await reservation_repository.find_rows_by_user_id(db, current_user.id, limit=limit + 1, after=after)
+        if RESERVATION_PARTITIONING and len(reservations) <= limit:
+            # 현재 예약을 다 읽었으면 보관된 예약을 이어서 읽는다 (마지막 페이지에서만 조회)
+            if reservations:
+                last = reservations[-1]
+                after = (last.reservation_date, last.start_time, last.id)
+            reservations += await reservation_repository.find_history_rows_by_user_id(
+                db, current_user.id, limit=limit + 1 - len(reservations), after=after
+            )
+        next_cursor = None
+        if len(reservations) > limit:
+            reservations = reservations[:limit]
+            last = reservations[-1]
+            next_cursor = encode_cursor(last.reservation_date, last.start_time, last.id)
 
+        # 상태 변경은 ReservationSweeper 가 담당하고, 조회는 읽기 전용으로 현재 시각 기준 상태를 계산한다
         now = datetime.now()
-        today = now.date()
-        current_time = now.time()
-
-        # 조회 시점에 상태 업데이트
-        async with db.begin():
-            for r in reservations:
-                if r.status == "예약확정":
-                    ended = (
-                        r.reservation_date < today or
-                        (r.reservation_date == today and r.end_time <= current_time)
-                    )
-                    if ended:
-                        r.status = "이용완료"
-
-        items = [
-            ReservationResponse(
-                id=r.id,
-                room_name=r.room.name,
-                reservation_date=r.reservation_date,
-                start_time=r.start_time.strftime("%H:%M"),
-                end_time=r.end_time.strftime("%H:%M"),
-                status=r.status,
-            )
-            for r in reservations
-        ]
-        return MyReservationsResponse(reservations=items)
+        items = [self._to_response(r, now) for r in reservations]
+        return MyReservationsResponse(reservations=items, next_cursor=next_cursor)
+
+    async def stream_my_reservations(self, db: AsyncSession, current_user: User):
+        """전체 예약을 NDJSON 한 줄씩 내보낸다 (서버 측 커서로 읽어 메모리 사용량 일정)"""
+        now = datetime.now()
+        result = await reservation_repository.stream_rows_by_user_id(db, current_user.id)
+        async for r in result:
+            yield self._to_response(r, now).model_dump_json() + "\n"
+        if RESERVATION_PARTITIONING:
+            result = await reservation_repository.stream_history_rows_by_user_id(db, current_user.id)
+            async for r in result:
+                yield self._to_response(r, now).model_dump_json() + "\n"
 
     async def cancel_reservation(self, db: AsyncSession, reservation_id: int, current_user: User):
         reservation = await reservation_repository.find_by_id(db, reservation_id)
@@ -116,11 +462,105 @@ class ReservationService:
         if datetime.now() >= reservation_datetime - timedelta(hours=1):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="예약 취소는 이용 시간 1시간 전까지만 가능합니다.")
 
-        try:
-            async with db.begin():
-                reservation.status = "취소"
-        except Exception:
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="취소 처리 중 오류가 발생했습니다.")
+        room_id, reservation_date = reservation.room_id, reservation.reservation_date
+        start_time, end_time = reservation.start_time, reservation.end_time
+        # 조회로 시작된 읽기 트랜잭션을 닫고 쓰기 트랜잭션을 새로 연다
+        await db.commit()
+        # 취소와 대기열 승격을 한 SERIALIZABLE 트랜잭션에서 처리한다 (승격 대상의 하루 한도/중복 검증이 동시 예약과 겹치지 않게)
+        for attempt in range(MAX_SERIALIZATION_RETRIES):
+            try:
+                async with db.begin():
+                    await db.connection(execution_options={"isolation_level": "SERIALIZABLE"})
+                    if not await reservation_repository.cancel_confirmed(db, reservation_id):
+                        # 조회 이후 sweeper 가 이용완료로 바꿨거나 동시에 취소됨
+                        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="취소 가능한 예약이 아닙니다.")
+                    promoted = await self._promote_waitlist(db, room_id, reservation_date, start_time, end_time)
+                    changes = self._cancel_changes(room_id, reservation_date, start_time, end_time, promoted)
+                    await availability_events.notify(db, changes)
+                break
+            except DBAPIError as e:
+                if getattr(e.orig, "sqlstate", None) != SERIALIZATION_FAILURE:
+                    raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="취소 처리 중 오류가 발생했습니다.")
+        else:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="요청이 몰려 처리하지 못했습니다. 다시 시도해주세요.")
+
+        room_versions.bump(room_id)
+        availability_index.mark_released(room_id, reservation_date, start_time, end_time)
+        for entry in promoted:
+            availability_index.mark_reserved(room_id, reservation_date, entry.start_time, entry.end_time)
+            # 승격된 사용자도 새 예약이 바로 보이도록 잠시 primary 에서 읽게 한다
+            recent_writers.set(entry.user_id, True)
+        availability_events.publish(changes)
+
+    def _cancel_changes(
+        self, room_id: int, reservation_date: date, start_time: time, end_time: time, promoted: list[WaitlistEntry]
+    ) -> list[SlotChange]:
+        # 대기자가 같은 구간으로 전환됐으면 구독자가 보기에는 바뀐 것이 없다.
+        # 그 외에는 비운 구간을 먼저 보내고 승격된 구간을 다시 예약됨으로 보낸다 (구독자는 순서대로 적용)
+        if [(e.start_time, e.end_time) for e in promoted] == [(start_time, end_time)]:
+            return []
+        return [SlotChange(room_id, reservation_date, start_time, end_time, True)] + [
+            SlotChange(room_id, reservation_date, e.start_time, e.end_time, False) for e in promoted
+        ]
+
+    async def _promote_waitlist(
+        self, db: AsyncSession, room_id: int, reservation_date: date, start_time: time, end_time: time
+    ) -> list[WaitlistEntry]:
+        """방금 비운 구간과 겹치는 대기 건을 신청 순서대로 예약해 준다.
+
+        비운 구간이 여러 슬롯이면 여러 대기자가 함께 전환될 수 있다.
+        다른 예약과 아직 겹치는 대기 건은 그대로 두고, 하루 한도를 넘었거나
+        같은 시간에 다른 방 예약이 생긴 대기자는 만료 처리한다.
+        """
+        entries = await waitlist_repository.find_queue_for_update(db, room_id, reservation_date, start_time, end_time)
+        if not entries:
+            return []
+        # 대기자 수와 무관하게 룸 / 대기자들의 그날 예약을 한 번에 읽고 메모리에서 순서대로 판단한다
+        room_taken = IntervalSet()
+        user_taken: defaultdict[int, IntervalSet] = defaultdict(IntervalSet)
+        daily_minutes: Counter[int] = Counter()
+        slots = await reservation_repository.find_promotion_slots(
+            db, room_id, reservation_date, sorted({e.user_id for e in entries})
+        )
+        for user_id, slot_room_id, slot_start, slot_end in slots:
+            start, end = to_minutes(slot_start), to_minutes(slot_end)
+            if slot_room_id == room_id:
+                room_taken.add(start, end)
+            daily_minutes[user_id] += end - start
+            user_taken[user_id].add(start, end)
+
+        promoted = []
+        for entry in entries:
+            start, end = to_minutes(entry.start_time), to_minutes(entry.end_time)
+            if room_taken.overlaps(start, end):
+                continue
+            if daily_minutes[entry.user_id] + end - start > DAILY_RESERVATION_LIMIT_MINUTES or user_taken[entry.user_id].overlaps(start, end):
+                entry.status = "만료"
+                continue
+            # 다음 대기 건의 검사에 반영
+            room_taken.add(start, end)
+            user_taken[entry.user_id].add(start, end)
+            daily_minutes[entry.user_id] += end - start
+            promoted.append(entry)
+        if not promoted:
+            return []
+
+        inserted = await reservation_repository.insert_many(db, [
+            {
+                "user_id": entry.user_id,
+                "room_id": room_id,
+                "reservation_date": reservation_date,
+                "start_time": entry.start_time,
+                "end_time": entry.end_time,
+                "status": "예약확정",
+            }
+            for entry in promoted
+        ])
+        ids = {row.start_time: row.id for row in inserted}
+        for entry in promoted:
+            entry.status = "예약완료"
+            entry.reservation_id = ids[entry.start_time]
+        return promoted
 
 
-reservation_service = ReservationService()
\ No newline at end of file
+reservation_service = ReservationService()
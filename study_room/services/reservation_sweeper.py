@@ -0,0 +1,62 @@
+# study_room/services/reservation_sweeper.py
+
+import asyncio
+import logging
+import os
+from datetime import datetime
+
+from dotenv import load_dotenv
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from study_room.repositories.reservation_repository import reservation_repository
+from study_room.repositories.waitlist_repository import waitlist_repository
+
+load_dotenv(encoding="utf-8")
+SWEEP_INTERVAL_SECONDS = float(os.getenv("RESERVATION_SWEEP_INTERVAL_SECONDS", "60"))
+
+logger = logging.getLogger(__name__)
+
+
+class ReservationSweeper:
+    """종료된 예약확정 건을 주기적으로 UPDATE 한 번에 이용완료로 바꾸는 백그라운드 작업.
+    시작 시각이 지난 슬롯의 대기 신청도 함께 만료 처리한다."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._task: asyncio.Task | None = None
+        self.last_run_at: datetime | None = None
+        self.last_updated = 0
+
+    async def run_once(self, session_factory: async_sessionmaker[AsyncSession]) -> int:
+        now = datetime.now()
+        async with session_factory() as db:
+            async with db.begin():
+                updated = await reservation_repository.expire_finished(db, now)
+                await waitlist_repository.expire_started(db, now)
+        self.last_run_at = now
+        self.last_updated = updated
+        return updated
+
+    def start(self, session_factory: async_sessionmaker[AsyncSession]):
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop(session_factory))
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _loop(self, session_factory: async_sessionmaker[AsyncSession]):
+        while True:
+            try:
+                await self.run_once(session_factory)
+            except Exception:
+                logger.exception("예약 상태 일괄 갱신 실패")
+            await asyncio.sleep(self.interval)
+
+
+reservation_sweeper = ReservationSweeper(SWEEP_INTERVAL_SECONDS)
@@ -1,13 +1,21 @@
 # study_room/services/review_service.py
 
+from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 
 from study_room.repositories.review_repository import review_repository
 from study_room.repositories.reservation_repository import reservation_repository
 from study_room.repositories.study_room_repository import study_room_repository
+from study_room.services.study_room_service import study_room_service
+from study_room.services.room_catalog import room_catalog
+from study_room.services.room_versions import room_versions
+from study_room.services.availability_events import availability_events
 from study_room.models.review import Review
+from study_room.models.reservation import effective_status
 from study_room.models.user import User
+from study_room.pagination import encode_cursor, decode_cursor
 from study_room.schemas.review import ReviewCreate, ReviewResponse, ReviewListItem, RoomReviewsResponse
 
 
@@ -19,24 +27,34 @@ class ReviewService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="존재하지 않는 예약입니다.")
         if reservation.user_id != current_user.id:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="본인 예약에만 리뷰를 작성할 수 있습니다.")
-        if reservation.status != "이용완료":
+        status_now = effective_status(reservation.status, reservation.reservation_date, reservation.end_time, datetime.now())
+        if status_now != "이용완료":
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="이용 완료된 예약에만 리뷰를 작성할 수 있습니다.")
 
         if await review_repository.find_by_reservation_id(db, data.reservation_id):
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="이미 리뷰를 작성하셨습니다.")
 
-        async with db.begin():
-            new_review = Review(
-                reservation=reservation,
-                user=current_user,
-                room=reservation.room,
-                rating=data.rating,
-                content=data.content,
-            )
-            await review_repository.save(db, new_review)
-
-            avg_rating = await review_repository.get_average_rating(db, reservation.room_id)
-            await study_room_repository.update_rating(db, reservation.room, avg_rating)
+        # 검증용 읽기 트랜잭션을 닫고 쓰기 트랜잭션을 새로 연다
+        await db.commit()
+        new_review = Review(
+            reservation_id=reservation.id,
+            user_id=current_user.id,
+            room_id=reservation.room_id,
+            rating=data.rating,
+            content=data.content,
+        )
+        try:
+            async with db.begin():
+                await review_repository.save(db, new_review)
+                # 평균을 다시 집계하지 않고 룸의 rating_sum / review_count 만 갱신
+                new_rating = await study_room_repository.add_review_rating(db, reservation.room_id, data.rating)
+                # 다른 워커의 카탈로그 / 룸 버전도 커밋과 함께 갱신되도록 같은 트랜잭션에서 NOTIFY
+                await availability_events.notify_rating(db, reservation.room_id, new_rating)
+        except IntegrityError:
+            # reviews.reservation_id UNIQUE: 동시에 같은 예약에 리뷰 작성
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="이미 리뷰를 작성하셨습니다.")
+        room_catalog.update_rating(reservation.room_id, new_rating)
+        room_versions.bump(reservation.room_id)
 
         await db.refresh(new_review)
         return ReviewResponse(
@@ -47,26 +65,46 @@ class ReviewService:
             created_at=new_review.created_at,
         )
 
-    async def read_room_reviews(self, db: AsyncSession, room_id: int) -> RoomReviewsResponse:
-        room = await study_room_repository.find_by_id(db, room_id)
-        if not room:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="존재하지 않는 스터디룸입니다.")
-
-        reviews = await review_repository.find_by_room_id(db, room_id)
-        avg_rating = await review_repository.get_average_rating(db, room_id)
-
-        items = [
-            ReviewListItem(
-                id=r.id,
-                # 학번 마스킹: 앞 4자리만 표시
-                student_id=r.user.student_id[:4] + "****",
-                rating=r.rating,
-                content=r.content,
-                created_at=r.created_at,
-            )
-            for r in reviews
-        ]
-        return RoomReviewsResponse(room_id=room_id, average_rating=avg_rating, reviews=items)
-
-
-review_service = ReviewService()
\ No newline at end of file
+    def _to_list_item(self, r) -> ReviewListItem:
+        """r: review_repository 의 컬럼 조회 Row (id, student_id, rating, content, created_at)"""
+        return ReviewListItem(
+            id=r.id,
+            # 학번 마스킹: 앞 4자리만 표시
+            student_id=r.student_id[:4] + "****",
+            rating=r.rating,
+            content=r.content,
+            created_at=r.created_at,
+        )
+
+    async def read_room_reviews(
+        self, db: AsyncSession, room_id: int, limit: int, cursor: str | None = None
+    ) -> RoomReviewsResponse:
+        room = await study_room_service.read_room_by_id(db, room_id)
+
+        after = decode_cursor(cursor, datetime.fromisoformat, int) if cursor else None
+        reviews = await review_repository.find_rows_by_room_id(db, room_id, limit=limit + 1, after=after)
+        next_cursor = None
+        if len(reviews) > limit:
+            reviews = reviews[:limit]
+            next_cursor = encode_cursor(reviews[-1].created_at, reviews[-1].id)
+
+        items = [self._to_list_item(r) for r in reviews]
+        # 저장된 집계를 그대로 사용 (리뷰 작성 시 갱신됨)
+        return RoomReviewsResponse(room_id=room_id, average_rating=room.rating, reviews=items, next_cursor=next_cursor)
+
+    async def stream_room_reviews(self, db: AsyncSession, room_id: int):
+        """전체 리뷰를 NDJSON 한 줄씩 내보내는 제너레이터를 반환 (서버 측 커서로 읽어 메모리 사용량 일정).
+
+        스트리밍이 시작되면 상태 코드를 바꿀 수 없으므로 룸 존재 여부는 먼저 확인한다.
+        """
+        await study_room_service.read_room_by_id(db, room_id)
+
+        async def lines():
+            result = await review_repository.stream_rows_by_room_id(db, room_id)
+            async for r in result:
+                yield self._to_list_item(r).model_dump_json() + "\n"
+
+        return lines()
+
+
+review_service = ReviewService()
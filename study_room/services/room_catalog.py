@@ -0,0 +1,180 @@
+# study_room/services/room_catalog.py
+
+import asyncio
+import logging
+import os
+from time import monotonic
+from bisect import bisect_left
+from datetime import time
+
+from dotenv import load_dotenv
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from study_room.repositories.study_room_repository import study_room_repository
+
+load_dotenv(encoding="utf-8")
+CATALOG_CHECK_INTERVAL_SECONDS = float(os.getenv("ROOM_CATALOG_CHECK_INTERVAL_SECONDS", "30"))
+# 요청 경로(카탈로그에 없는 룸 조회)에서 해시를 다시 확인하는 최소 간격
+CATALOG_MIN_REFRESH_SECONDS = float(os.getenv("ROOM_CATALOG_MIN_REFRESH_SECONDS", "5"))
+
+logger = logging.getLogger(__name__)
+
+
+class RoomRecord:
+    """카탈로그에 올라가는 스터디룸 한 건 (StudyRoom 과 같은 속성 이름, facilities 는 이름 튜플)"""
+
+    __slots__ = (
+        "room_id", "name", "floor", "location", "max_capacity",
+        "rating", "open_time", "close_time", "slot_minutes", "facilities",
+    )
+
+    def __init__(
+        self,
+        room_id: int,
+        name: str,
+        floor: int,
+        location: str,
+        max_capacity: int,
+        rating: float,
+        open_time: time,
+        close_time: time,
+        slot_minutes: int,
+        facilities: tuple[str, ...],
+    ):
+        self.room_id = room_id
+        self.name = name
+        self.floor = floor
+        self.location = location
+        self.max_capacity = max_capacity
+        self.rating = rating
+        self.open_time = open_time
+        self.close_time = close_time
+        self.slot_minutes = slot_minutes
+        self.facilities = facilities
+
+    @classmethod
+    def from_model(cls, room) -> "RoomRecord":
+        return cls(
+            room.room_id, room.name, room.floor, room.location, room.max_capacity,
+            room.rating, room.open_time, room.close_time, room.slot_minutes,
+            tuple(f.name for f in room.facilities),
+        )
+
+    def with_rating(self, rating: float) -> "RoomRecord":
+        return RoomRecord(
+            self.room_id, self.name, self.floor, self.location, self.max_capacity,
+            rating, self.open_time, self.close_time, self.slot_minutes, self.facilities,
+        )
+
+
+class CatalogSnapshot:
+    """한 번 만들어지면 바뀌지 않는 카탈로그. 변경은 새 스냅샷을 만들어 교체한다."""
+
+    __slots__ = ("version", "fingerprint", "rooms", "by_id", "by_floor", "by_capacity", "capacities")
+
+    def __init__(self, version: int, fingerprint: str | None, records: list[RoomRecord]):
+        self.version = version
+        self.fingerprint = fingerprint
+        self.rooms = tuple(sorted(records, key=lambda r: r.room_id))
+        self.by_id = {r.room_id: r for r in self.rooms}
+        by_floor: dict[int, list[RoomRecord]] = {}
+        for r in self.rooms:
+            by_floor.setdefault(r.floor, []).append(r)
+        self.by_floor = {floor: tuple(rooms) for floor, rooms in by_floor.items()}
+        self.by_capacity = tuple(sorted(self.rooms, key=lambda r: (r.max_capacity, r.room_id)))
+        self.capacities = [r.max_capacity for r in self.by_capacity]
+
+    def find(self, floor: int | None = None, capacity: int | None = None) -> list[RoomRecord]:
+        """StudyRoomRepository.find_all 과 같은 필터 (room_id 순)"""
+        if capacity is not None:
+            rooms = self.by_capacity[bisect_left(self.capacities, capacity):]
+            if floor is not None:
+                rooms = [r for r in rooms if r.floor == floor]
+            return sorted(rooms, key=lambda r: r.room_id)
+        if floor is not None:
+            return list(self.by_floor.get(floor, ()))
+        return list(self.rooms)
+
+
+class RoomCatalog:
+    """서버 시작 시 읽어 두는 스터디룸/시설 카탈로그.
+
+    DB의 카탈로그 해시를 주기적으로 비교해 바뀌었으면 다시 읽는다 (다른 워커의 리뷰 작성 등).
+    """
+
+    def __init__(self, check_interval: float, min_refresh_interval: float):
+        self.check_interval = check_interval
+        self.min_refresh_interval = min_refresh_interval
+        self.snapshot = CatalogSnapshot(0, None, [])
+        self.loaded = False
+        self._task: asyncio.Task | None = None
+        # 마지막으로 DB 해시를 확인한 시각 (monotonic)
+        self._checked_at = 0.0
+
+    @property
+    def version(self) -> int:
+        return self.snapshot.version
+
+    def get(self, room_id: int) -> RoomRecord | None:
+        return self.snapshot.by_id.get(room_id)
+
+    def find(self, floor: int | None = None, capacity: int | None = None) -> list[RoomRecord]:
+        return self.snapshot.find(floor, capacity)
+
+    async def refresh(self, db: AsyncSession):
+        self._checked_at = monotonic()
+        fingerprint = await study_room_repository.catalog_fingerprint(db)
+        rooms = await study_room_repository.find_all(db)
+        self.snapshot = CatalogSnapshot(
+            self.snapshot.version + 1, fingerprint, [RoomRecord.from_model(r) for r in rooms]
+        )
+        self.loaded = True
+
+    async def refresh_if_changed(self, db: AsyncSession) -> bool:
+        self._checked_at = monotonic()
+        if await study_room_repository.catalog_fingerprint(db) == self.snapshot.fingerprint:
+            return False
+        await self.refresh(db)
+        return True
+
+    async def refresh_if_stale(self, db: AsyncSession) -> bool:
+        """마지막 확인 후 min_refresh_interval 이 지났을 때만 refresh_if_changed (요청 경로용)"""
+        if monotonic() - self._checked_at < self.min_refresh_interval:
+            return False
+        return await self.refresh_if_changed(db)
+
+    def update_rating(self, room_id: int, rating: float):
+        """작성된 리뷰의 평점을 바로 반영 (다른 워커의 리뷰는 availability_events 의 NOTIFY 로 받는다).
+
+        해시는 그대로 두어 다음 검사 때 한 번 더 동기화된다.
+        """
+        record = self.get(room_id)
+        if record is None:
+            return
+        records = [r if r.room_id != room_id else record.with_rating(rating) for r in self.snapshot.rooms]
+        self.snapshot = CatalogSnapshot(self.snapshot.version + 1, self.snapshot.fingerprint, records)
+
+    def start(self, session_factory: async_sessionmaker[AsyncSession]):
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop(session_factory))
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _loop(self, session_factory: async_sessionmaker[AsyncSession]):
+        while True:
+            await asyncio.sleep(self.check_interval)
+            try:
+                async with session_factory() as db:
+                    await self.refresh_if_changed(db)
+            except Exception:
+                logger.exception("스터디룸 카탈로그 갱신 확인 실패")
+
+
+room_catalog = RoomCatalog(CATALOG_CHECK_INTERVAL_SECONDS, CATALOG_MIN_REFRESH_SECONDS)
@@ -0,0 +1,24 @@
+# study_room/services/room_versions.py
+
+
+class RoomVersions:
+    """룸별 단조 증가 버전. 예약 생성/취소, 리뷰 작성 시 올라가며 ETag 계산에 쓴다.
+
+    프로세스 메모리에만 있으므로 ETag 에는 프로세스 식별자가 함께 들어간다 (study_room/conditional.py).
+    다른 워커의 예약/취소/리뷰는 availability_events(postgres 백엔드)의 NOTIFY 를 받아 이 워커의 버전도 올리고,
+    memory 백엔드에서는 주기적인 인덱스 재동기화 / 카탈로그 변경 감지로 늦게나마 올라간다.
+    """
+
+    def __init__(self):
+        self._versions: dict[int, int] = {}
+
+    def get(self, room_id: int) -> int:
+        return self._versions.get(room_id, 0)
+
+    def bump(self, room_id: int) -> int:
+        version = self._versions.get(room_id, 0) + 1
+        self._versions[room_id] = version
+        return version
+
+
+room_versions = RoomVersions()
@@ -1,21 +1,46 @@
 # study_room/services/study_room_service.py
 
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
+from async_database import primary_session
+from study_room.intervals import IntervalSet, to_minutes
 from study_room.repositories.study_room_repository import study_room_repository
+from study_room.services.availability_index import availability_index, RoomSlots, BOOKING_WINDOW_DAYS
+from study_room.services.availability_events import availability_events, RESYNC, STREAM_HEARTBEAT_SECONDS
+from study_room.services.room_catalog import room_catalog, RoomRecord
+from study_room.services.room_versions import room_versions
 from study_room.schemas.study_room import (
     StudyRoomListResponse,
     StudyRoomDetailResponse,
     AvailableTimesResponse,
     AvailableTimeSlot,
+    AvailabilitySnapshot,
+    SlotAvailabilityEvent,
+    AvailabilityGridResponse,
+    RoomAvailabilityGrid,
 )
 
 
 class StudyRoomService:
+    def catalog_version(self) -> int:
+        """룸 목록/상세 응답의 버전 (카탈로그가 다시 읽히거나 평점이 바뀌면 올라간다)"""
+        return room_catalog.version
+
+    def room_version(self, room_id: int) -> tuple[int, int]:
+        """예약 가능 시간/리뷰 응답의 버전 (예약 생성/취소, 리뷰 작성 시 올라간다)"""
+        return room_catalog.version, room_versions.get(room_id)
+
+    def available_times_version(self, room_id: int) -> tuple:
+        # 예약 가능 기간(오늘 ~ 7일 후)이 날짜에 따라 바뀌므로 오늘 날짜도 넣는다
+        return *self.room_version(room_id), date.today()
+
     async def read_rooms(self, db: AsyncSession, floor: int | None, capacity: int | None) -> list[StudyRoomListResponse]:
-        rooms = await study_room_repository.find_all(db, floor=floor, capacity=capacity)
+        if not room_catalog.loaded:
+            async with primary_session(db) as primary:
+                await room_catalog.refresh(primary)
+        rooms = room_catalog.find(floor=floor, capacity=capacity)
         return [
             StudyRoomListResponse(
                 room_id=room.room_id,
@@ -24,13 +49,27 @@ class StudyRoomService:
                 location=room.location,
                 max_capacity=room.max_capacity,
                 rating=room.rating,
-                facilities=[f.name for f in room.facilities],
+                facilities=list(room.facilities),
             )
             for room in rooms
         ]
 
-    async def read_room_by_id(self, db: AsyncSession, room_id: int):
-        room = await study_room_repository.find_by_id(db, room_id)
+    async def read_room_by_id(self, db: AsyncSession, room_id: int) -> RoomRecord:
+        room = room_catalog.get(room_id) if room_catalog.loaded else None
+        if room is None:
+            # (인메모리 캐시는 복제본의 지연된 데이터로 채우지 않는다)
+            async with primary_session(db) as primary:
+                if not room_catalog.loaded:
+                    await room_catalog.refresh(primary)
+                    room = room_catalog.get(room_id)
+                else:
+                    # 카탈로그를 읽은 뒤 추가된 룸일 수 있다. 해시 확인은 ROOM_CATALOG_MIN_REFRESH_SECONDS 에 한 번만 하고
+                    # 그 사이에는 PK 로 한 건만 확인한다 (없는 id 를 반복해 찔러도 해시 쿼리가 늘지 않는다)
+                    if await room_catalog.refresh_if_stale(primary):
+                        room = room_catalog.get(room_id)
+                    if room is None:
+                        model = await study_room_repository.find_by_id(primary, room_id)
+                        room = RoomRecord.from_model(model) if model is not None else None
         if not room:
             raise HTTPException(status.HTTP_404_NOT_FOUND, "존재하지 않는 스터디룸입니다.")
         return room
@@ -46,35 +85,30 @@ class StudyRoomService:
             rating=room.rating,
             open_time=room.open_time,
             close_time=room.close_time,
-            facilities=[f.name for f in room.facilities],
+            slot_minutes=room.slot_minutes,
+            facilities=list(room.facilities),
         )
 
     async def read_available_times(self, db: AsyncSession, room_id: int, target_date: date) -> AvailableTimesResponse:
-        room = await self.read_room_by_id(db, room_id)
+        # 인덱스에 있는 룸은 DB 조회 없이 응답한다
+        if not availability_index.has_room(room_id):
+            room = await self.read_room_by_id(db, room_id)
+            async with primary_session(db) as primary:
+                await availability_index.load_room(
+                    primary, room.room_id, room.open_time, room.close_time, room.slot_minutes
+                )
 
         today = date.today()
-        if target_date < today or target_date > today + timedelta(days=7):
+        if target_date < today or target_date > today + timedelta(days=BOOKING_WINDOW_DAYS):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="최대 7일 이내 날짜만 선택 가능합니다.",
             )
 
-        reserved_times = await study_room_repository.get_reserved_times(db, room_id, target_date)
-        reserved_set = set(reserved_times)
-
-        slots = []
-        current = datetime.combine(target_date, room.open_time)
-        end = datetime.combine(target_date, room.close_time)
-
-        while current < end:
-            slot_time = current.time()
-            slots.append(
-                AvailableTimeSlot(
-                    time=slot_time.strftime("%H:%M"),
-                    available=slot_time not in reserved_set,
-                )
-            )
-            current += timedelta(hours=1)
+        slots = [
+            AvailableTimeSlot(time=label, available=available)
+            for label, available in availability_index.slots(room_id, target_date)
+        ]
 
         return AvailableTimesResponse(
             room_id=room_id,
@@ -82,5 +116,114 @@ class StudyRoomService:
             available_times=slots,
         )
 
+    async def stream_availability(self, db: AsyncSession, room_id: int):
+        """예약 가능 시간 변경을 SSE 로 내보내는 제너레이터를 반환.
+
+        처음에 예약 가능 기간 전체 스냅샷을 보내고, 이후 예약 생성/취소가 커밋될 때마다 바뀐 슬롯만 보낸다.
+        구독자 큐가 넘치면(느린 클라이언트) 쌓인 변경 대신 스냅샷을 다시 보낸다.
+        스트리밍이 시작되면 상태 코드를 바꿀 수 없으므로 룸 존재 여부와 구독자 수는 먼저 확인한다.
+        """
+        if not availability_index.has_room(room_id):
+            room = await self.read_room_by_id(db, room_id)
+            async with primary_session(db) as primary:
+                await availability_index.load_room(
+                    primary, room.room_id, room.open_time, room.close_time, room.slot_minutes
+                )
+        availability_events.ensure_capacity()
+        # 스트림이 열려 있는 동안 커넥션을 잡고 있지 않도록 읽기 트랜잭션을 닫는다
+        if db.in_transaction():
+            await db.commit()
+
+        async def events():
+            with availability_events.subscribe(room_id) as subscription:
+                yield self._sse("snapshot", self._availability_snapshot(room_id))
+                while True:
+                    item = await subscription.next(STREAM_HEARTBEAT_SECONDS)
+                    if item is None:
+                        # 프록시가 유휴 연결을 끊지 않도록 주석 줄을 보낸다
+                        yield ": ping\n\n"
+                    elif item is RESYNC:
+                        yield self._sse("snapshot", self._availability_snapshot(room_id))
+                    else:
+                        yield self._sse("slot", SlotAvailabilityEvent(**item.to_dict()))
+
+        return events()
+
+    def _availability_snapshot(self, room_id: int) -> AvailabilitySnapshot:
+        today = date.today()
+        days = []
+        for offset in range(BOOKING_WINDOW_DAYS + 1):
+            target_date = today + timedelta(days=offset)
+            days.append(AvailableTimesResponse(
+                room_id=room_id,
+                date=str(target_date),
+                available_times=[
+                    AvailableTimeSlot(time=label, available=available)
+                    for label, available in availability_index.slots(room_id, target_date)
+                ],
+            ))
+        return AvailabilitySnapshot(room_id=room_id, days=days)
+
+    def _sse(self, event: str, data) -> str:
+        return f"event: {event}\ndata: {data.model_dump_json()}\n\n"
+
+    async def read_availability_grid(
+        self,
+        db: AsyncSession,
+        floor: int | None,
+        capacity: int | None,
+        start_date: date | None,
+        end_date: date | None,
+    ) -> AvailabilityGridResponse:
+        today = date.today()
+        start_date = start_date or today
+        end_date = end_date or today + timedelta(days=BOOKING_WINDOW_DAYS)
+        if start_date > end_date:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="end_date 는 start_date 이후여야 합니다.",
+            )
+        if start_date < today or end_date > today + timedelta(days=BOOKING_WINDOW_DAYS):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="최대 7일 이내 날짜만 선택 가능합니다.",
+            )
+
+        dates = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+        date_pos = {d: i for i, d in enumerate(dates)}
+
+        rows = await study_room_repository.find_reservation_grid(
+            db, start_date, end_date, floor=floor, capacity=capacity
+        )
+
+        # 결과는 room_id 순으로 정렬되어 있으므로 순서대로 묶는다
+        grid: dict[int, tuple[RoomSlots, RoomAvailabilityGrid]] = {}
+        for room_id, name, open_time, close_time, slot_minutes, reservation_date, start_times, end_times in rows:
+            if room_id not in grid:
+                room_slots = RoomSlots(open_time, close_time, slot_minutes)
+                grid[room_id] = (
+                    room_slots,
+                    RoomAvailabilityGrid(
+                        room_id=room_id,
+                        name=name,
+                        slots=list(room_slots.labels),
+                        reserved=[0] * len(dates),
+                    ),
+                )
+            if reservation_date is None:
+                continue
+            room_slots, item = grid[room_id]
+            intervals = IntervalSet()
+            for start_time, end_time in zip(start_times, end_times):
+                intervals.add(to_minutes(start_time), to_minutes(end_time))
+            item.reserved[date_pos[reservation_date]] = room_slots.mask_of(intervals)
+
+        return AvailabilityGridResponse(
+            start_date=start_date,
+            end_date=end_date,
+            dates=dates,
+            rooms=[item for _, item in grid.values()],
+        )
+
 
 study_room_service = StudyRoomService()
\ No newline at end of file
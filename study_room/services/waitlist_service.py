@@ -0,0 +1,130 @@
+# study_room/services/waitlist_service.py
+
+from datetime import date, datetime, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import DBAPIError, IntegrityError
+from fastapi import HTTPException, status
+
+from study_room.repositories.waitlist_repository import waitlist_repository
+from study_room.repositories.reservation_repository import reservation_repository
+from study_room.intervals import to_minutes
+from study_room.services.reservation_service import (
+    reservation_service, DAILY_RESERVATION_LIMIT_MINUTES, DAILY_LIMIT_DETAIL, MAX_SERIALIZATION_RETRIES, SERIALIZATION_FAILURE,
+)
+from study_room.services.study_room_service import study_room_service
+from study_room.models.waitlist import WaitlistEntry
+from study_room.models.user import User
+from study_room.schemas.waitlist import WaitlistCreate, WaitlistResponse, MyWaitlistResponse
+
+
+class WaitlistService:
+    """이미 예약된 시간에 대기 신청. 겹치는 예약이 취소되면 ReservationService.cancel_reservation 이
+    같은 트랜잭션에서 대기 건을 신청 순서대로 예약으로 전환한다.
+    신청과 취소는 모두 SERIALIZABLE 트랜잭션이라, 신청 중에 예약이 취소되어 대기 건이 남는 일이 없다."""
+
+    def _to_response(self, row) -> WaitlistResponse:
+        return WaitlistResponse(
+            id=row.id,
+            room_id=row.room_id,
+            room_name=row.room_name,
+            reservation_date=row.reservation_date,
+            start_time=row.start_time.strftime("%H:%M"),
+            end_time=row.end_time.strftime("%H:%M"),
+            status=row.status,
+            position=row.position,
+            reservation_id=row.reservation_id,
+            created_at=row.created_at,
+        )
+
+    async def join(self, db: AsyncSession, data: WaitlistCreate, current_user: User) -> WaitlistResponse:
+        today = date.today()
+        if data.reservation_date < today or data.reservation_date > today + timedelta(days=7):
+            raise HTTPException(status_code=400, detail="예약은 오늘부터 7일 이내의 날짜만 가능합니다.")
+        try:
+            start_time = datetime.strptime(data.start_time, "%H:%M").time()
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="시간 형식이 올바르지 않습니다. (예: 14:00)")
+        if datetime.combine(data.reservation_date, start_time) <= datetime.now():
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="이미 시작된 시간입니다.")
+
+        room = await study_room_service.read_room_by_id(db, data.room_id)
+        start_time, end_time = reservation_service.booking_interval(
+            room, data.reservation_date, start_time, data.duration_minutes
+        )
+        if start_time < room.open_time or end_time > room.close_time:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"운영 시간({room.open_time.strftime('%H:%M')} ~ {room.close_time.strftime('%H:%M')}) 내에서만 예약 가능합니다.",
+            )
+
+        user_id = current_user.id
+        # 인증/룸 조회로 시작된 읽기 트랜잭션을 닫는다
+        if db.in_transaction():
+            await db.commit()
+        # "이미 예약된 시간" 확인과 대기 INSERT 를 한 SERIALIZABLE 트랜잭션에서 처리한다.
+        # 그 사이 예약이 취소되면 취소 쪽 승격이 이 대기 건을 보지 못하므로, 둘 중 하나가 직렬화 충돌로 다시 시도한다
+        for attempt in range(MAX_SERIALIZATION_RETRIES):
+            entry = WaitlistEntry(
+                user_id=user_id,
+                room_id=data.room_id,
+                reservation_date=data.reservation_date,
+                start_time=start_time,
+                end_time=end_time,
+            )
+            try:
+                async with db.begin():
+                    await db.connection(execution_options={"isolation_level": "SERIALIZABLE"})
+                    await self._check_joinable(db, user_id, data.room_id, data.reservation_date, start_time, end_time)
+                    await waitlist_repository.save(db, entry)
+                break
+            except IntegrityError:
+                # uq_waitlist_user_slot_waiting: 같은 슬롯에 이미 대기 중
+                raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="이미 대기 중인 시간입니다.")
+            except DBAPIError as e:
+                if getattr(e.orig, "sqlstate", None) != SERIALIZATION_FAILURE:
+                    raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="대기 신청 중 오류가 발생했습니다.")
+        else:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="요청이 몰려 처리하지 못했습니다. 다시 시도해주세요.")
+
+        return self._to_response(await waitlist_repository.find_row_by_id(db, entry.id))
+
+    async def _check_joinable(self, db: AsyncSession, user_id: int, room_id: int, reservation_date: date, start_time, end_time):
+        booked = await reservation_repository.sum_booked_minutes(db, user_id, reservation_date)
+        if booked + to_minutes(end_time) - to_minutes(start_time) > DAILY_RESERVATION_LIMIT_MINUTES:
+            raise HTTPException(status_code=400, detail=DAILY_LIMIT_DETAIL)
+        if await reservation_repository.find_user_conflict(db, user_id, reservation_date, start_time, end_time):
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="해당 시간에 이미 다른 방 예약이 있습니다.")
+        if not await reservation_repository.find_conflict(db, room_id, reservation_date, start_time, end_time):
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="예약 가능한 시간입니다. 바로 예약해주세요.")
+
+    async def read_entry(self, db: AsyncSession, entry_id: int, current_user: User) -> WaitlistResponse:
+        """대기 상태와 순번을 쿼리 한 번으로 조회 (재시도 대신 이 API 를 폴링)"""
+        row = await waitlist_repository.find_row_by_id(db, entry_id)
+        if not row:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="존재하지 않는 대기 신청입니다.")
+        if row.user_id != current_user.id:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="본인 대기 신청만 조회할 수 있습니다.")
+        return self._to_response(row)
+
+    async def read_my_entries(self, db: AsyncSession, current_user: User, limit: int) -> MyWaitlistResponse:
+        rows = await waitlist_repository.find_rows_by_user_id(db, current_user.id, limit)
+        return MyWaitlistResponse(entries=[self._to_response(row) for row in rows])
+
+    async def leave(self, db: AsyncSession, entry_id: int, current_user: User):
+        entry = await waitlist_repository.find_by_id(db, entry_id)
+        if not entry:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="존재하지 않는 대기 신청입니다.")
+        if entry.user_id != current_user.id:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="본인 대기 신청만 취소할 수 있습니다.")
+        if entry.status != "대기":
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="대기 중인 신청만 취소할 수 있습니다.")
+
+        await db.commit()
+        async with db.begin():
+            # 그 사이 예약으로 전환됐을 수 있으므로 대기 중일 때만 바꾼다
+            cancelled = await waitlist_repository.cancel_waiting(db, entry_id)
+        if not cancelled:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="대기 중인 신청만 취소할 수 있습니다.")
+
+
+waitlist_service = WaitlistService()